@@ -0,0 +1,216 @@
+import os
+import csv
+import json
+import time
+import logging
+import argparse
+import traceback
+import multiprocessing
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+
+logger = logging.getLogger()
+
+# 작업 종류
+JOB_KINDS = ("pdc_presim", "psi_presim", "pdc_postsim")
+
+# 디렉터리 검색 시 대상 파일
+_ETL_SUFFIXES = {".xlsx", ".xlsm", ".xls", ".xlsb"}
+_REPORT_SUFFIXES = {".htm", ".html"}
+
+
+# 작업 목록 읽기
+def load_manifest(manifest_path, gnd="GND"):
+    """
+    JSON(작업 리스트 또는 {"jobs": [...]}) 또는 CSV 매니페스트를 읽어 작업 목록을 반환합니다.
+    각 작업은 kind, output과 kind에 따라 etl 또는 report를 가지며, 상대 경로는 매니페스트 위치 기준입니다.
+    """
+    manifest_path = Path(manifest_path)
+    if manifest_path.suffix.lower() == ".csv":
+        with open(manifest_path, "r", encoding="utf-8-sig", newline="") as f:
+            jobs = [{key: value for key, value in row.items() if value} for row in csv.DictReader(f)]
+    else:
+        with open(manifest_path, "r", encoding="utf-8") as f:
+            jobs = json.load(f)
+        if isinstance(jobs, dict):
+            jobs = jobs["jobs"]
+
+    base_dir = manifest_path.parent
+    for i, job in enumerate(jobs):
+        if job.get("kind") not in JOB_KINDS:
+            raise ValueError(f"매니페스트 {i + 1}번 작업의 kind가 올바르지 않습니다 : {job.get('kind')}")
+        required = ["report" if job["kind"] == "pdc_postsim" else "etl", "output"]
+        missing = [key for key in required if key not in job]
+        if missing:
+            raise ValueError(f"매니페스트 {i + 1}번 작업에 {', '.join(missing)} 항목이 없습니다.")
+        for key in ("etl", "report", "output"):
+            if key in job:
+                job[key] = str(base_dir / job[key])
+        job.setdefault("gnd", gnd)
+        job.setdefault("name", Path(job.get("etl") or job.get("report")).stem)
+    return jobs
+
+
+def scan_directory(root_path, output_path, gnd="GND"):
+    """
+    root_path 아래의 ETL 엑셀과 PowerDC 리포트(.htm/.html)를 찾아 작업 목록을 만듭니다.
+    파일 이름에 "psi"가 들어간 ETL은 PowerSI, 나머지는 PowerDC presim으로 처리하며,
+    결과는 output_path 아래에 원본과 같은 폴더 구조로 저장합니다.
+    """
+    root_path = Path(root_path)
+    output_path = Path(output_path)
+    jobs = []
+    for file_path in sorted(root_path.rglob("*")):
+        if not file_path.is_file() or file_path.name.startswith("~$"):
+            continue
+        output = output_path / file_path.parent.relative_to(root_path) / file_path.stem
+        suffix = file_path.suffix.lower()
+        if suffix in _ETL_SUFFIXES:
+            kind = "psi_presim" if "psi" in file_path.stem.lower() else "pdc_presim"
+            jobs.append({"kind": kind, "name": file_path.stem, "etl": str(file_path), "output": str(output), "gnd": gnd})
+        elif suffix in _REPORT_SUFFIXES:
+            jobs.append({"kind": "pdc_postsim", "name": file_path.stem, "report": str(file_path), "output": str(output)})
+    return jobs
+
+
+# 작업 1개 실행 (작업 프로세스에서 실행되며 예외는 결과로 반환)
+#   batch가 작업 단위로 병렬화하므로 작업 안의 엑셀 병렬 읽기 / 이미지 추출 pool은 worker 1개로 제한
+def _run_job(job):
+    start = time.perf_counter()
+    result = {**job, "status": "ok", "error": "", "pid": os.getpid()}
+    try:
+        if job["kind"] == "pdc_presim":
+            from presim import PdcPresim
+            PdcPresim(job["gnd"], job["etl"], job["output"], TCL_MODE=job.get("tcl_mode", "unrolled"), READ_WORKERS=1)
+        elif job["kind"] == "psi_presim":
+            from presim import PsiPresim
+            PsiPresim(job["gnd"], job["etl"], job["output"], TCL_MODE=job.get("tcl_mode", "unrolled"), READ_WORKERS=1)
+        else:
+            from postsim import pdc_postsim
+            pdc_postsim(job["report"], job["output"], IMAGE_WORKERS=1)
+    except Exception as e:
+        result["status"] = "failed"
+        result["error"] = f"{type(e).__name__}: {e}"
+        result["traceback"] = traceback.format_exc()
+    result["seconds"] = time.perf_counter() - start
+
+    # 작업 프로세스는 atexit 없이 종료되므로 계측 trace는 작업마다 저장 ({이름}.{pid}.json)
+    from instrumentation import INSTRUMENTATION
+    if INSTRUMENTATION.enabled:
+        INSTRUMENTATION.write_trace()
+    return result
+
+
+def _crashed_result(job, e):
+    return {**job, "status": "failed", "error": f"작업 프로세스 비정상 종료 : {e}", "seconds": 0.0}
+
+
+# 작업 프로세스 생성 방식
+#   호출하는 프로세스에 스레드가 있을 수 있으므로 (pipeline 스레드 풀, 재실행 스레드) fork 대신 spawn
+_MP_CONTEXT = multiprocessing.get_context("spawn")
+
+
+# 작업 1개를 전용 프로세스에서 실행 (비정상 종료가 다른 작업에 영향을 주지 않음)
+def _run_isolated(job):
+    with ProcessPoolExecutor(max_workers=1, mp_context=_MP_CONTEXT) as executor:
+        try:
+            result = executor.submit(_run_job, job).result()
+        except BrokenProcessPool as e:
+            result = _crashed_result(job, e)
+    result["retried"] = True
+    return result
+
+
+def run_batch(jobs, max_workers=None, summary_path=None):
+    """
+    작업을 프로세스 풀에서 병렬로 실행하고 작업별 결과(status, seconds, error)를 반환합니다.
+    작업 하나의 실패(또는 작업 프로세스 비정상 종료)는 다른 작업에 영향을 주지 않습니다.
+    작업 프로세스가 비정상 종료되면 풀의 남은 작업이 모두 BrokenProcessPool로 끝나므로,
+    이 작업들은 작업마다 새 프로세스에서 다시 실행하여 실제로 종료된 작업만 실패로 남깁니다.
+    """
+    max_workers = max_workers or os.cpu_count() or 1
+    logger.info(f"batch : 작업 {len(jobs)}개, worker {max_workers}개")
+
+    start = time.perf_counter()
+    results = []
+    broken = []
+    with ProcessPoolExecutor(max_workers=max_workers, mp_context=_MP_CONTEXT) as executor:
+        futures = {executor.submit(_run_job, job): job for job in jobs}
+        for future in as_completed(futures):
+            try:
+                result = future.result()
+            except BrokenProcessPool:
+                broken.append(futures[future])
+                continue
+            results.append(result)
+            _log_result(result, len(results), len(jobs))
+
+    if broken:
+        logger.warning(f"batch : 작업 프로세스 비정상 종료, 작업 {len(broken)}개를 작업마다 새 프로세스에서 다시 실행합니다.")
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for result in executor.map(_run_isolated, broken):
+                results.append(result)
+                _log_result(result, len(results), len(jobs))
+    wall_seconds = time.perf_counter() - start
+
+    _log_summary(results, wall_seconds)
+    if summary_path is not None:
+        with open(summary_path, "w", encoding="utf-8") as f:
+            json.dump({"wall_seconds": wall_seconds, "results": results}, f, ensure_ascii=False, indent=2)
+    return results
+
+
+def _log_result(result, done, total):
+    if result["status"] == "ok":
+        logger.info(f"batch : [{done}/{total}] {result['kind']} {result['name']} 완료 ({result['seconds']:.1f}s)")
+    else:
+        logger.error(f"batch : [{done}/{total}] {result['kind']} {result['name']} 실패 : {result['error']}")
+    return None
+
+
+def _log_summary(results, wall_seconds):
+    logger.info("=============================================")
+    for kind in JOB_KINDS:
+        kind_results = [result for result in results if result["kind"] == kind]
+        if not kind_results:
+            continue
+        failed = sum(result["status"] != "ok" for result in kind_results)
+        seconds = [result["seconds"] for result in kind_results]
+        logger.info(
+            f"{kind:<12} : {len(kind_results)}개, 실패 {failed}개, "
+            f"합계 {sum(seconds):.1f}s, 평균 {sum(seconds) / len(seconds):.1f}s, 최대 {max(seconds):.1f}s"
+        )
+    failed = [result for result in results if result["status"] != "ok"]
+    job_seconds = sum(result["seconds"] for result in results)
+    logger.info(f"전체 : {len(results)}개, 실패 {len(failed)}개, 경과 {wall_seconds:.1f}s (작업 합계 {job_seconds:.1f}s)")
+    for result in failed:
+        logger.info(f"  실패 : {result['kind']} {result['name']} - {result['error']}")
+    logger.info("=============================================")
+    return None
+
+
+if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s [%(levelname)s] %(message)s",
+        datefmt="%Y-%m-%d %H:%M:%S"
+    )
+
+    parser = argparse.ArgumentParser(description="여러 보드의 presim / postsim 작업을 병렬로 실행합니다.")
+    parser.add_argument("source", help="매니페스트(.json/.csv) 또는 ETL/리포트가 들어있는 폴더")
+    parser.add_argument("-o", "--output", help="폴더 검색 시 결과 저장 폴더")
+    parser.add_argument("-j", "--workers", type=int, default=None)
+    parser.add_argument("--gnd", default="GND")
+    parser.add_argument("--summary", help="결과 요약 JSON 저장 경로")
+    args = parser.parse_args()
+
+    if Path(args.source).is_dir():
+        if args.output is None:
+            parser.error("폴더를 검색할 때는 --output이 필요합니다.")
+        batch_jobs = scan_directory(args.source, args.output, gnd=args.gnd)
+    else:
+        batch_jobs = load_manifest(args.source, gnd=args.gnd)
+
+    batch_results = run_batch(batch_jobs, max_workers=args.workers, summary_path=args.summary)
+    raise SystemExit(1 if any(result["status"] != "ok" for result in batch_results) else 0)
@@ -0,0 +1,73 @@
+"""
+CLI / 모듈 import 시간 측정 및 예산 검사
+
+모듈마다 새 인터프리터에서 python -X importtime으로 누적 import 시간을 재고(repeat번 중 최소),
+예산(초)을 넘거나 불러오면 안 되는 무거운 모듈이 import되면 실패(exit 1)합니다.
+
+사용법:
+    python -m benchmarks.import_time
+    python -m benchmarks.import_time --repeat 10
+"""
+import argparse
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# {모듈: (예산 초, 불러오면 안 되는 모듈)}
+#   main은 인자 해석 전이므로 pandas 등을 전혀 불러오지 않아야 함
+#   presim / postsim은 pandas까지만 허용하고 엑셀 / HTML / 이미지 / 그래프 라이브러리는 해당 단계에서만 불러옴
+_HEAVY_MODULES = ("openpyxl", "bs4", "PIL", "matplotlib", "xlwings")
+BUDGETS = {
+    "main": (0.05, ("pandas", "numpy", "pyarrow", *_HEAVY_MODULES)),
+    "sigrity": (0.1, ("pandas", "numpy", "pyarrow", *_HEAVY_MODULES)),
+    "batch": (0.1, ("pandas", "numpy", "pyarrow", *_HEAVY_MODULES)),
+    "presim": (1.0, _HEAVY_MODULES),
+    "postsim": (1.0, _HEAVY_MODULES),
+}
+
+_IMPORTTIME_PATTERN = re.compile(r"^import time:\s+\d+ \|\s+(\d+) \| (\s*)(\S+)$")
+
+
+def measure(module):
+    """
+    새 인터프리터에서 module을 import하고 (누적 import 초, 불러온 최상위 모듈 집합)을 반환합니다.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT, capture_output=True, text=True, check=True
+    )
+    seconds = 0.0
+    loaded = set()
+    for line in result.stderr.splitlines():
+        match = _IMPORTTIME_PATTERN.match(line)
+        if not match:
+            continue
+        loaded.add(match.group(3).split(".")[0])
+        if match.group(3) == module and not match.group(2):
+            seconds = int(match.group(1)) / 1e6
+    return seconds, loaded
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    failed = False
+    print(f"{'module':<10} {'seconds':>8} {'budget':>8}  result")
+    for module, (budget, forbidden) in BUDGETS.items():
+        runs = [measure(module) for _ in range(args.repeat)]
+        seconds = min(seconds for seconds, _ in runs)
+        heavy = sorted(set(forbidden) & runs[0][1])
+        ok = seconds <= budget and not heavy
+        failed |= not ok
+        note = "ok" if ok else "over budget" if not heavy else f"imports {', '.join(heavy)}"
+        print(f"{module:<10} {seconds:>8.3f} {budget:>8.3f}  {note}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,61 @@
+"""
+_read_excel 백엔드별 실행 시간 비교 (openpyxl vs xlwings COM)
+
+사용법:
+    python -m benchmarks.read_excel ETL.xlsx --repeat 3
+    python -m benchmarks.read_excel --rows 10000      # 임시 ETL 파일 생성 후 측정
+"""
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+import presim
+from benchmarks.synthetic import build_etl_workbook
+
+
+def _time(func, repeat):
+    times = []
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        times.append(time.perf_counter() - start)
+    return min(times), result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("etl_file_path", nargs="?")
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        etl_file_path = args.etl_file_path
+        if etl_file_path is None:
+            etl_file_path = Path(tmp_dir) / "etl.xlsx"
+            # sink 시트 args.rows행 (net당 64행)
+            build_etl_workbook(etl_file_path, nets=max(args.rows // 64, 1), pins_per_net=64 * 8, pins_per_row=8)
+
+        cases = {
+            "openpyxl": lambda: presim._read_excel(etl_file_path, backend="openpyxl", max_workers=1),
+            "openpyxl (parallel)": lambda: presim._read_excel(etl_file_path, backend="openpyxl", max_workers=4),
+        }
+        if presim.xw is not None:
+            cases["xlwings"] = lambda: presim._read_excel(etl_file_path, backend="xlwings")
+
+        results = dict()
+        for name, func in cases.items():
+            elapsed, results[name] = _time(func, args.repeat)
+            print(f"{name:<20} {elapsed:8.3f} s")
+
+        if "xlwings" in results:
+            reference = results["xlwings"]
+            for name, dfs in results.items():
+                same = dfs.keys() == reference.keys() and all(dfs[k].equals(reference[k]) for k in dfs)
+                print(f"{name:<20} {'동일' if same else '불일치'}")
+
+
+if __name__ == "__main__":
+    main()
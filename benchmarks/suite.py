@@ -0,0 +1,162 @@
+"""
+presim / postsim 전체 단계 벤치마크 (합성 ETL + 합성 PowerDC 리포트, Linux headless)
+
+단계별 실행 시간(최소/평균)과 tracemalloc 최대 메모리를 측정해 JSON으로 저장합니다.
+
+사용법:
+    python -m benchmarks.suite --output bench.json
+    python -m benchmarks.suite --nets 64 --pins-per-net 1024 --sinks 5000 --images 40 --output big.json
+    python -m benchmarks.suite --output new.json --compare bench.json     # 이전 결과 대비 비율 출력
+"""
+import argparse
+import json
+import platform
+import subprocess
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+
+import presim
+import postsim
+from etl_schema import count_items
+from benchmarks.synthetic import build_etl_workbook, build_pdc_report
+
+
+def _stage(obj, name):
+    """
+    LAZY 객체의 결과물 name을 매번 다시 계산하는 함수를 만듭니다. (의존 단계는 처음 한 번만 계산)
+    """
+    def run():
+        obj.invalidate(name)
+        obj.compute(name)
+    return run
+
+
+def _measure(func, repeat):
+    """
+    func를 repeat번 실행해 시간을 재고, 마지막에 tracemalloc으로 한 번 더 실행해 최대 메모리를 잽니다.
+    최대 메모리는 현재 프로세스 기준이며 작업 프로세스(병렬 읽기, 이미지 추출) 메모리는 포함되지 않습니다.
+    """
+    seconds = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        seconds.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    try:
+        func()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return {"seconds": min(seconds), "mean_seconds": sum(seconds) / len(seconds), "repeat": repeat, "peak_mb": peak / 1e6}
+
+
+def _git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_suite(work_dir, nets=16, pins_per_net=256, pins_per_row=8, sinks=500, images=40, image_size=512, repeat=3, tcl_mode="unrolled"):
+    work_dir = Path(work_dir)
+    etl_file_path = build_etl_workbook(work_dir / "etl.xlsx", nets=nets, pins_per_net=pins_per_net, pins_per_row=pins_per_row)
+    report_file_path = build_pdc_report(work_dir / "report.htm", sinks=sinks, images=images, image_size=image_size)
+    tcl_folder_path = work_dir / "tcl"
+    output_folder_path = work_dir / "postsim"
+
+    stages = dict()
+
+    # presim
+    stages["_read_excel"] = _measure(lambda: presim._read_excel(etl_file_path, backend="openpyxl"), repeat)
+
+    pdc = presim.PdcPresim("GND", etl_file_path, tcl_folder_path, TCL_MODE=tcl_mode, ETL_CACHE=None, LAZY=True)
+    stages["PdcPresim.initialize"] = _measure(_stage(pdc, "sheets"), repeat)
+    stages["PdcPresim.index_connectivity"] = _measure(_stage(pdc, "connectivity"), repeat)
+    stages["PdcPresim.generate_classify_tcl"] = _measure(_stage(pdc, "classify_tcl"), repeat)
+    stages["PdcPresim.generate_add_tcl"] = _measure(_stage(pdc, "add_tcl"), repeat)
+
+    psi = presim.PsiPresim("GND", etl_file_path, tcl_folder_path, TCL_MODE=tcl_mode, ETL_CACHE=None, LAZY=True)
+    psi.compute("sheets")
+    stages["PsiPresim.generate_add_tcl"] = _measure(_stage(psi, "add_tcl"), repeat)
+
+    # postsim
+    pdc_post = postsim.pdc_postsim(report_file_path, output_folder_path, RESULTS_STORE=None, CACHE=False, LAZY=True)
+    stages["pdc_postsim.initialize"] = _measure(_stage(pdc_post, "report"), repeat)
+    stages["pdc_postsim.extract_table"] = _measure(_stage(pdc_post, "result_table"), repeat)
+    stages["pdc_postsim.extract_excel"] = _measure(_stage(pdc_post, "result_excel"), repeat)
+    stages["pdc_postsim.extract_images"] = _measure(_stage(pdc_post, "images"), repeat)
+
+    # postsim 재실행 (리포트가 바뀌지 않았으면 manifest 확인만 하고 끝남)
+    cached_folder_path = output_folder_path / "cached"
+    postsim.pdc_postsim(report_file_path, cached_folder_path, RESULTS_STORE=None)
+    stages["pdc_postsim.cached_rerun"] = _measure(lambda: postsim.pdc_postsim(report_file_path, cached_folder_path, RESULTS_STORE=None), repeat)
+
+    sizes = {
+        "etl_bytes": etl_file_path.stat().st_size,
+        "report_bytes": report_file_path.stat().st_size,
+        "sink_pins": int(count_items(pdc.dfs["sink"]["pin"]).sum()),
+        "tcl_bytes": {path.name: path.stat().st_size for path in sorted(tcl_folder_path.glob("*.tcl"))},
+        "images": len(pdc_post.image_results),
+    }
+    return stages, sizes
+
+
+def _print_stages(stages, baseline=None):
+    print(f"{'stage':<36} {'seconds':>9} {'peak MB':>9}" + (f" {'vs base':>8}" if baseline else ""))
+    for name, stage in stages.items():
+        line = f"{name:<36} {stage['seconds']:9.3f} {stage['peak_mb']:9.1f}"
+        if baseline:
+            base = baseline.get(name)
+            line += f" {stage['seconds'] / base['seconds']:7.2f}x" if base else f" {'-':>8}"
+        print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--nets", type=int, default=16)
+    parser.add_argument("--pins-per-net", type=int, default=256)
+    parser.add_argument("--pins-per-row", type=int, default=8)
+    parser.add_argument("--sinks", type=int, default=500)
+    parser.add_argument("--images", type=int, default=40)
+    parser.add_argument("--image-size", type=int, default=512)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--mode", choices=presim._TCL_MODES, default="unrolled")
+    parser.add_argument("--output", help="결과 JSON 저장 경로")
+    parser.add_argument("--compare", help="비교할 이전 결과 JSON")
+    args = parser.parse_args()
+
+    params = {
+        "nets": args.nets, "pins_per_net": args.pins_per_net, "pins_per_row": args.pins_per_row, "sinks": args.sinks,
+        "images": args.images, "image_size": args.image_size, "repeat": args.repeat, "tcl_mode": args.mode,
+    }
+    with tempfile.TemporaryDirectory() as work_dir:
+        stages, sizes = run_suite(work_dir, **params)
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            baseline = json.load(f)["stages"]
+    _print_stages(stages, baseline)
+
+    if args.output:
+        result = {
+            "meta": {
+                "commit": _git_commit(),
+                "timestamp": datetime.now().isoformat(timespec="seconds"),
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "params": params,
+            },
+            "sizes": sizes,
+            "stages": stages,
+        }
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+"""
+벤치마크용 합성 데이터 생성 (ETL 엑셀, ETL DataFrame, PowerDC HTML 리포트, 결과 테이블)
+"""
+import base64
+from io import BytesIO
+
+import numpy as np
+import openpyxl
+import pandas as pd
+from PIL import Image
+
+from etl_schema import compact_sheets
+
+
+# ETL 엑셀 : vrm / sink / disc / nc 시트 (PdcPresim, PsiPresim 모두 읽을 수 있는 컬럼 구성)
+def build_etl_workbook(path, nets=16, pins_per_net=256, pins_per_row=8, discs=None, ncs=None):
+    """
+    net마다 VRM 1개와 sink 여러 개(한 행에 pins_per_row개 핀)를 가진 ETL 파일을 만듭니다.
+    refdes / net / v 등은 병합 셀처럼 첫 행에만 값을 넣어 ffill 경로도 측정합니다.
+    """
+    rows_per_net = max(pins_per_net // pins_per_row, 1)
+    wb = openpyxl.Workbook(write_only=True)
+
+    ws = wb.create_sheet("vrm")
+    ws.append(["refdes", "net", "subnet", "index", "pin", "pp", "np", "v"])
+    for n in range(nets):
+        pins = "\n".join(f"V{n}_{i}" for i in range(pins_per_row))
+        ws.append([f"PMIC{n}", f"VDD_{n}.0", f"VDD_{n}.0", 1, pins, pins, f"G{n}", 0.8 + n % 4 * 0.2])
+
+    ws = wb.create_sheet("sink")
+    ws.append(["refdes", "net", "subnet", "index", "pin", "pp", "np", "voltage", "current", "port"])
+    for n in range(nets):
+        for r in range(rows_per_net):
+            first = r == 0
+            pins = "\n".join(f"A{n}_{r}_{i}" for i in range(pins_per_row))
+            ws.append([
+                f"U{n}_{r // 4}" if r % 4 == 0 else None,
+                f"VDD_{n}.0" if first else None,
+                f"VDD_{n}.0" if first else None,
+                r % 4 + 1,
+                pins,
+                pins,
+                f"G{n}_{r}",
+                0.8 + n % 4 * 0.2 if first else None,
+                0.01 * (r % 10 + 1),
+                r % 4,
+            ])
+
+    ws = wb.create_sheet("disc")
+    ws.append(["refdes", "resistance"])
+    for i in range(discs if discs is not None else nets * 4):
+        ws.append([f"R{i}", 0.001])
+
+    ws = wb.create_sheet("nc")
+    ws.append(["refdes"])
+    for i in range(ncs if ncs is not None else nets * 8):
+        ws.append([f"C{i}"])
+
+    wb.save(path)
+    return path
+
+
+# ETL DataFrame (엑셀 없이 TCL 생성만 측정할 때, _read_excel과 같은 저장 형식)
+def build_pdc_dfs(pins, pins_per_row=8):
+    rows = max(pins // pins_per_row, 1)
+    pin_list = [",".join(f"P{r}_{i}" for i in range(pins_per_row)) for r in range(rows)]
+    vrm_pin_list = [pins.replace("P", "V") for pins in pin_list]
+    refdes = [f"U{r}" for r in range(rows)]
+    nets = [f"VDD_{r % 64}" for r in range(rows)]
+    return compact_sheets({
+        "vrm": pd.DataFrame({"refdes": refdes, "net": nets, "subnet": nets, "pin": vrm_pin_list, "v": "1.8"}),
+        "sink": pd.DataFrame({"refdes": refdes, "net": nets, "subnet": nets, "pin": pin_list, "current": "0.1"}),
+        "disc": pd.DataFrame({"refdes": [f"R{r}" for r in range(rows)], "resistance": "0.001"}),
+    })
+
+
+def build_psi_dfs(pins, pins_per_row=8):
+    rows = max(pins // pins_per_row, 1)
+    pin_list = [",".join(f"P{r}_{i}" for i in range(pins_per_row // 2 or 1)) for r in range(rows)]
+    vrm_pin_list = [pins.replace("P", "V") for pins in pin_list]
+    gnd_pin_list = [pins.replace("P", "G") for pins in pin_list]
+    refdes = [f"U{r}" for r in range(rows)]
+    nets = [f"VDD_{r % 64}" for r in range(rows)]
+    return compact_sheets({
+        "vrm": pd.DataFrame({"refdes": refdes, "net": nets, "pp": vrm_pin_list, "np": gnd_pin_list}),
+        "sink": pd.DataFrame({"refdes": refdes, "net": nets, "pp": pin_list, "np": gnd_pin_list, "port": [str(float(r % 4)) for r in range(rows)]}),
+        "nc": pd.DataFrame({"refdes": [f"C{r}" for r in range(rows)]}),
+    })
+
+
+# PowerDC 결과 테이블 (df_new 형태)
+def build_result_table(rows, pins_per_sink=8, fail_ratio=0.1):
+    rng = np.random.default_rng(0)
+    return pd.DataFrame({
+        "Sink": [f"U{i // pins_per_sink}" for i in range(rows)],
+        "Net": [f"VDD_{i % 16}" for i in range(rows)],
+        "Pin": [f"A{i % pins_per_sink}" for i in range(rows)],
+        "Voltage(V)": rng.uniform(0.7, 1.8, rows).round(6),
+        "IR Drop(mV)": rng.uniform(0, 50, rows).round(3),
+        "Pass/Fail": np.where(rng.random(rows) < fail_ratio, "Fail", "Pass"),
+        "Margin(%)": rng.uniform(-5, 5, rows).round(3),
+    })
+
+
+# PowerDC HTML 리포트
+_SETUP_COLUMNS = ["Refdes", "Name", "Pin Group", "Model", "Tolerance (%)", "Nominal Voltage (V)"]
+_RESULT_COLUMNS = [
+    "Refdes", "Name", "Min Voltage (V)", "Max Voltage (V)", "Avg Voltage (V)", "Current (A)", "Power (W)",
+    "Worst Pin", "Min Pin Voltage (V)", "Max Pin Voltage (V)", "IR Drop (mV)", "Pass/Fail", "Margin (%)",
+]
+
+
+def _html_table(df):
+    header = "".join(f"<th>{column}</th>" for column in df.columns)
+    body = "".join("<tr>" + "".join(f"<td>{value}</td>" for value in row) + "</tr>" for row in df.itertuples(index=False))
+    return f"<table><tr>{header}</tr>{body}</table>"
+
+
+def _png_data_url(seed, size):
+    # 압축이 거의 안 되는 노이즈 이미지 (실제 리포트 크기에 가깝게)
+    pixels = np.random.default_rng(seed).integers(0, 255, (size, size, 3), dtype=np.uint8)
+    buffer = BytesIO()
+    Image.fromarray(pixels).save(buffer, "PNG")
+    return "data:image/png;base64," + base64.b64encode(buffer.getvalue()).decode()
+
+
+def build_pdc_report(path, sinks=500, images=40, image_size=512, distinct_images=4):
+    """
+    pdc_postsim이 읽는 섹션(#ElectricalSetup, #ElectricalResultsTable, #ImageLayoutTop/Bottom, #DistributionPlot)을
+    가진 리포트를 만듭니다. 이미지는 distinct_images개를 번갈아 넣습니다.
+    """
+    rng = np.random.default_rng(0)
+    refdes = [f"U{i // 4}" for i in range(sinks)]
+    names = [f"SINK_U{i // 4}_{i % 4}" for i in range(sinks)]
+    nominal = 0.8 + rng.integers(0, 4, sinks) * 0.2
+    setup = pd.DataFrame(dict(zip(_SETUP_COLUMNS, [
+        refdes, names, [f"VDD_{i % 16}-{i % 3}" for i in range(sinks)], "CurrentSource", 5, nominal.round(2)
+    ])))
+    drop = rng.uniform(0, 0.08, sinks)
+    margin = (0.05 - drop / nominal) * 100
+    result = pd.DataFrame(dict(zip(_RESULT_COLUMNS, [
+        refdes, names, (nominal - drop).round(6), nominal.round(6), (nominal - drop / 2).round(6),
+        rng.uniform(0.01, 2, sinks).round(4), rng.uniform(0.01, 2, sinks).round(4), [f"A{i % 32}" for i in range(sinks)],
+        (nominal - drop).round(6), nominal.round(6), (drop * 1e3).round(3), np.where(margin < 0, "Fail", "Pass"), margin.round(3),
+    ])))
+    dummy = _html_table(pd.DataFrame({"Item": ["Version"], "Value": ["synthetic"]}))
+    data_urls = [_png_data_url(seed, image_size) for seed in range(distinct_images)]
+
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("<html><head><title>PowerDC Report</title></head><body>\n")
+        f.write(f"<div id=\"ElectricalSetup\">{dummy}{dummy}{_html_table(setup)}</div>\n")
+        f.write(f"<div id=\"ElectricalResultsTable\">{dummy}{dummy}{_html_table(result)}</div>\n")
+        f.write(f"<div id=\"ImageLayoutTop\"><img src=\"{data_urls[0]}\"></div>\n")
+        f.write(f"<div id=\"ImageLayoutBottom\"><img src=\"{data_urls[1 % distinct_images]}\"></div>\n")
+        f.write("<div id=\"DistributionPlot\">\n")
+        for i in range(images):
+            f.write(f"<p><img src=\"{data_urls[i % distinct_images]}\"></p>\n")
+        f.write("</div>\n</body></html>\n")
+    return path
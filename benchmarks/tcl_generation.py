@@ -0,0 +1,66 @@
+"""
+TCL 생성 시간 측정 (핀 수 1k ~ 1M)
+
+사용법:
+    python -m benchmarks.tcl_generation
+    python -m benchmarks.tcl_generation --pins 1000 10000 --pins-per-row 8 --mode compact
+"""
+import argparse
+import time
+from pathlib import Path
+
+import presim
+from connectivity import Connectivity, validate_connectivity
+from benchmarks.synthetic import build_pdc_dfs, build_psi_dfs
+
+
+def _make_presim(cls, dfs, mode):
+    # 엑셀을 읽지 않고 dfs만 채운 객체
+    obj = cls.__new__(cls)
+    obj.gnd = "GND"
+    obj.etl_file_path = Path("benchmark.xlsx")
+    obj.tcl_folder_path = None
+    obj.tcl_mode = mode
+    obj.tcl_outputs = dict()
+    obj.dfs = dfs
+    obj.connectivity = Connectivity(dfs, cls.net_columns, cls.positive_pin_columns, cls.negative_pin_columns)
+    return obj
+
+
+def _time_script(lines):
+    start = time.perf_counter()
+    size = sum(len(chunk) for chunk in lines)
+    return time.perf_counter() - start, size
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pins", type=int, nargs="+", default=[1_000, 10_000, 100_000, 1_000_000])
+    parser.add_argument("--pins-per-row", type=int, default=8)
+    parser.add_argument("--mode", choices=presim._TCL_MODES, default="unrolled")
+    args = parser.parse_args()
+
+    print(f"{'pins':>10} {'script':<16} {'seconds':>9} {'MB':>9} {'us/pin':>8}")
+    for pins in args.pins:
+        pdc = _make_presim(presim.PdcPresim, build_pdc_dfs(pins, args.pins_per_row), args.mode)
+        psi = _make_presim(presim.PsiPresim, build_psi_dfs(pins, args.pins_per_row), args.mode)
+        start = time.perf_counter()
+        connectivity = Connectivity(psi.dfs, psi.net_columns, psi.positive_pin_columns, psi.negative_pin_columns)
+        built = time.perf_counter()
+        validate_connectivity(connectivity, psi.gnd)
+        validated = time.perf_counter()
+        print(f"{pins:>10} {'PSI index':<16} {built - start:9.3f} {'-':>9} {(built - start) / pins * 1e6:8.2f}")
+        print(f"{pins:>10} {'PSI validate':<16} {validated - built:9.3f} {'-':>9} {(validated - built) / pins * 1e6:8.2f}")
+        cases = {
+            "PDC classify": pdc.iter_classify_tcl,
+            "PDC add": pdc.iter_add_tcl,
+            "PSI add": psi.iter_add_tcl,
+            "PSI nc": psi.iter_nc_tcl,
+        }
+        for name, iter_tcl in cases.items():
+            elapsed, size = _time_script(iter_tcl())
+            print(f"{pins:>10} {name:<16} {elapsed:9.3f} {size / 1e6:9.1f} {elapsed / pins * 1e6:8.2f}")
+
+
+if __name__ == "__main__":
+    main()
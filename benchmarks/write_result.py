@@ -0,0 +1,40 @@
+"""
+결과 엑셀 쓰기 백엔드별 실행 시간 비교 (openpyxl vs xlwings COM)
+
+사용법:
+    python -m benchmarks.write_result --rows 1000 10000
+"""
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+import postsim
+from benchmarks.synthetic import build_result_table
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    backends = ["openpyxl"] + (["xlwings"] if postsim.xw is not None else [])
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        print(f"{'rows':>8} " + " ".join(f"{backend:>12}" for backend in backends))
+        for rows in args.rows:
+            df = build_result_table(rows)
+            times = []
+            for backend in backends:
+                excel_file_path = str(Path(tmp_dir) / f"{backend}_{rows}.xlsx")
+                elapsed = []
+                for _ in range(args.repeat):
+                    start = time.perf_counter()
+                    postsim._EXCEL_WRITERS[backend](df, excel_file_path)
+                    elapsed.append(time.perf_counter() - start)
+                times.append(min(elapsed))
+            print(f"{rows:>8} " + " ".join(f"{t:>10.3f} s" for t in times))
+
+
+if __name__ == "__main__":
+    main()
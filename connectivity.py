@@ -0,0 +1,229 @@
+import logging
+import numpy as np
+import pandas as pd
+from etl_schema import EtlValidationError, explode_items
+
+logger = logging.getLogger()
+
+# 핀 역할 (pin_role 값)
+POSITIVE = 0
+NEGATIVE = 1
+
+# 같은 refdes가 함께 있으면 안 되는 시트 묶음 (전원 소자 vs 저항/비활성 부품)
+_CONFLICT_SHEETS = (("vrm", "sink"), ("disc", "nc"))
+
+
+def _intern(items):
+    # 이름 -> 정수 ID (첫 등장 순서), ID -> 이름
+    codes, names = pd.factorize(pd.Series(items, dtype=object), sort=False)
+    return codes.astype(np.int32), np.asarray(names, dtype=object)
+
+
+class Connectivity:
+    """
+    ETL 시트의 net / refdes / pin 이름을 정수 ID로 바꿔 NumPy 배열로 보관하는 연결 정보 인덱스입니다.
+    dfs에서 한 번만 만들고, TCL 생성기와 사전 검증(중복 핀, refdes 충돌, 고립 net)이 함께 사용합니다.
+
+    net 항목 : net_sheet / net_column / net_row / net_id      (net_columns의 콤마 구분 항목마다 1개)
+    부품 항목 : component_sheet / component_row / component_refdes   (refdes가 있는 행마다 1개)
+    핀 항목   : pin_sheet / pin_column / pin_row / pin_refdes / pin_id / pin_role
+    *_sheet / *_column은 sheet_names / column_names 위치, *_row는 엑셀 행 번호입니다.
+    """
+    def __init__(self, dfs, net_columns=("net",), positive_pin_columns=("pin",), negative_pin_columns=()):
+        # 상수
+        self.sheet_names = list(dfs)
+        self.column_names = list(dict.fromkeys([*net_columns, *positive_pin_columns, *negative_pin_columns]))
+
+        # net : classify 순서(시트 순서 -> 컬럼 순서 -> 행 순서, 첫 등장 기준)와 ID 순서가 같음
+        entries = self._entries(dfs, net_columns)
+        self.net_sheet, self.net_column, self.net_row = entries[:3]
+        self.net_id, self.net_names = _intern(entries[3])
+
+        # 부품
+        sheets, rows, refdes, offsets = [], [], [], dict()
+        position = 0
+        for sheet_index, (sheet_name, df) in enumerate(dfs.items()):
+            if "refdes" not in df.columns:
+                continue
+            offsets[sheet_name] = position
+            position += len(df)
+            sheets.append(np.full(len(df), sheet_index, dtype=np.int8))
+            rows.append(df.index.to_numpy(dtype=np.int32) + 2)
+            refdes.append(df["refdes"].astype(object).fillna("").astype(str).to_numpy(dtype=object))
+        self.component_sheet = np.concatenate(sheets) if sheets else np.zeros(0, dtype=np.int8)
+        self.component_row = np.concatenate(rows) if rows else np.zeros(0, dtype=np.int32)
+        self.component_refdes, self.refdes_names = _intern(np.concatenate(refdes) if refdes else [])
+
+        # 핀 (refdes는 같은 행의 부품 ID를 그대로 사용, 핀 이름은 컬럼별 사전만 합쳐서 ID 부여)
+        pin_sheet, pin_column, pin_row, pin_refdes, pin_codes, pin_dictionaries, pin_role = [], [], [], [], [], [], []
+        dictionary_offset = 0
+        for role, columns in [(POSITIVE, positive_pin_columns), (NEGATIVE, negative_pin_columns)]:
+            for sheet_index, (sheet_name, df) in enumerate(dfs.items()):
+                for column in columns:
+                    if column not in df.columns or sheet_name not in offsets:
+                        continue
+                    positions, codes, dictionary = explode_items(df[column], decode=False)
+                    pin_sheet.append(np.full(len(positions), sheet_index, dtype=np.int8))
+                    pin_column.append(np.full(len(positions), self.column_names.index(column), dtype=np.int8))
+                    pin_row.append(self.component_row[offsets[sheet_name] + positions])
+                    pin_refdes.append(self.component_refdes[offsets[sheet_name] + positions])
+                    pin_role.append(np.full(len(positions), role, dtype=np.int8))
+                    pin_codes.append(codes.astype(np.int64) + dictionary_offset)
+                    pin_dictionaries.append(dictionary)
+                    dictionary_offset += len(dictionary)
+        self.pin_sheet = np.concatenate(pin_sheet) if pin_sheet else np.zeros(0, dtype=np.int8)
+        self.pin_column = np.concatenate(pin_column) if pin_column else np.zeros(0, dtype=np.int8)
+        self.pin_row = np.concatenate(pin_row) if pin_row else np.zeros(0, dtype=np.int32)
+        self.pin_refdes = np.concatenate(pin_refdes) if pin_refdes else np.zeros(0, dtype=np.int32)
+        self.pin_role = np.concatenate(pin_role) if pin_role else np.zeros(0, dtype=np.int8)
+        remap, self.pin_names = _intern(np.concatenate(pin_dictionaries) if pin_dictionaries else [])
+        self.pin_id = remap[np.concatenate(pin_codes)] if pin_codes else np.zeros(0, dtype=np.int32)
+
+        # 빈 셀에서 나온 "" 항목은 인덱스에서 제외
+        self._drop_blank_pins()
+
+        # (refdes, pin) 쌍 ID : 중복 / 충돌 검사를 bincount와 mask 조회로 처리
+        keys = self.pin_refdes.astype(np.int64) * max(len(self.pin_names), 1) + self.pin_id
+        self.pin_key, _ = pd.factorize(keys, sort=False)
+        self.pin_key = self.pin_key.astype(np.int32)
+        self.key_count = int(self.pin_key.max()) + 1 if len(self.pin_key) else 0
+
+    def _entries(self, dfs, columns):
+        sheets, column_codes, rows, items = [], [], [], []
+        for sheet_index, (sheet_name, df) in enumerate(dfs.items()):
+            for column in columns:
+                if column not in df.columns:
+                    continue
+                positions, values = explode_items(df[column])
+                sheets.append(np.full(len(values), sheet_index, dtype=np.int8))
+                column_codes.append(np.full(len(values), self.column_names.index(column), dtype=np.int8))
+                rows.append(df.index.to_numpy(dtype=np.int32)[positions] + 2)
+                items.extend(values)
+        items = np.asarray(items, dtype=object)
+        keep = items != ""
+        concat = lambda arrays, dtype: np.concatenate(arrays)[keep] if arrays else np.zeros(0, dtype=dtype)
+        return concat(sheets, np.int8), concat(column_codes, np.int8), concat(rows, np.int32), items[keep]
+
+    def _drop_blank_pins(self):
+        blank = np.flatnonzero(self.pin_names == "")
+        if blank.size == 0:
+            return None
+        keep = self.pin_id != blank[0]
+        for name in ("pin_sheet", "pin_column", "pin_row", "pin_refdes", "pin_id", "pin_role"):
+            setattr(self, name, getattr(self, name)[keep])
+        return None
+
+    def sheet_code(self, sheet_name):
+        return self.sheet_names.index(sheet_name) if sheet_name in self.sheet_names else -1
+
+    def classify_nets(self):
+        """
+        classify 대상 net 목록 (ETL 순서, 중복 제거)
+        """
+        return pd.DataFrame({"net": self.net_names}, dtype=object)
+
+    def duplicate_pins(self, role=POSITIVE):
+        """
+        같은 refdes의 같은 핀이 role 핀 컬럼에 두 번 이상 나오는 핀 항목 위치를 반환합니다.
+        """
+        candidates = np.flatnonzero(self.pin_role == role)
+        counts = np.bincount(self.pin_key[candidates], minlength=self.key_count)
+        return candidates[counts[self.pin_key[candidates]] > 1]
+
+    def role_conflicts(self):
+        """
+        같은 refdes의 같은 핀이 positive와 negative 컬럼에 모두 나오는 positive 핀 항목 위치를 반환합니다.
+        """
+        positive = np.flatnonzero(self.pin_role == POSITIVE)
+        negative = np.zeros(self.key_count, dtype=bool)
+        negative[self.pin_key[self.pin_role == NEGATIVE]] = True
+        return positive[negative[self.pin_key[positive]]]
+
+    def refdes_conflicts(self, sheets, other_sheets):
+        """
+        sheets의 부품 중 other_sheets에도 있는 refdes의 부품 항목 위치를 반환합니다.
+        """
+        in_sheets = np.isin(self.component_sheet, [self.sheet_code(sheet) for sheet in sheets])
+        in_others = np.zeros(len(self.refdes_names), dtype=bool)
+        in_others[self.component_refdes[np.isin(self.component_sheet, [self.sheet_code(sheet) for sheet in other_sheets])]] = True
+        return np.flatnonzero(in_sheets & in_others[self.component_refdes])
+
+    def orphan_nets(self, sheet="sink", source_sheet="vrm", column="net", source_columns=("net", "subnet")):
+        """
+        sheet의 column에는 있지만 source_sheet의 source_columns(net / subnet) 어디에도 없는 net 항목 위치를 반환합니다. (VRM 없는 sink net)
+        """
+        if column not in self.column_names:
+            return np.zeros(0, dtype=np.int64)
+        codes = [self.column_names.index(name) for name in source_columns if name in self.column_names]
+        entries = np.flatnonzero((self.net_column == self.column_names.index(column)) & (self.net_sheet == self.sheet_code(sheet)))
+        sources = np.zeros(len(self.net_names), dtype=bool)
+        sources[self.net_id[np.isin(self.net_column, codes) & (self.net_sheet == self.sheet_code(source_sheet))]] = True
+        return entries[~sources[self.net_id[entries]]]
+
+    def gnd_nets(self, gnd):
+        """
+        GND net과 같은 이름의 net 항목 위치를 반환합니다. (classify하면 GND가 PowerNets로 이동)
+        """
+        return np.flatnonzero(np.isin(self.net_id, np.flatnonzero(self.net_names == gnd)))
+
+
+def _issues(connectivity, sheets, rows, columns, values, problem):
+    return pd.DataFrame({
+        "sheet": np.asarray(connectivity.sheet_names, dtype=object)[sheets] if len(sheets) else [],
+        "row": rows,
+        "column": columns,
+        "value": values,
+        "problem": problem,
+    })
+
+
+def _sorted_issues(issues):
+    return pd.concat(issues, ignore_index=True).sort_values(["sheet", "row"], kind="stable", ignore_index=True)
+
+
+def validate_connectivity(connectivity, gnd):
+    """
+    TCL 생성 전에 Sigrity 실행 후에야 error_* 목록으로 드러나는 연결 오류를 한 번에 검사합니다.
+        - 핀 중복 : 같은 refdes의 같은 핀이 vrm / sink 여러 행에 있음
+        - 핀 역할 충돌 : 같은 핀이 pp와 np에 모두 있음
+        - refdes 충돌 : vrm / sink 부품이 disc 또는 nc에도 있음
+    오류가 있으면 전체 목록을 담은 EtlValidationError를 발생시킵니다.
+    아래 항목은 의도한 구성일 수 있으므로 경고 로그만 남기고, 경고 목록(DataFrame)을 반환합니다.
+        - 고립 net : VRM(net / subnet)이 없는 sink net
+        - GND net : GND와 같은 이름의 net
+    """
+    c = connectivity
+    column_names = np.asarray(c.column_names, dtype=object)
+    pin_value = lambda index: c.refdes_names[c.pin_refdes[index]] + ":" + c.pin_names[c.pin_id[index]]
+    net_value = lambda index: c.net_names[c.net_id[index]]
+
+    issues = []
+    for index, problem in [(c.duplicate_pins(), "핀 중복"), (c.role_conflicts(), "pp / np 핀 충돌")]:
+        if index.size:
+            issues.append(_issues(c, c.pin_sheet[index], c.pin_row[index], column_names[c.pin_column[index]], pin_value(index), problem))
+
+    index = c.refdes_conflicts(*_CONFLICT_SHEETS)
+    if index.size:
+        issues.append(_issues(
+            c, c.component_sheet[index], c.component_row[index], "refdes", c.refdes_names[c.component_refdes[index]],
+            f"{' / '.join(_CONFLICT_SHEETS[1])} 시트에도 있는 부품"
+        ))
+
+    if issues:
+        raise EtlValidationError(_sorted_issues(issues))
+
+    warnings = []
+    for index, problem in [(c.orphan_nets(), "VRM이 없는 net"), (c.gnd_nets(gnd), "GND net")]:
+        if index.size:
+            warnings.append(_issues(c, c.net_sheet[index], c.net_row[index], column_names[c.net_column[index]], net_value(index), problem))
+    if warnings:
+        warnings = _sorted_issues(warnings)
+        logger.warning("\n".join([f"연결 검증 경고 ({len(warnings)}건)"] + [
+            f"  [{warning.sheet}] {warning.row}행 {warning.column} : {warning.problem} ({warning.value})"
+            for warning in warnings.head(50).itertuples()
+        ]))
+    else:
+        warnings = _issues(c, [], [], [], [], [])
+
+    logger.info(f"연결 검증 완료 : net {len(c.net_names)}개, 부품 {len(c.refdes_names)}개, 핀 {len(c.pin_id)}개")
+    return warnings
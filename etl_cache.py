@@ -0,0 +1,180 @@
+import os
+import json
+import shutil
+import hashlib
+import logging
+import tempfile
+from pathlib import Path
+from collections import OrderedDict
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+
+logger = logging.getLogger()
+
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+
+# feather -> DataFrame (핀 목록 컬럼은 Arrow list 그대로, pandas 메타데이터는 list<dictionary>를 읽지 못하므로 사용하지 않음)
+def _read_sheet(path):
+    table = feather.read_table(path)
+    df = table.to_pandas(types_mapper=lambda t: pd.ArrowDtype(t) if pa.types.is_list(t) else None, ignore_metadata=True)
+    # 문자열 컬럼의 빈 값은 메모리 캐시 / 새로 읽은 결과와 같게 None -> NaN
+    for column in df.columns[df.dtypes == object]:
+        df[column] = df[column].where(df[column].notna(), np.nan)
+    return df
+
+
+# 캐시 / 결과 저장소 공통 루트 (CADENCE_CACHE_DIR, 없으면 ~/.cache/cadence)
+#   ETL 캐시는 {루트}/etl, 결과 저장소(results_store)는 {루트}/results
+def cadence_root():
+    return Path(os.environ.get("CADENCE_CACHE_DIR", Path.home() / ".cache" / "cadence"))
+
+
+# ETL 파일 내용 해시 (같은 파일은 size/mtime이 바뀌기 전까지 다시 해시하지 않음)
+_file_hashes = dict()
+
+def _hash_file(file_path):
+    file_path = Path(file_path).resolve()
+    stat = file_path.stat()
+    stamp = (str(file_path), stat.st_size, stat.st_mtime_ns)
+    if stamp not in _file_hashes:
+        digest = hashlib.sha256()
+        with open(file_path, "rb") as f:
+            for chunk in iter(lambda: f.read(_HASH_CHUNK_SIZE), b""):
+                digest.update(chunk)
+        _file_hashes[stamp] = digest.hexdigest()
+    return _file_hashes[stamp]
+
+
+class EtlCache:
+    """
+    파싱/정규화가 끝난 ETL DataFrame(dfs)을 파일 내용 해시 + 정규화 버전 기준으로 저장하는 캐시입니다.
+    프로세스 내 메모리(LRU)와 디스크(시트별 feather 파일) 2단계로 동작합니다.
+    """
+    def __init__(self, cache_dir=None, max_bytes=1024 * 1024 * 1024, max_memory_entries=8):
+        # 상수
+        self.cache_dir = Path(cache_dir or cadence_root()) / "etl"
+        self.max_bytes = max_bytes
+        self.max_memory_entries = max_memory_entries
+
+        # 변수
+        self.memory = OrderedDict()
+
+    def key(self, etl_file_path, version, backend="auto"):
+        # 읽기 백엔드마다 결과가 다를 수 있으므로 키에 포함
+        return hashlib.sha256(f"{_hash_file(etl_file_path)}:{version}:{backend}".encode()).hexdigest()
+
+    def get(self, key):
+        if key in self.memory:
+            self.memory.move_to_end(key)
+            return {sheet_name: df.copy() for sheet_name, df in self.memory[key].items()}
+
+        entry_dir = self.cache_dir / key
+        try:
+            with open(entry_dir / "meta.json", "r", encoding="utf-8") as f:
+                meta = json.load(f)
+            dfs = dict()
+            for i, sheet in enumerate(meta["sheets"]):
+                df = _read_sheet(entry_dir / f"sheet_{i}.feather")
+                df.index = pd.Index(df.pop("index").to_numpy())
+                df.columns = sheet["columns"]
+                dfs[sheet["name"]] = df
+        except (OSError, ValueError, KeyError):
+            return None
+
+        try:
+            os.utime(entry_dir)
+        except FileNotFoundError:
+            # 다른 프로세스가 방금 삭제한 항목 (읽은 내용은 그대로 사용)
+            pass
+        self._remember(key, dfs)
+        return {sheet_name: df.copy() for sheet_name, df in dfs.items()}
+
+    def put(self, key, dfs, etl_file_path=None):
+        self._remember(key, {sheet_name: df.copy() for sheet_name, df in dfs.items()})
+
+        entry_dir = self.cache_dir / key
+        if entry_dir.exists():
+            return None
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_dir = Path(tempfile.mkdtemp(dir=self.cache_dir, prefix=".tmp_"))
+        try:
+            meta = {
+                "source": str(Path(etl_file_path).resolve()) if etl_file_path else None,
+                "sheets": []
+            }
+            for i, (sheet_name, df) in enumerate(dfs.items()):
+                # feather는 문자열 컬럼명 + 기본 index만 허용하므로 위치 기반 이름으로 저장
+                meta["sheets"].append({"name": sheet_name, "columns": [str(c) for c in df.columns]})
+                index = df.index.to_numpy()
+                df = df.reset_index(drop=True)
+                df.columns = [f"c{j}" for j in range(len(df.columns))]
+                df["index"] = index
+                df.to_feather(tmp_dir / f"sheet_{i}.feather")
+            with open(tmp_dir / "meta.json", "w", encoding="utf-8") as f:
+                json.dump(meta, f, ensure_ascii=False)
+            os.replace(tmp_dir, entry_dir)
+        except OSError as e:
+            logger.warning(f"ETL 캐시 저장 실패: {e}")
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            return None
+
+        self._evict()
+        return None
+
+    def invalidate(self, etl_file_path=None):
+        """
+        etl_file_path가 주어지면 해당 파일에서 만들어진 항목만, 없으면 캐시 전체를 삭제합니다.
+        """
+        if etl_file_path is None:
+            self.memory.clear()
+            shutil.rmtree(self.cache_dir, ignore_errors=True)
+            return None
+
+        source = str(Path(etl_file_path).resolve())
+        for entry_dir in self._entries():
+            try:
+                with open(entry_dir / "meta.json", "r", encoding="utf-8") as f:
+                    if json.load(f)["source"] != source:
+                        continue
+            except (OSError, ValueError, KeyError):
+                pass
+            self.memory.pop(entry_dir.name, None)
+            shutil.rmtree(entry_dir, ignore_errors=True)
+        return None
+
+    def _remember(self, key, dfs):
+        self.memory[key] = dfs
+        self.memory.move_to_end(key)
+        while len(self.memory) > self.max_memory_entries:
+            self.memory.popitem(last=False)
+
+    def _entries(self):
+        if not self.cache_dir.is_dir():
+            return []
+        return [p for p in self.cache_dir.iterdir() if p.is_dir() and not p.name.startswith(".")]
+
+    def _evict(self):
+        # 오래 사용하지 않은 항목부터 max_bytes 이하가 될 때까지 삭제
+        # 다른 프로세스(batch 작업)가 동시에 삭제/교체 중인 항목은 건너뜀
+        entries = []
+        for entry_dir in self._entries():
+            try:
+                size = sum(f.stat().st_size for f in entry_dir.iterdir())
+                entries.append((entry_dir.stat().st_mtime, size, entry_dir))
+            except FileNotFoundError:
+                continue
+        total = sum(size for _, size, _ in entries)
+        for _, size, entry_dir in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            self.memory.pop(entry_dir.name, None)
+            shutil.rmtree(entry_dir, ignore_errors=True)
+            total -= size
+        return None
+
+
+ETL_CACHE = EtlCache()
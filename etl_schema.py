@@ -0,0 +1,266 @@
+import logging
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+logger = logging.getLogger()
+
+# 컬럼 타입 (정리 후 저장 형식)
+#   text  : 공백 제거, 줄바꿈 -> "," (문자열)
+#   str   : text, 반복되는 식별자이므로 categorical로 저장
+#   net   : str + Cadence net 표기 변환 대상 ("." -> "_")
+#   pin   : str + 정수형 숫자 표기 정리 ("12.0" -> "12")
+#   pins  : 콤마 구분 핀 목록, pin과 같이 정리한 뒤 offsets + 사전 인코딩된 flat 배열(Arrow list<dictionary>)로 저장
+#   float : text + 숫자 검증, 모든 값이 숫자면 float64로 저장 (아니면 검증에서 보고하도록 문자열 유지)
+# ffill  : 병합 셀 등으로 비어 있는 값을 위 행 값으로 채움
+# required : 컬럼이 있을 때 빈 값이면 검증 오류
+SHEET_SCHEMAS = {
+    "vrm": {
+        "refdes": {"type": "str", "ffill": True, "required": True},
+        "net": {"type": "net", "ffill": True, "required": True},
+        "subnet": {"type": "net", "ffill": True, "required": True},
+        "index": {"type": "pin", "ffill": True, "required": False},
+        "pin": {"type": "pins", "ffill": False, "required": True},
+        "pp": {"type": "pins", "ffill": False, "required": True},
+        "np": {"type": "pins", "ffill": False, "required": True},
+        "v": {"type": "float", "ffill": True, "required": True},
+    },
+    "sink": {
+        "refdes": {"type": "str", "ffill": True, "required": True},
+        "net": {"type": "net", "ffill": True, "required": True},
+        "subnet": {"type": "net", "ffill": True, "required": True},
+        "index": {"type": "pin", "ffill": True, "required": False},
+        "pin": {"type": "pins", "ffill": False, "required": True},
+        "pp": {"type": "pins", "ffill": False, "required": True},
+        "np": {"type": "pins", "ffill": False, "required": True},
+        "voltage": {"type": "float", "ffill": True, "required": False},
+        "current": {"type": "float", "ffill": True, "required": True},
+        "port": {"type": "float", "ffill": False, "required": False},
+    },
+    "disc": {
+        "refdes": {"type": "str", "ffill": True, "required": True},
+        "resistance": {"type": "float", "ffill": True, "required": True},
+    },
+    "nc": {
+        "refdes": {"type": "str", "ffill": False, "required": True},
+    },
+}
+
+# 스키마에 없는 시트/컬럼
+_DEFAULT_COLUMN = {"type": "text", "ffill": False, "required": False}
+
+# "12", "12.0", "007." 처럼 정수로 읽힌 핀 번호
+_INTEGER_PIN_PATTERN = r"^0*(\d+?)(?:\.0*)?$"
+
+
+class EtlValidationError(ValueError):
+    """
+    ETL 검증에서 발견한 문제 행 전체를 issues(DataFrame)로 담아 전달합니다.
+    """
+    def __init__(self, issues):
+        self.issues = issues
+        lines = [f"ETL 검증 실패 ({len(issues)}건)"] + [
+            f"  [{issue.sheet}] {issue.row}행 {issue.column} : {issue.problem} ({issue.value})"
+            for issue in issues.head(50).itertuples()
+        ]
+        super().__init__("\n".join(lines))
+
+
+def _column_schema(sheet_name, column):
+    return SHEET_SCHEMAS.get(sheet_name, {}).get(column, _DEFAULT_COLUMN)
+
+
+def _normalize_column(values, column_schema):
+    blank = values.isna().to_numpy()
+    values = (
+        values.astype(str)
+        .str.replace(" ", "", regex=False)
+        .str.replace("\n", ",", regex=False)
+    )
+    blank |= (values == "").to_numpy()
+
+    if column_schema["type"] in ("pin", "pins"):
+        values = values.str.replace(_INTEGER_PIN_PATTERN, r"\1", regex=True)
+
+    values = values.mask(blank, np.nan)
+    if column_schema["ffill"]:
+        values = values.ffill()
+    return values
+
+
+def _compact_column(values, column_schema):
+    # 정리된 문자열 컬럼 -> 저장 형식
+    column_type = column_schema["type"]
+    if column_type in ("str", "net", "pin"):
+        return values.astype("category")
+    if column_type == "pins":
+        return pin_lists(values)
+    if column_type == "float":
+        numbers = pd.to_numeric(values, errors="coerce")
+        if not (values.notna() & numbers.isna()).any():
+            return numbers.astype("float64")
+    return values
+
+
+def compact_sheets(dfs):
+    """
+    정리된 문자열 시트를 스키마 타입별 저장 형식(categorical / float64 / 핀 목록)으로 변환합니다.
+    """
+    return {
+        sheet_name: pd.DataFrame(
+            {column: _compact_column(df[column], _column_schema(sheet_name, column)) for column in df.columns},
+            index=df.index
+        )
+        for sheet_name, df in dfs.items()
+    }
+
+
+# 핀 목록 컬럼
+def pin_lists(values):
+    """
+    콤마 구분 문자열 Series를 핀 목록 Series(offsets + 사전 인코딩된 flat 배열)로 변환합니다. 빈 값은 null입니다.
+    """
+    blank = values.isna().to_numpy()
+    texts = values[~blank].astype(str).tolist()
+    counts = np.zeros(len(values), dtype=np.int64)
+    counts[~blank] = np.fromiter((text.count(",") for text in texts), dtype=np.int64, count=len(texts)) + 1
+    offsets = np.concatenate([[0], np.cumsum(counts)]).astype(np.int32)
+    flat = pa.array(",".join(texts).split(",") if texts else [], type=pa.string())
+    array = pa.ListArray.from_arrays(pa.array(offsets), pc.dictionary_encode(flat), mask=pa.array(blank))
+    return pd.Series(pd.arrays.ArrowExtensionArray(array), index=values.index)
+
+
+def is_pin_list(values):
+    return isinstance(values.dtype, pd.ArrowDtype) and pa.types.is_list(values.dtype.pyarrow_dtype)
+
+
+def _list_array(values):
+    array = pa.array(values.array)
+    return array.combine_chunks() if isinstance(array, pa.ChunkedArray) else array
+
+
+def explode_items(values, decode=True):
+    """
+    핀 목록 또는 콤마 구분 문자열 Series를 (행 위치, 항목) 배열로 펼칩니다. 빈 값은 건너뜁니다.
+    decode가 False면 항목 대신 (행 위치, 사전 인덱스, 사전) 을 반환합니다.
+    """
+    if is_pin_list(values):
+        array = _list_array(values)
+        positions = pc.list_parent_indices(array).to_numpy().astype(np.int64)
+        flat = pc.list_flatten(array)
+        if not pa.types.is_dictionary(flat.type):
+            flat = pc.dictionary_encode(flat)
+        codes = flat.indices.to_numpy(zero_copy_only=False)
+        dictionary = flat.dictionary.to_numpy(zero_copy_only=False)
+    else:
+        blank = values.isna().to_numpy()
+        texts = values[~blank].astype(str).tolist()
+        counts = np.fromiter((text.count(",") for text in texts), dtype=np.int64, count=len(texts)) + 1
+        positions = np.repeat(np.flatnonzero(~blank), counts)
+        codes, dictionary = pd.factorize(np.asarray(",".join(texts).split(",") if texts else [], dtype=object))
+    if decode:
+        return positions, np.asarray(dictionary, dtype=object)[codes]
+    return positions, codes, np.asarray(dictionary, dtype=object)
+
+
+def join_items(values, sep=","):
+    """
+    핀 목록 Series를 sep로 이은 문자열 Series로 변환합니다. (콤마 구분 문자열이면 구분자만 바꿈)
+    """
+    if not is_pin_list(values):
+        return values.str.replace(",", sep, regex=False) if sep != "," else values
+    array = _list_array(values)
+    offsets = array.offsets.to_numpy() - array.offsets[0].as_py()
+    _, items = explode_items(values)
+    items = items.tolist()
+    valid = array.is_valid().to_numpy(zero_copy_only=False)
+    joined = [sep.join(items[offsets[i]:offsets[i + 1]]) if valid[i] else None for i in range(len(array))]
+    return pd.Series(joined, index=values.index, dtype=object)
+
+
+def count_items(values):
+    if is_pin_list(values):
+        return pc.list_value_length(_list_array(values)).fill_null(0).to_numpy()
+    return (values.str.count(",") + 1).fillna(0).to_numpy(dtype=np.int64)
+
+
+def as_text(df):
+    """
+    핀 목록 컬럼은 그대로 두고 나머지 컬럼을 문자열로 변환합니다. (TCL 렌더링용)
+    """
+    return df.assign(**{column: df[column].astype(str) for column in df.columns if not is_pin_list(df[column])})
+
+
+def normalize_sheets(raw_dfs):
+    """
+    엑셀에서 읽은 원본 시트를 스키마에 따라 컬럼 단위로 정리하고 저장 형식(compact_sheets)으로 변환합니다.
+    완전히 빈 행은 제거하며, index는 원본 행 위치를 유지합니다. 컬럼 이름은 문자열로 맞춥니다. (빈 헤더는 "")
+    """
+    dfs = dict()
+    for sheet_name, df in raw_dfs.items():
+        df = df.set_axis(["" if column is None else str(column) for column in df.columns], axis=1)
+        df = df.loc[~df.isna().all(axis=1)]
+        dfs[sheet_name] = pd.DataFrame(
+            {column: _normalize_column(df[column], _column_schema(sheet_name, column)) for column in df.columns},
+            index=df.index
+        )
+    return compact_sheets(dfs)
+
+
+def mangle_net_names(dfs):
+    """
+    net 타입 컬럼을 Cadence net 표기에 맞게 변환합니다. ("." -> "_")
+    """
+    for sheet_name, df in dfs.items():
+        for column in df.columns:
+            if _column_schema(sheet_name, column)["type"] != "net":
+                continue
+            values = df[column]
+            if isinstance(values.dtype, pd.CategoricalDtype):
+                # category 이름만 변환 (변환 후 같아지는 category는 합침)
+                codes, categories = pd.factorize(values.cat.categories.str.replace(".", "_", regex=False))
+                old_codes = values.cat.codes.to_numpy()
+                new_codes = np.where(old_codes >= 0, codes[old_codes], -1)
+                df[column] = pd.Categorical.from_codes(new_codes, categories=categories)
+            else:
+                df[column] = values.str.replace(".", "_", regex=False)
+    return dfs
+
+
+def validate_sheets(dfs, required_columns):
+    """
+    required_columns({시트: [컬럼]})의 누락, 필수 값 공백, 숫자 컬럼의 잘못된 값을 한 번에 검사합니다.
+    문제가 있으면 전체 목록을 담은 EtlValidationError를 발생시킵니다.
+    """
+    issues = []
+    for sheet_name, columns in required_columns.items():
+        if sheet_name not in dfs:
+            issues.append(pd.DataFrame({"sheet": [sheet_name], "row": [0], "column": [""], "value": [""], "problem": ["시트 없음"]}))
+            continue
+
+        df = dfs[sheet_name]
+        missing = [column for column in columns if column not in df.columns]
+        if missing:
+            issues.append(pd.DataFrame({"sheet": sheet_name, "row": 1, "column": missing, "value": "", "problem": "컬럼 없음"}))
+
+        for column in df.columns:
+            column_schema = _column_schema(sheet_name, column)
+            values = df[column]
+            if column_schema["required"] or column in columns:
+                bad = values.isna()
+                if bad.any():
+                    issues.append(pd.DataFrame({
+                        "sheet": sheet_name, "row": df.index[bad] + 2, "column": column, "value": "", "problem": "빈 값"
+                    }))
+            if column_schema["type"] == "float":
+                bad = values.notna() & pd.to_numeric(values, errors="coerce").isna()
+                if bad.any():
+                    issues.append(pd.DataFrame({
+                        "sheet": sheet_name, "row": df.index[bad] + 2, "column": column, "value": values[bad].to_numpy(), "problem": "숫자 아님"
+                    }))
+
+    if issues:
+        issues = pd.concat(issues, ignore_index=True).sort_values(["sheet", "row"], kind="stable", ignore_index=True)
+        raise EtlValidationError(issues)
+    return None
@@ -0,0 +1,244 @@
+import os
+import json
+import time
+import atexit
+import logging
+import threading
+import functools
+import tracemalloc
+from contextlib import contextmanager
+
+logger = logging.getLogger()
+
+
+class _Stage:
+    __slots__ = ("name", "owner", "sizes", "wall_start", "cpu_start", "memory_start", "child_peak", "memory_shared")
+
+    def __init__(self, name, owner, sizes):
+        self.name = name
+        self.owner = owner
+        self.sizes = sizes
+        self.wall_start = 0.0
+        self.cpu_start = 0.0
+        self.memory_start = 0
+        self.child_peak = 0
+        self.memory_shared = False
+
+
+class Instrumentation:
+    """
+    단계(stage)별 wall / CPU 시간, 최대 메모리(tracemalloc), 입출력 크기를 기록합니다.
+    완료된 단계는 로그와 Chrome trace 형식 JSON(chrome://tracing, Perfetto에서 열림)으로 남깁니다.
+    trace는 프로세스 종료 시 한 번 {이름}.{pid}{확장자}로 저장합니다. (batch 작업 프로세스마다 별도 파일)
+    비활성 상태에서는 기존과 같은 "실행 중"/"완료" 로그만 남깁니다.
+    환경 변수 CADENCE_INSTRUMENT=1 또는 CADENCE_TRACE_FILE=경로로도 켤 수 있습니다.
+
+    최대 메모리는 tracemalloc의 peak를 단계 시작 시 reset_peak()로 초기화해 측정하는데, peak는 프로세스 전체 값입니다.
+    compute() 등으로 여러 스레드의 단계가 동시에 실행되면 서로의 peak를 초기화 / 포함하므로 정확하지 않으며,
+    이런 단계의 이벤트에는 memory_shared=True를 남깁니다. 정확한 값이 필요하면 단계를 순서대로 실행하세요.
+    """
+    def __init__(self, enabled=None, trace_file_path=None, memory=True):
+        # 상수
+        trace_file_path = trace_file_path or os.environ.get("CADENCE_TRACE_FILE") or None
+        if enabled is None:
+            enabled = os.environ.get("CADENCE_INSTRUMENT", "") not in ("", "0") or trace_file_path is not None
+        self.enabled = enabled
+        self.trace_file_path = trace_file_path
+        self.memory = memory
+
+        # 변수
+        self.events = []
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._active_stacks = dict()
+        self._origin = time.perf_counter()
+        self._started_tracemalloc = False
+
+    def configure(self, enabled=True, trace_file_path=None, memory=True):
+        self.enabled = enabled
+        self.trace_file_path = trace_file_path
+        self.memory = memory
+        return self
+
+    def _stack(self):
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    @contextmanager
+    def stage(self, name, owner=None, **sizes):
+        """
+        with 블록 하나를 단계로 기록합니다. sizes와 블록 안의 annotate() 값은 이벤트에 함께 남습니다.
+        """
+        label = f"{owner} : {name}" if owner else name
+        logger.info(f"{label} 실행 중")
+        if not self.enabled:
+            yield
+            logger.info(f"{label} 완료")
+            return
+
+        stage = _Stage(name, owner, dict(sizes))
+        stack = self._stack()
+        if self.memory:
+            self._enter_memory_stage(stack, stage)
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._started_tracemalloc = True
+            current, peak = tracemalloc.get_traced_memory()
+            if stack:
+                stack[-1].child_peak = max(stack[-1].child_peak, peak)
+            tracemalloc.reset_peak()
+            stage.memory_start = current
+        stack.append(stage)
+        stage.cpu_start = time.thread_time()
+        stage.wall_start = time.perf_counter()
+        error = None
+        try:
+            yield
+        except BaseException as e:
+            error = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            wall = time.perf_counter() - stage.wall_start
+            cpu = time.thread_time() - stage.cpu_start
+            stack.pop()
+            event = {"name": name, "owner": owner, "wall_seconds": wall, "cpu_seconds": cpu, **stage.sizes}
+            if self.memory:
+                peak = max(tracemalloc.get_traced_memory()[1], stage.child_peak)
+                event["peak_mb"] = (peak - stage.memory_start) / 1e6
+                if stack:
+                    stack[-1].child_peak = max(stack[-1].child_peak, peak)
+                self._exit_memory_stage(stack)
+                if stage.memory_shared:
+                    event["memory_shared"] = True
+            if error:
+                event["error"] = error
+            self._record(stage, event, wall)
+            logger.log(
+                logging.ERROR if error else logging.INFO,
+                f"{label} {'실패' if error else '완료'} ({wall:.3f}s, cpu {cpu:.3f}s"
+                + (f", peak {event['peak_mb']:.1f} MB" if self.memory else "")
+                + "".join(f", {key}={value}" for key, value in stage.sizes.items()) + ")",
+                extra={"stage_event": event}
+            )
+
+    # tracemalloc peak는 프로세스 전체 값이므로 다른 스레드의 단계와 겹친 단계를 표시
+    def _enter_memory_stage(self, stack, stage):
+        with self._lock:
+            self._active_stacks[threading.get_ident()] = stack
+            if len(self._active_stacks) > 1:
+                stage.memory_shared = True
+                for active_stack in self._active_stacks.values():
+                    for active_stage in active_stack:
+                        active_stage.memory_shared = True
+        return None
+
+    def _exit_memory_stage(self, stack):
+        with self._lock:
+            if not stack:
+                self._active_stacks.pop(threading.get_ident(), None)
+        return None
+
+    def annotate(self, **sizes):
+        """
+        현재 실행 중인 단계에 입출력 크기(rows, nets, pins, tcl_lines 등)를 추가합니다. 비활성 상태면 무시합니다.
+        """
+        if self.enabled:
+            stack = self._stack()
+            if stack:
+                stack[-1].sizes.update(sizes)
+        return None
+
+    def accumulate(self, **sizes):
+        """
+        annotate와 같지만 같은 이름의 값이 있으면 더합니다. (한 단계에서 여러 파일을 쓰는 경우)
+        """
+        if self.enabled:
+            stack = self._stack()
+            if stack:
+                for key, value in sizes.items():
+                    stack[-1].sizes[key] = stack[-1].sizes.get(key, 0) + value
+        return None
+
+    def _record(self, stage, event, wall):
+        trace_event = {
+            "name": f"{stage.owner}.{stage.name}" if stage.owner else stage.name,
+            "cat": stage.owner or "stage",
+            "ph": "X",
+            "ts": (stage.wall_start - self._origin) * 1e6,
+            "dur": wall * 1e6,
+            "pid": os.getpid(),
+            "tid": threading.get_ident(),
+            "args": {key: value for key, value in event.items() if key not in ("name", "owner")},
+        }
+        with self._lock:
+            self.events.append(trace_event)
+        return None
+
+    def write_trace(self, trace_file_path=None):
+        """
+        지금까지의 이벤트를 Chrome trace 형식({"traceEvents": [...]})으로 저장하고 경로를 반환합니다.
+        trace_file_path가 없으면 설정된 경로에 pid를 붙인 {이름}.{pid}{확장자}에 저장합니다. (이벤트가 없으면 저장하지 않음)
+        """
+        if trace_file_path is None:
+            if self.trace_file_path is None:
+                return None
+            root, ext = os.path.splitext(self.trace_file_path)
+            trace_file_path = f"{root}.{os.getpid()}{ext or '.json'}"
+        with self._lock:
+            events = list(self.events)
+        if not events:
+            return None
+        tmp_path = f"{trace_file_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f, ensure_ascii=False, default=str)
+        os.replace(tmp_path, trace_file_path)
+        return trace_file_path
+
+    def reset(self):
+        with self._lock:
+            self.events.clear()
+        if self._started_tracemalloc and tracemalloc.is_tracing():
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+        return None
+
+
+INSTRUMENTATION = Instrumentation()
+atexit.register(INSTRUMENTATION.write_trace)
+
+stage = INSTRUMENTATION.stage
+annotate = INSTRUMENTATION.annotate
+
+
+def instrumented(method):
+    """
+    메서드 하나를 "{클래스} : {메서드}" 단계로 기록하는 decorator입니다.
+    """
+    name = method.__name__
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with INSTRUMENTATION.stage(name, owner=self.__class__.__name__):
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
+def counted_lines(lines):
+    """
+    출력 줄(문자열 청크) iterator를 그대로 전달하면서 줄 수 / 글자 수를 현재 단계에 더합니다.
+    비활성 상태면 lines를 그대로 반환합니다.
+    """
+    if not INSTRUMENTATION.enabled:
+        return lines
+
+    def _count():
+        line_count = 0
+        char_count = 0
+        for chunk in lines:
+            line_count += chunk.count("\n")
+            char_count += len(chunk)
+            yield chunk
+        INSTRUMENTATION.accumulate(tcl_lines=line_count, tcl_chars=char_count)
+    return _count()
@@ -1,32 +1,183 @@
+"""
+Cadence presim / postsim 명령줄 실행
+
+사용법:
+    python main.py presim pdc ETL.xlsx -o TCL폴더 --gnd GND
+    python main.py presim pdc ETL.xlsx --validate-only                 # ETL / 연결 검증만
+    python main.py presim pdc ETL.xlsx -o TCL폴더 --only add_tcl       # 스크립트 하나만 다시 생성
+    python main.py presim pdc ETL.xlsx -o TCL폴더 --design board.spd   # 생성 후 Sigrity 세션에서 실행
+    python main.py presim pdc ETL.xlsx -o TCL폴더 --design board.spd --delta   # 증분 스크립트만 실행
+    python main.py presim pdc ETL.xlsx -o TCL폴더 --commit-snapshot    # 스크립트를 직접 반영한 뒤 증분 기준 갱신
+    python main.py presim psi ETL.xlsx -o TCL폴더
+    python main.py postsim pdc report.htm 결과폴더 --only result_excel
+    python main.py batch 매니페스트.json -j 4
+
+presim / postsim / pandas 등 무거운 모듈은 인자를 해석한 뒤 해당 명령에서만 불러옵니다.
+"""
+import sys
 import logging
-from presim import PdcPresim, PsiPresim
-from postsim import *
+import argparse
+
+logger = logging.getLogger()
+
+# TCL 출력 모드 / 엑셀 백엔드 / 리포트 파싱 모드 (presim, postsim 모듈을 불러오지 않고 인자를 검사하기 위해 따로 정의)
+TCL_MODES = ("unrolled", "compact")
+EXCEL_BACKENDS = ("auto", "openpyxl", "xlwings")
+PARSE_MODES = ("stream", "full")
+
+# --only가 없을 때 만드는 postsim 결과물 (리포트 파싱(report)은 다시 만들 결과물이 있을 때만 실행되도록 제외)
+POSTSIM_ARTIFACTS = ("result_table", "result_excel", "images", "stored_results")
 
-def setup_logger():
+
+def setup_logger(log_file_path="Cadence.log"):
+    handlers = [logging.StreamHandler()]
+    if log_file_path:
+        handlers.insert(0, logging.FileHandler(log_file_path, mode="w", encoding="utf-8"))
     logging.basicConfig(
         level=logging.INFO,
         format="%(asctime)s [%(levelname)s] %(message)s",
         datefmt="%Y-%m-%d %H:%M:%S",
-        handlers=[
-            logging.FileHandler("Cadence.log", mode="w", encoding="utf-8"),
-            logging.StreamHandler()
-        ]
+        handlers=handlers
     )
 
     return None
 
+
+def _compute(obj, names):
+    # names(없으면 전체) 결과물만 계산, 없는 결과물 이름은 KeyError
+    try:
+        obj.compute(*names)
+    except KeyError as e:
+        raise SystemExit(f"오류 : {e.args[0]}")
+    return None
+
+
+# 명령 : presim pdc / presim psi
+def run_presim(args):
+    from presim import PdcPresim, PsiPresim
+    from etl_cache import ETL_CACHE
+
+    cls = PdcPresim if args.tool == "pdc" else PsiPresim
+    presim = cls(
+        args.gnd, args.etl, args.output, TCL_MODE=args.mode, EXCEL_BACKEND=args.excel_backend,
+        ETL_CACHE=None if args.no_cache else ETL_CACHE, VALIDATE=not args.no_validate, LAZY=True
+    )
+    _compute(presim, ["connectivity"] if args.validate_only else args.only)
+
+    if args.design and not args.validate_only:
+        from sigrity import SigrityPool, SigrityError
+
+        try:
+            with SigrityPool(executable=args.sigrity) as pool:
+                pool.run_presim(args.design, presim, delta=args.delta)
+        except SigrityError as e:
+            # design 열기 실패, 세션 종료 / 응답 시간 초과도 입력 문제와 같이 traceback 없이 종료
+            logger.error(str(e))
+            return 1
+    elif args.commit_snapshot and not args.validate_only:
+        presim.commit_snapshot()
+
+    return 0
+
+
+# 명령 : postsim pdc
+def run_postsim(args):
+    from postsim import pdc_postsim
+    from results_store import RESULTS_STORE
+
+    postsim = pdc_postsim(
+        args.report, args.output, PARSE_MODE=args.parse_mode, IMAGE_WORKERS=args.image_workers,
+        THUMBNAIL_SIZE=(args.thumbnail, args.thumbnail) if args.thumbnail else None, WEBP=args.webp,
+        EXCEL_BACKEND=args.excel_backend, BOARD=args.board, REVISION=args.revision,
+        RESULTS_STORE=None if args.no_store else RESULTS_STORE, CACHE=not args.no_cache, LAZY=True
+    )
+    _compute(postsim, args.only or POSTSIM_ARTIFACTS)
+
+    return 0
+
+
+# 명령 : batch
+def run_batch(args):
+    from pathlib import Path
+    import batch
+
+    if Path(args.source).is_dir():
+        if args.output is None:
+            raise SystemExit("오류 : 폴더를 검색할 때는 --output이 필요합니다.")
+        jobs = batch.scan_directory(args.source, args.output, gnd=args.gnd)
+    else:
+        jobs = batch.load_manifest(args.source, gnd=args.gnd)
+
+    results = batch.run_batch(jobs, max_workers=args.workers, summary_path=args.summary)
+    return 1 if any(result["status"] != "ok" for result in results) else 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="main.py", description="Cadence PowerDC / PowerSI presim, postsim 자동화")
+    parser.add_argument("--log", default="Cadence.log", help="로그 파일 경로 (빈 값이면 파일 로그 없음)")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    # presim
+    presim = commands.add_parser("presim", help="ETL 엑셀에서 Sigrity TCL 스크립트 생성")
+    presim_tools = presim.add_subparsers(dest="tool", required=True)
+    for tool, description in [("pdc", "PowerDC"), ("psi", "PowerSI")]:
+        sub = presim_tools.add_parser(tool, help=f"{description} 스크립트 생성")
+        sub.add_argument("etl", help="ETL 엑셀 파일")
+        sub.add_argument("-o", "--output", help="TCL 출력 폴더 (없으면 파일을 쓰지 않음)")
+        sub.add_argument("--gnd", default="GND")
+        sub.add_argument("--mode", choices=TCL_MODES, default="unrolled", help="TCL 출력 모드")
+        sub.add_argument("--excel-backend", choices=EXCEL_BACKENDS, default="auto")
+        sub.add_argument("--only", nargs="+", default=[], metavar="ARTIFACT", help="만들 결과물 (예 : classify_tcl add_tcl, 없으면 전체)")
+        sub.add_argument("--validate-only", action="store_true", help="ETL / 연결 검증만 실행")
+        sub.add_argument("--no-validate", action="store_true", help="연결 사전 검증 생략")
+        sub.add_argument("--no-cache", action="store_true", help="ETL 캐시 사용 안 함")
+        sub.add_argument("--design", help="생성한 스크립트를 실행할 design 파일")
+        sub.add_argument("--sigrity", default=None, help="Sigrity 실행 파일 (기본 : CADENCE_SIGRITY_EXE 또는 PowerDC)")
+        sub.add_argument("--delta", action="store_true", help="--design 실행 시 증분 스크립트만 실행")
+        sub.add_argument("--commit-snapshot", action="store_true", help="현재 ETL을 design에 반영된 것으로 표시 (증분 기준 갱신)")
+        sub.set_defaults(func=run_presim)
+
+    # postsim
+    postsim = commands.add_parser("postsim", help="Sigrity 리포트에서 결과 추출")
+    postsim_tools = postsim.add_subparsers(dest="tool", required=True)
+    sub = postsim_tools.add_parser("pdc", help="PowerDC 리포트 결과 추출")
+    sub.add_argument("report", help="PowerDC 리포트(.htm)")
+    sub.add_argument("output", help="결과 출력 폴더")
+    sub.add_argument("--parse-mode", choices=PARSE_MODES, default="stream")
+    sub.add_argument("--image-workers", type=int, default=None)
+    sub.add_argument("--thumbnail", type=int, default=None, metavar="PX", help="썸네일 최대 크기")
+    sub.add_argument("--webp", action="store_true", help="WebP 이미지도 저장")
+    sub.add_argument("--excel-backend", choices=EXCEL_BACKENDS, default="auto")
+    sub.add_argument("--board", default=None)
+    sub.add_argument("--revision", default="default")
+    sub.add_argument("--only", nargs="+", default=[], metavar="ARTIFACT", help="만들 결과물 (예 : result_excel images, 없으면 전체)")
+    sub.add_argument("--no-store", action="store_true", help="결과 저장소에 누적하지 않음")
+    sub.add_argument("--no-cache", action="store_true", help="manifest를 무시하고 모든 결과물을 다시 생성")
+    sub.set_defaults(func=run_postsim)
+
+    # batch
+    sub = commands.add_parser("batch", help="여러 보드의 presim / postsim 작업을 병렬로 실행")
+    sub.add_argument("source", help="매니페스트(.json/.csv) 또는 ETL/리포트가 들어있는 폴더")
+    sub.add_argument("-o", "--output", help="폴더 검색 시 결과 저장 폴더")
+    sub.add_argument("-j", "--workers", type=int, default=None)
+    sub.add_argument("--gnd", default="GND")
+    sub.add_argument("--summary", help="결과 요약 JSON 저장 경로")
+    sub.set_defaults(func=run_batch)
+
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    setup_logger(args.log)
+
+    try:
+        return args.func(args)
+    except (ValueError, OSError) as e:
+        # ETL 검증 오류(EtlValidationError), 없는 파일 등 입력 문제는 traceback 없이 종료
+        logger.error(str(e))
+        return 1
+
+
 if __name__ == "__main__":
-    setup_logger()
-
-    # 유저 변수
-    GND_NAME = "GND"
-    ETL_PDC_FILE_PATH = ""
-    ETL_PSI_FILE_PATH = ""
-    TCL_FOLDER_PATH = ""
-    REPORT_FILE_PATH = ""
-    REPORT_FOLDER_PATH = ""
-
-    # 함수 호출
-    PdcPresim(GND_NAME, ETL_PDC_FILE_PATH)
-    PsiPresim(GND_NAME, ETL_PSI_FILE_PATH)
-    pdc_postsim(REPORT_FILE_PATH, REPORT_FOLDER_PATH)
\ No newline at end of file
+    sys.exit(main())
@@ -0,0 +1,107 @@
+import logging
+import threading
+import functools
+from concurrent.futures import ThreadPoolExecutor
+
+logger = logging.getLogger()
+
+
+def artifact(name, requires=()):
+    """
+    단계 메서드를 결과물(artifact) name을 만드는 단계로 등록하는 decorator입니다.
+    호출하면 requires 단계를 먼저 만들고, 인스턴스마다 한 번만 실행합니다. (이후 호출은 처음 반환값을 바로 반환)
+    결과가 인자에 따라 달라지면 memo가 맞지 않으므로 단계 메서드는 인자를 받을 수 없습니다. (TypeError)
+    """
+    def decorate(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            if args or kwargs:
+                raise TypeError(f"{method.__qualname__}()은 결과물 단계이므로 인자를 받지 않습니다.")
+            return self._build_artifact(name, requires, method)
+        wrapper.artifact = name
+        wrapper.requires = tuple(requires)
+        return wrapper
+    return decorate
+
+
+class LazyPipeline:
+    """
+    @artifact 단계들을 필요할 때 한 번만 실행하고 결과를 인스턴스 속성에 보관하는 mixin입니다.
+    compute()로 여러 결과물을 요청하면 서로 의존하지 않는 단계는 스레드에서 동시에 실행합니다.
+    단계 메서드(initialize, generate_*, extract_* 등)를 직접 다시 호출해도 다시 실행되지 않으므로,
+    입력 파일 / 설정을 바꾼 뒤 다시 만들려면 invalidate()로 해당 결과물을 먼저 무효화해야 합니다.
+    """
+    # {artifact 이름: 메서드 이름}, {artifact 이름: requires} (서브클래스마다 자동 생성)
+    artifact_methods = dict()
+    artifact_requires = dict()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.artifact_methods = dict()
+        cls.artifact_requires = dict()
+        for klass in reversed(cls.__mro__):
+            for attr_name, value in vars(klass).items():
+                if hasattr(value, "artifact"):
+                    cls.artifact_methods[value.artifact] = attr_name
+                    cls.artifact_requires[value.artifact] = value.requires
+
+    def _pipeline_state(self):
+        state = self.__dict__.get("_pipeline")
+        if state is None:
+            state = self.__dict__.setdefault("_pipeline", {"done": set(), "values": dict(), "locks": dict(), "lock": threading.Lock()})
+        return state
+
+    def _build_artifact(self, name, requires, method):
+        state = self._pipeline_state()
+        if name in state["done"]:
+            return state["values"].get(name)
+        with state["lock"]:
+            lock = state["locks"].setdefault(name, threading.RLock())
+        with lock:
+            if name in state["done"]:
+                return state["values"].get(name)
+            for required in requires:
+                getattr(self, self.artifact_methods[required])()
+            value = state["values"][name] = method(self)
+            state["done"].add(name)
+        return value
+
+    def is_computed(self, name):
+        return name in self._pipeline_state()["done"]
+
+    def compute(self, *names, max_workers=None):
+        """
+        names(없으면 전체) 결과물을 만듭니다. 2개 이상이면 스레드 풀에서 동시에 실행하며,
+        공통 의존 단계는 먼저 요청한 스레드가 한 번만 실행하고 나머지는 완료를 기다립니다.
+        """
+        names = names or tuple(self.artifact_methods)
+        unknown = [name for name in names if name not in self.artifact_methods]
+        if unknown:
+            raise KeyError(f"{self.__class__.__name__}에 없는 결과물입니다 : {', '.join(unknown)} (가능 : {', '.join(self.artifact_methods)})")
+
+        methods = [getattr(self, self.artifact_methods[name]) for name in names]
+        if len(methods) == 1 or max_workers == 1:
+            for method in methods:
+                method()
+            return None
+
+        with ThreadPoolExecutor(max_workers=max_workers or len(methods)) as executor:
+            for future in [executor.submit(method) for method in methods]:
+                future.result()
+        return None
+
+    def invalidate(self, *names):
+        """
+        names(없으면 전체)와 이를 필요로 하는 결과물을 다시 계산하도록 표시합니다.
+        """
+        state = self._pipeline_state()
+        stale = set(names or self.artifact_methods)
+        changed = True
+        while changed:
+            dependents = {name for name, requires in self.artifact_requires.items() if stale & set(requires)}
+            changed = not dependents <= stale
+            stale |= dependents
+        state["done"] -= stale
+        for name in stale:
+            state["values"].pop(name, None)
+        return None
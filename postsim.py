@@ -1,72 +1,360 @@
 import os
-import inspect
-import base64
+import re
+import binascii
 import logging
+import threading
+import numpy as np
 import pandas as pd
-import xlwings as xw
-from bs4 import BeautifulSoup
-from PIL import Image
 from io import BytesIO, StringIO
+from urllib.parse import unquote_to_bytes
+from concurrent.futures import ThreadPoolExecutor
+from report_parser import PDC_REPORT_SECTIONS, SPAN_PREFIX, parse_report, parse_data_url_header
+from results_store import RESULTS_STORE, run_id
+from touchstone import read_self_impedance
+from postsim_cache import PostsimManifest, fingerprint, hash_stream
+from instrumentation import instrumented, annotate
+from pipeline import LazyPipeline, artifact
 
-logger = logging.getLoggger(__name__)
+logger = logging.getLogger(__name__)
 
-# PowerDC
-class pdc_postsim:
-    def __init__(self, REPORT_FILE_PATH, OUTPUT_FOLDER_PATH):
-        # 상수
-        self.report_file_path = os.path.normpath(REPORT_FILE_PATH)
-        self.output_folder_path = os.path.normpath(OUTPUT_FOLDER_PATH)
-        self.output_pic_folder_path = os.path.normpath(os.path.join(self.output_folder_path, "pics"))
-        self.output_excel_file_path = os.path.normpath(os.path.join(self.output_folder_path, f"{os.path.basename(self.report_file_path).split(".")[0]}_PDC_Result.xlsx"))
+# 무거운 의존성(openpyxl, bs4, PIL, matplotlib, xlwings)은 사용하는 단계에서만 불러옴 (CLI 시작 시간 단축)
+# xlwings는 Windows + Excel 환경에서만 사용하는 선택 백엔드
+def _xlwings():
+    try:
+        import xlwings as xw
+    except ImportError:
+        raise RuntimeError("xlwings를 사용할 수 없습니다. (Windows + Excel 필요)") from None
+    return xw
 
-        # 변수
-        self.report = None
 
-        # 함수
-        self.initialize()
-        self.extract_excel()
-        self.extract_images()
+# matplotlib는 임피던스 그래프 출력 시에만 사용하는 선택 의존성 (없으면 None)
+def _pyplot():
+    try:
+        import matplotlib
+    except ImportError:
+        return None
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    return plt
 
-    def initialize(self):
-        logger.info(f"{self.__class__.__name__} : {inspect.currentframe().f_code.co_name} 실행 중")
 
-        os.makedirs(self.output_folder_path, exist_ok=True)
-        os.makedirs(self.output_pic_folder_path, exist_ok=True)
+# 리포트 파싱 모드
+#   stream : 필요한 섹션만 트리로 만들고 이미지 payload는 파일 위치(span)로만 보관
+#   full   : 리포트 전체를 BeautifulSoup 트리로 파싱 (기존 방식)
+_PARSE_MODES = ("stream", "full")
 
-        with open(self.report_file_path, "r", encoding="utf-8") as f:
-            raw_report = f.read()
-        self.report = BeautifulSoup(raw_report, "html.parser")
+# 이미지 base64 decode 단위 (4의 배수)
+_IMAGE_DECODE_CHUNK_SIZE = 1024 * 1024
 
-        logger.info(f"{self.__class__.__name__} : {inspect.currentframe().f_code.co_name} 완료")
-        return None
+# 추출 이미지 저장 형식 (이 형식의 payload는 재인코딩 없이 decode 결과를 그대로 저장)
+_IMAGE_SAVE_MIME = "image/png"
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
 
-    def extract_excel(self):
-        logger.info(f"{self.__class__.__name__} : {inspect.currentframe().f_code.co_name} 실행 중")
+# base64 payload 안의 줄바꿈/공백
+_BASE64_WHITESPACE = b" \t\r\n"
 
-        # Table 데이터 추출
-        table_setups = self.report.select("#ElectricalSetup table")
-        table_setup = str(table_setups[2])
-        df_setup = pd.read_html(StringIO(table_setup), header=0)[0]
+# 결과물 지문(fingerprint)에 포함하는 추출 방식 버전 (표 / 엑셀 / 이미지 생성 방식이 바뀌면 올려서 캐시 무효화)
+_POSTSIM_CACHE_VERSION = 1
 
-        table_results = self.report.select("#ElectricalResultsTable table")
-        table_result = str(table_results[2])
-        df_result = pd.read_html(StringIO(table_result), header=0)[0]
+# 결과 표를 만드는 리포트 섹션
+_TABLE_SECTIONS = ("ElectricalSetup", "ElectricalResultsTable")
 
-        common_columns = df_setup.columns.intersection(df_result.columns)
-        df_merged = pd.merge(df_setup, df_result, on=list(common_columns), how="inner")
+# 스레드별로 재사용하는 읽기 버퍼
+_decode_buffers = threading.local()
 
-        df_new = df_merged.iloc[:, [1, 0, 2, 5, 14, 15, 16]].reset_index(drop=True)
-        df_new[df_new.columns[0]] = df_new[df_new.columns[0]].str.replace("SINK_", "")
-        df_new[df_new.columns[2]] = df_new[df_new.columns[2]].astype(str).str.split("-").str[0]
 
-        # 엑셀 파일로 내보내기
-        app = xw.App(visible=False)
+def _open_payload(source):
+    """
+    source(data URL 문자열 또는 (리포트 경로, DataSpan))에서 (mime, base64 여부, payload 길이, 파일 객체)를 반환합니다.
+    """
+    if isinstance(source, str):
+        header, _, payload = source.partition(",")
+        mime, is_base64 = parse_data_url_header(header.encode())
+        payload = payload.encode()
+        return mime, is_base64, len(payload), BytesIO(payload)
+
+    report_file_path, span = source
+    f = open(report_file_path, "rb")
+    f.seek(span.start)
+    return span.mime, span.base64, span.end - span.start, f
+
+
+def _hash_payload(source):
+    # 이미지 payload 원문(base64 decode 전) 해시
+    mime, is_base64, length, f = _open_payload(source)
+    with f:
+        return fingerprint(mime, is_base64, hash_stream(f, length))
+
+
+def _image_outputs(save_path, thumbnail_size=None, webp=False):
+    # 이미지 1개로 만드는 파일 목록
+    stem = os.path.splitext(save_path)[0]
+    return [save_path] + ([f"{stem}.webp"] if webp else []) + ([f"{stem}_thumb.png"] if thumbnail_size else [])
+
+
+def _decode_payload(f, length, write):
+    """
+    base64 payload를 고정 크기 버퍼로 length 바이트만큼 읽어 decode 결과를 write로 넘기고 decode된 바이트 수를 반환합니다.
+    """
+    buffer = getattr(_decode_buffers, "buffer", None)
+    if buffer is None:
+        buffer = _decode_buffers.buffer = bytearray(_IMAGE_DECODE_CHUNK_SIZE)
+    view = memoryview(buffer)
+
+    carry = b""
+    decoded = 0
+    while length > 0:
+        n = f.readinto(view[:min(length, len(view))])
+        if not n:
+            break
+        length -= n
+        data = carry + view[:n].tobytes().translate(None, _BASE64_WHITESPACE)
+        usable = len(data) - len(data) % 4
+        decoded += write(binascii.a2b_base64(data[:usable]))
+        carry = data[usable:]
+    if carry:
+        decoded += write(binascii.a2b_base64(carry))
+    return decoded
+
+
+def _write_png_payload(f, length, save_path):
+    """
+    base64 PNG payload를 decode하여 save_path에 그대로 쓰고 decode된 바이트 수를 반환합니다.
+    첫 decode 결과로 PNG 시그니처를 확인한 뒤에 파일을 엽니다.
+    """
+    out = None
+    head = b""
+
+    def _write(chunk):
+        nonlocal out, head
+        size = len(chunk)
+        if out is None:
+            head += chunk
+            if len(head) < len(_PNG_SIGNATURE):
+                return size
+            if not head.startswith(_PNG_SIGNATURE):
+                raise ValueError("PNG 데이터가 아닙니다")
+            out = open(save_path, "wb")
+            chunk = head
+        out.write(chunk)
+        return size
+
+    try:
+        decoded = _decode_payload(f, length, _write)
+        if out is None:
+            raise ValueError("PNG 데이터가 아닙니다")
+    finally:
+        if out is not None:
+            out.close()
+    return decoded
+
+
+def _extract_image(source, save_path, thumbnail_size=None, webp=False):
+    """
+    이미지 1개를 save_path(PNG)로 저장하고 결과 정보를 반환합니다. (작업 스레드에서 실행되며 예외는 결과로 반환)
+    payload가 PNG면 decode 결과를 바로 파일에 쓰고, 다른 형식이면 미리 할당한 버퍼에 decode한 뒤 PIL로 변환합니다.
+    thumbnail_size / webp가 주어지면 저장한 이미지로 썸네일({이름}_thumb.png)과 WebP({이름}.webp)도 만듭니다.
+    실패하면 쓰다 만 파일이 남지 않도록 이 이미지의 출력 파일을 모두 지웁니다.
+    """
+    result = {"save_path": save_path, "mime": None, "bytes": 0, "converted": False, "error": ""}
+    try:
+        from PIL import Image
+
+        mime, is_base64, length, f = _open_payload(source)
+        result["mime"] = mime
+        with f:
+            if is_base64 and mime == _IMAGE_SAVE_MIME:
+                result["bytes"] = _write_png_payload(f, length, save_path)
+            else:
+                if is_base64:
+                    image_data = bytearray(length * 3 // 4)
+                    position = 0
+
+                    def _write(chunk):
+                        nonlocal position
+                        image_data[position:position + len(chunk)] = chunk
+                        position += len(chunk)
+                        return len(chunk)
+
+                    result["bytes"] = _decode_payload(f, length, _write)
+                    image_data = memoryview(image_data)[:position]
+                else:
+                    image_data = unquote_to_bytes(f.read(length))
+                    result["bytes"] = len(image_data)
+                with Image.open(BytesIO(image_data)) as image:
+                    image.save(save_path, "PNG")
+                result["converted"] = True
+
+        if thumbnail_size or webp:
+            stem = os.path.splitext(save_path)[0]
+            with Image.open(save_path) as image:
+                if webp:
+                    image.save(f"{stem}.webp", "WEBP")
+                if thumbnail_size:
+                    image.thumbnail(thumbnail_size)
+                    image.save(f"{stem}_thumb.png", "PNG")
+    except Exception as e:
+        result["error"] = f"{type(e).__name__}: {e}"
+        for path in _image_outputs(save_path, thumbnail_size, webp):
+            if os.path.exists(path):
+                os.remove(path)
+    return result
+
+
+def _extract_images(jobs, max_workers=None, thumbnail_size=None, webp=False):
+    """
+    jobs([(source, save_path)])를 스레드 풀에서 병렬로 추출합니다.
+    (decode / 파일 쓰기 / PIL 변환은 대부분 GIL을 놓으므로 프로세스 없이 병렬화)
+    """
+    if max_workers is None:
+        max_workers = min(len(jobs), os.cpu_count() or 1)
+
+    sources = [source for source, _ in jobs]
+    save_paths = [save_path for _, save_path in jobs]
+    thumbnail_sizes = [thumbnail_size] * len(jobs)
+    webps = [webp] * len(jobs)
+    if max_workers > 1 and len(jobs) > 1:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(_extract_image, sources, save_paths, thumbnail_sizes, webps))
+    return list(map(_extract_image, sources, save_paths, thumbnail_sizes, webps))
+
+
+# 결과 엑셀 서식
+_RESULT_FONT_NAME = "현대하모니 M"
+_RESULT_FONT_SIZE = 16
+_RESULT_HEADER_COLOR = "CCFF99"
+_RESULT_FAIL_COLOR = "FFCCCC"
+_RESULT_FAIL_FONT_COLOR = "FF0000"
+_RESULT_PASS_FAIL_COLUMN = 5          # F열
+_RESULT_MERGE_COLUMN = 0              # A열 (refdes)
+
+# 동아시아 문자(한글 등)는 열 너비를 2칸으로 계산
+_WIDE_CHAR_PATTERN = r"[\u1100-\u115f\u2e80-\ua4cf\uac00-\ud7a3\uf900-\ufaff\ufe30-\ufe4f\uff00-\uff60\uffe0-\uffe6]"
+
+# Excel "일반" 서식에서 숫자가 표시되는 최대 글자 수
+_GENERAL_NUMBER_MAX_CHARS = 11
+
+
+def _fail_rows(df):
+    """
+    Pass/Fail 열이 "Fail"인 행 위치(0부터)를 반환합니다.
+    """
+    return np.flatnonzero(df.iloc[:, _RESULT_PASS_FAIL_COLUMN].to_numpy() == "Fail")
+
+
+def _merge_ranges(values):
+    """
+    연속으로 같은 값이 이어지는 구간을 [(시작, 끝)] (0부터, 끝 포함, 2행 이상인 구간만)으로 반환합니다.
+    """
+    values = pd.Series(values).astype(object).where(lambda v: v.notna(), None).to_numpy()
+    if len(values) == 0:
+        return []
+    starts = np.flatnonzero(np.r_[True, values[1:] != values[:-1]])
+    ends = np.r_[starts[1:], len(values)] - 1
+    merged = ends > starts
+    return list(zip(starts[merged].tolist(), ends[merged].tolist()))
+
+
+def _column_widths(df):
+    """
+    Excel AutoFit과 비슷하게 헤더/값의 표시 길이와 글꼴 크기로 열 너비를 계산합니다.
+    """
+    widths = []
+    for column in df.columns:
+        values = df[column]
+        text = values.astype(str).where(values.notna(), "")
+        lengths = text.str.len() + text.str.count(_WIDE_CHAR_PATTERN)
+        if pd.api.types.is_numeric_dtype(values):
+            lengths = lengths.clip(upper=_GENERAL_NUMBER_MAX_CHARS)
+        header = str(column)
+        header_length = len(header) + len(re.findall(_WIDE_CHAR_PATTERN, header))
+        length = max(header_length, int(lengths.max()) if len(lengths) else 0)
+        widths.append(length * _RESULT_FONT_SIZE / 11 + 2)
+    return widths
+
+
+# 결과 엑셀 쓰기 백엔드 : openpyxl (Excel 없이 xlsx 파일 직접 생성)
+def _write_result_openpyxl(df, excel_file_path):
+    """
+    Fail 행 / refdes 병합 구간 / 열 너비를 DataFrame에서 한 번에 계산한 뒤 write-only 모드로 한 번에 씁니다.
+    """
+    import openpyxl
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import Border, Font, NamedStyle, PatternFill, Side
+    from openpyxl.utils import get_column_letter
+    from openpyxl.worksheet.cell_range import CellRange, MultiCellRange
+
+    wb = openpyxl.Workbook(write_only=True)
+    ws = wb.create_sheet("Sheet1")
+
+    side = Side(style="thin")
+    border = Border(left=side, right=side, top=side, bottom=side)
+    font = Font(name=_RESULT_FONT_NAME, size=_RESULT_FONT_SIZE)
+    styles = [
+        NamedStyle("result_header", font=font, border=border, fill=PatternFill("solid", fgColor=_RESULT_HEADER_COLOR)),
+        NamedStyle("result_data", font=font, border=border),
+        NamedStyle(
+            "result_fail",
+            font=Font(name=_RESULT_FONT_NAME, size=_RESULT_FONT_SIZE, color=_RESULT_FAIL_FONT_COLOR),
+            border=border,
+            fill=PatternFill("solid", fgColor=_RESULT_FAIL_COLOR)
+        ),
+    ]
+    for style in styles:
+        wb.add_named_style(style)
+
+    for j, width in enumerate(_column_widths(df)):
+        ws.column_dimensions[get_column_letter(j + 1)].width = width
+
+    # 병합 범위 (병합된 아래쪽 셀은 Excel과 동일하게 값을 비움)
+    merge_ranges = _merge_ranges(df.iloc[:, _RESULT_MERGE_COLUMN])
+    covered = np.zeros(len(df), dtype=bool)
+    for start, end in merge_ranges:
+        covered[start + 1:end + 1] = True
+    merge_column = _RESULT_MERGE_COLUMN + 1
+    ws.merged_cells = MultiCellRange([
+        CellRange(min_col=merge_column, min_row=start + 2, max_col=merge_column, max_row=end + 2)
+        for start, end in merge_ranges
+    ])
+
+    row_styles = np.full(len(df), "result_data", dtype=object)
+    row_styles[_fail_rows(df)] = "result_fail"
+
+    # 서식이 적용된 셀을 서식별로 하나씩 만들어 값만 바꿔가며 씀 (append 시점에 바로 직렬화됨)
+    template_cells = dict()
+    for style in ("result_header", "result_data", "result_fail"):
+        template_cells[style] = [WriteOnlyCell(ws) for _ in df.columns]
+        for cell in template_cells[style]:
+            cell.style = style
+
+    def _append(values, style):
+        cells = template_cells[style]
+        for cell, value in zip(cells, values):
+            cell.value = value
+        ws.append(cells)
+
+    _append(df.columns.tolist(), "result_header")
+    values = df.astype(object).where(df.notna(), None).to_numpy()
+    values[covered, _RESULT_MERGE_COLUMN] = None
+    for row, style in zip(values.tolist(), row_styles.tolist()):
+        _append(row, style)
+
+    wb.save(excel_file_path)
+    return None
+
+
+# 결과 엑셀 쓰기 백엔드 : xlwings (Excel COM)
+def _write_result_xlwings(df, excel_file_path):
+    xw = _xlwings()
+
+    app = xw.App(visible=False)
+    try:
         app.display_alerts = False
         app.screen_updating = False
         wb = app.books.add()
         ws = wb.sheets["Sheet1"]
 
-        ws.range("A1").value = [df_new.columns.tolist()] + df_new.values.tolist()
+        ws.range("A1").value = [df.columns.tolist()] + df.values.tolist()
 
         last_row = ws.range("A1").end("down").row
         last_col = ws.range("A1").end("right").column
@@ -77,8 +365,8 @@ class pdc_postsim:
 
         header_range.color = (204, 255, 153)
         data_range.api.Borders.Weight = 2
-        data_range.api.Font.Name = "현대하모니 M"
-        data_range.api.Font.Size = 16
+        data_range.api.Font.Name = _RESULT_FONT_NAME
+        data_range.api.Font.Size = _RESULT_FONT_SIZE
 
         for cell in pass_fail_range:
             if cell.value == "Fail":
@@ -97,37 +385,458 @@ class pdc_postsim:
             prev_value = current_value
 
         ws.range(f"A1:{ws.range((1, last_col)).address}").api.EntireColumn.AutoFit()
-        wb.save(self.output_excel_file_path)
+        wb.save(excel_file_path)
+        wb.close()
+    finally:
+        app.quit()
+    return None
+
+
+_EXCEL_WRITERS = {
+    "openpyxl": _write_result_openpyxl,
+    "xlwings": _write_result_xlwings,
+}
+
+
+def _excel_backend(backend):
+    # auto는 openpyxl (Excel 없이 동작)
+    if backend == "auto":
+        backend = "openpyxl"
+    if backend not in _EXCEL_WRITERS:
+        raise ValueError(f"EXCEL_BACKEND는 auto, {', '.join(_EXCEL_WRITERS)} 중 하나여야 합니다 : {backend}")
+    return backend
+
+
+# PowerDC
+class pdc_postsim(LazyPipeline):
+    """
+    PowerDC 리포트(.htm)에서 표 / 엑셀 / 이미지를 추출합니다.
+    """
+    # 결과물 : report, fingerprint, result_table(df_merged, df_result), result_excel, images(image_results), stored_results
+    # CACHE면 출력 폴더의 manifest({리포트}_PDC_manifest.json)와 지문을 비교해 바뀐 결과물만 다시 만듦
+    def __init__(self, REPORT_FILE_PATH, OUTPUT_FOLDER_PATH, PARSE_MODE="stream", IMAGE_WORKERS=None, THUMBNAIL_SIZE=None, WEBP=False, EXCEL_BACKEND="auto", BOARD=None, REVISION="default", RESULTS_STORE=RESULTS_STORE, CACHE=True, LAZY=False):
+        # 상수
+        self.report_file_path = os.path.normpath(REPORT_FILE_PATH)
+        self.output_folder_path = os.path.normpath(OUTPUT_FOLDER_PATH)
+        self.output_pic_folder_path = os.path.normpath(os.path.join(self.output_folder_path, "pics"))
+        self.output_excel_file_path = os.path.normpath(os.path.join(self.output_folder_path, f"{os.path.basename(self.report_file_path).split(".")[0]}_PDC_Result.xlsx"))
+        if PARSE_MODE not in _PARSE_MODES:
+            raise ValueError(f"PARSE_MODE는 {_PARSE_MODES} 중 하나여야 합니다 : {PARSE_MODE}")
+        self.parse_mode = PARSE_MODE
+        self.image_workers = IMAGE_WORKERS
+        self.thumbnail_size = THUMBNAIL_SIZE
+        self.webp = WEBP
+        self.excel_backend = _excel_backend(EXCEL_BACKEND)
+        self.board = BOARD or os.path.basename(self.report_file_path).split(".")[0]
+        self.revision = REVISION
+        self.results_store = RESULTS_STORE
+        self.manifest = None
+        if CACHE:
+            self.manifest = PostsimManifest(os.path.join(self.output_folder_path, f"{os.path.basename(self.report_file_path).split(".")[0]}_PDC_manifest.json"))
+
+        # 변수
+        self.report = None
+        self.report_spans = []
+        self.fingerprints = None
+        self.table_key = None
+        self.image_results = []
+        self.df_merged = None
+        self.df_result = None
+
+        # 함수 (LAZY면 compute() 또는 각 단계 메서드를 호출할 때 필요한 단계만 실행, 리포트 파싱은 다시 만들 결과물이 있을 때만)
+        if not LAZY:
+            self.fingerprint_report()
+            self.extract_table()
+            self.extract_excel()
+            self.extract_images()
+            self.store_results()
+
+    @artifact("report")
+    @instrumented
+    def initialize(self):
+        os.makedirs(self.output_folder_path, exist_ok=True)
+        os.makedirs(self.output_pic_folder_path, exist_ok=True)
+
+        if self.parse_mode == "stream":
+            self.report, self.report_spans = parse_report(self.report_file_path, PDC_REPORT_SECTIONS)
+        else:
+            with open(self.report_file_path, "r", encoding="utf-8") as f:
+                raw_report = f.read()
+            from bs4 import BeautifulSoup
+            self.report = BeautifulSoup(raw_report, "html.parser")
+        annotate(report_bytes=os.path.getsize(self.report_file_path), data_urls=len(self.report_spans))
 
-        logger.info(f"{self.__class__.__name__} : {inspect.currentframe().f_code.co_name} 완료")
         return None
-    
-    def extract_images(self):
-        logger.info(f"{self.__class__.__name__} : {inspect.currentframe().f_code.co_name} 실행 중")
-
-        # 이미지 decode 후 저장 함수
-        def _save_image_from_data_url(data_url, save_path):
-            try:
-                base64_data = data_url.split(",")[1]
-                image_data = base64.b64decode(base64_data)
-                image = Image.open(BytesIO(image_data))
-                image.save(save_path)
-            except Exception as e:
-                logger.error(f"이미지 추출 실패: {e}")
-
-        # Top/Bottom Layer 사진 추출
+
+    @artifact("fingerprint")
+    @instrumented
+    def fingerprint_report(self):
+        """
+        리포트 내용 해시와 표 섹션별 / 이미지 payload별 지문을 계산합니다.
+        리포트가 manifest에 기록된 것과 같으면 파싱하지 않고 기록된 지문을 사용합니다.
+        """
+        if self.manifest is None:
+            return None
+
+        report_hash = self.manifest.report_hash(self.report_file_path)
+        self.fingerprints = self.manifest.report_fingerprints(report_hash, self.parse_mode)
+        if self.fingerprints is None:
+            self.initialize()
+            self.fingerprints = {
+                "sections": {section: fingerprint(str(self.report.select_one(f"#{section}"))) for section in _TABLE_SECTIONS},
+                "images": {os.path.basename(save_path): _hash_payload(source) for source, save_path in self._image_jobs()}
+            }
+            self.manifest.record_report(self.report_file_path, report_hash, self.parse_mode, self.fingerprints)
+        annotate(parsed=self.report is not None, images=len(self.fingerprints["images"]))
+
+        return None
+
+    @artifact("result_table", requires=["fingerprint"])
+    @instrumented
+    def extract_table(self):
+        self.df_merged = None
+        if self.manifest is not None:
+            self.table_key = fingerprint(_POSTSIM_CACHE_VERSION, self.fingerprints["sections"])
+            self.df_merged = self.manifest.load_frame("result_table", self.table_key)
+
+        if self.df_merged is None:
+            self.initialize()
+
+            # Table 데이터 추출
+            table_setups = self.report.select("#ElectricalSetup table")
+            table_setup = str(table_setups[2])
+            df_setup = pd.read_html(StringIO(table_setup), header=0)[0]
+
+            table_results = self.report.select("#ElectricalResultsTable table")
+            table_result = str(table_results[2])
+            df_result = pd.read_html(StringIO(table_result), header=0)[0]
+
+            common_columns = df_setup.columns.intersection(df_result.columns)
+            df_merged = pd.merge(df_setup, df_result, on=list(common_columns), how="inner")
+            self.df_merged = df_merged
+            if self.manifest is not None:
+                self.manifest.save_frame("result_table", self.table_key, df_merged)
+        else:
+            logger.info(f"표 섹션 변경 없음 : {os.path.basename(self.report_file_path)}")
+
+        df_new = self.df_merged.iloc[:, [1, 0, 2, 5, 14, 15, 16]].reset_index(drop=True)
+        df_new[df_new.columns[0]] = df_new[df_new.columns[0]].str.replace("SINK_", "")
+        df_new[df_new.columns[2]] = df_new[df_new.columns[2]].astype(str).str.split("-").str[0]
+        self.df_result = df_new
+        annotate(rows=len(df_new))
+
+        return None
+
+    @artifact("result_excel", requires=["result_table"])
+    @instrumented
+    def extract_excel(self):
+        key = None
+        if self.manifest is not None:
+            key = fingerprint(self.table_key, self.excel_backend)
+            if self.manifest.entry("result_excel", key, [self.output_excel_file_path]) is not None:
+                logger.info(f"결과 엑셀 변경 없음 : {os.path.basename(self.output_excel_file_path)}")
+                return None
+
+        # 엑셀 파일로 내보내기
+        os.makedirs(self.output_folder_path, exist_ok=True)
+        _EXCEL_WRITERS[self.excel_backend](self.df_result, self.output_excel_file_path)
+        annotate(xlsx_rows=len(self.df_result))
+        if self.manifest is not None:
+            self.manifest.record({"result_excel": {
+                "fingerprint": key, "file": os.path.basename(self.output_excel_file_path),
+                "outputs": self.manifest.stamp([self.output_excel_file_path])
+            }})
+
+        return None
+
+    def _image_jobs(self):
+        """
+        리포트의 이미지마다 (payload 위치, 저장 경로)를 반환합니다.
+        """
+        # 이미지 payload 위치 (stream 모드는 "span:N"을 리포트 파일 위치로 변환)
+        def _image_source(src):
+            if src.startswith(SPAN_PREFIX):
+                return (self.report_file_path, self.report_spans[int(src[len(SPAN_PREFIX):])])
+            return src
+
+        jobs = []
+
+        # Top/Bottom Layer 사진
         for layer in ["ImageLayoutTop", "ImageLayoutBottom"]:
             image_element = self.report.select_one(f"#{layer} img")
             if image_element and "src" in image_element.attrs:
                 save_path = os.path.join(self.output_pic_folder_path, f"{layer}.png")
-                _save_image_from_data_url(image_element["src"], save_path)
+                jobs.append((_image_source(image_element["src"]), save_path))
 
-        # Distribution Plot 사진 추출
+        # Distribution Plot 사진
         image_plots = self.report.select("#DistributionPlot p img")
         for idx, img in enumerate(image_plots):
             if "src" in img.attrs:
                 save_path = os.path.join(self.output_pic_folder_path, f"Layer_{idx+1}.png")
-                _save_image_from_data_url(img["src"], save_path)
+                jobs.append((_image_source(img["src"]), save_path))
+
+        return jobs
+
+    @artifact("images", requires=["fingerprint"])
+    @instrumented
+    def extract_images(self):
+        """
+        CACHE면 payload 지문과 출력 파일(썸네일 / WebP 포함)이 기록과 같은 이미지는 건너뛰고 바뀐 이미지만 decode합니다.
+        """
+        cached = dict()
+        keys = dict()
+        if self.manifest is not None:
+            for name, payload_hash in self.fingerprints["images"].items():
+                save_path = os.path.join(self.output_pic_folder_path, name)
+                keys[name] = fingerprint(_POSTSIM_CACHE_VERSION, payload_hash, self.thumbnail_size, self.webp)
+                entry = self.manifest.entry(f"images/{name}", keys[name], _image_outputs(save_path, self.thumbnail_size, self.webp))
+                if entry is not None:
+                    cached[name] = {"save_path": save_path, **entry["result"], "error": ""}
+
+        jobs = []
+        if self.manifest is None or len(cached) < len(self.fingerprints["images"]):
+            self.initialize()
+            jobs = [(source, save_path) for source, save_path in self._image_jobs() if os.path.basename(save_path) not in cached]
+        extracted = {os.path.basename(result["save_path"]): result for result in _extract_images(jobs, self.image_workers, self.thumbnail_size, self.webp)}
+        names = list(self.fingerprints["images"]) if self.manifest is not None else list(extracted)
+        self.image_results = [cached[name] if name in cached else extracted[name] for name in names]
+
+        for result in self.image_results:
+            if result["error"]:
+                logger.error(f"이미지 추출 실패: {os.path.basename(result['save_path'])} - {result['error']}")
+        if self.manifest is not None and extracted:
+            self.manifest.record({
+                f"images/{name}": {
+                    "fingerprint": keys[name], "result": {key: result[key] for key in ("mime", "bytes", "converted")},
+                    "outputs": self.manifest.stamp(_image_outputs(result["save_path"], self.thumbnail_size, self.webp))
+                }
+                for name, result in extracted.items() if not result["error"] and name in keys
+            })
+        annotate(images=len(self.image_results), cached_images=len(cached), image_bytes=sum(result["bytes"] for result in extracted.values()))
+
+        return None
+
+    @artifact("stored_results", requires=["result_table"])
+    @instrumented
+    def store_results(self):
+        """
+        df_merged를 결과 저장소에 누적합니다. run은 리포트 파일 수정 시각이므로 같은 리포트를 다시 처리하면 덮어씁니다.
+        """
+        if self.results_store is not None:
+            run = run_id(os.path.getmtime(self.report_file_path))
+            key = None
+            if self.manifest is not None:
+                key = fingerprint(self.table_key, str(self.results_store.root_dir), self.board, self.revision, run)
+                entry = self.manifest.data["artifacts"].get("stored_results")
+                if entry is not None and self.manifest.entry("stored_results", key, [entry["file"]]) is not None:
+                    logger.info(f"결과 저장 변경 없음 : {self.board} / {self.revision} / {run}")
+                    return None
+            partition_dir = self.results_store.append(self.df_merged, self.board, self.revision, run)
+            if self.manifest is not None:
+                stored_path = partition_dir / "result.parquet"
+                self.manifest.record({"stored_results": {"fingerprint": key, "file": str(stored_path), "outputs": self.manifest.stamp([stored_path])}})
+
+        return None
+
+
+# 임피던스 결과 테이블 컬럼 (Pass/Fail 위치는 결과 엑셀 서식과 동일하게 F열)
+_IMPEDANCE_COLUMNS = ["Net", "Port", "Worst Frequency (MHz)", "|Z| (mOhm)", "Target (mOhm)", "Pass/Fail", "Margin (%)"]
+
+# PsiPresim 포트 이름 : VRM_{refdes}_{net} (sink는 _P{n} 추가)
+_PORT_NUMBER_SUFFIX = r"_P\d+$"
+
+# 파일 이름에 쓸 수 없는 문자 (경로 구분자 / Windows 예약 문자 / 제어 문자)
+_UNSAFE_FILE_CHARS = re.compile(r'[\\/:*?"<>|\x00-\x1f]')
+
+# Windows 예약 장치 이름
+_RESERVED_FILE_NAMES = {"CON", "PRN", "AUX", "NUL", *(f"COM{i}" for i in range(1, 10)), *(f"LPT{i}" for i in range(1, 10))}
+
+
+def _safe_file_name(name):
+    """
+    net 이름을 파일 이름으로 쓸 수 있게 바꿉니다. (쓸 수 없는 문자는 "_", 예약 이름은 앞에 "_" 추가)
+    """
+    name = _UNSAFE_FILE_CHARS.sub("_", str(name)).rstrip(" .") or "_"
+    if name.split(".", 1)[0].upper() in _RESERVED_FILE_NAMES:
+        name = f"_{name}"
+    return name
+
+
+def _load_targets(targets):
+    """
+    목표 임피던스를 {net: (frequencies, impedances)}로 변환합니다.
+    targets는 {net: 옴 값 또는 [(주파수 Hz, 옴), ...]} 또는 net, frequency, impedance 컬럼을 가진 CSV 경로입니다.
+    """
+    if isinstance(targets, (str, os.PathLike)):
+        df = pd.read_csv(targets)
+        return {
+            str(net): (group["frequency"].to_numpy(float), group["impedance"].to_numpy(float))
+            for net, group in df.sort_values(["net", "frequency"]).groupby("net", sort=False)
+        }
+
+    masks = dict()
+    for net, target in targets.items():
+        if np.ndim(target) == 0:
+            masks[net] = (np.array([0.0, np.inf]), np.array([float(target), float(target)]))
+        else:
+            points = np.asarray(sorted(target), dtype=float)
+            masks[net] = (points[:, 0], points[:, 1])
+    return masks
+
+
+def _port_nets(port_names, nets):
+    """
+    포트 이름 끝(_P{n} 제외)이 "_{net}"인 net을 찾습니다. 여러 개면 가장 긴 net, 없으면 None.
+    """
+    names = pd.Series(port_names, dtype=object).str.replace(_PORT_NUMBER_SUFFIX, "", regex=True)
+    matched = pd.Series([None] * len(names), index=names.index, dtype=object)
+    for net in sorted(nets, key=len):
+        matched[names.str.endswith(f"_{net}")] = net
+    return matched.tolist()
+
+
+def _target_matrix(frequencies, masks, port_nets):
+    """
+    각 포트의 목표 임피던스를 (주파수, 포트) 행렬로 만듭니다. 마스크 구간 밖이나 net이 없는 포트는 NaN입니다.
+    마스크 점 사이는 log-log 보간합니다.
+    """
+    nets = list(masks)
+    curves = np.full((len(frequencies), len(nets) + 1), np.nan)
+    log_frequencies = np.log10(np.maximum(frequencies, np.finfo(float).tiny))
+    for j, net in enumerate(nets):
+        mask_frequencies, mask_impedances = masks[net]
+        inside = (frequencies >= mask_frequencies[0]) & (frequencies <= mask_frequencies[-1])
+        if np.isinf(mask_frequencies[-1]):
+            curves[inside, j] = mask_impedances[0]
+            continue
+        log_mask = np.log10(np.maximum(mask_frequencies, np.finfo(float).tiny))
+        curves[inside, j] = 10 ** np.interp(log_frequencies[inside], log_mask, np.log10(mask_impedances))
+    net_index = np.array([nets.index(net) if net in masks else len(nets) for net in port_nets], dtype=int)
+    return curves[:, net_index]
+
+
+def _analyze_impedance(frequencies, z_self, port_names, port_nets, masks):
+    """
+    |Zii| / 목표값이 가장 큰 주파수를 포트별로 찾아 Pass/Fail 테이블을 만듭니다. (모든 포트 / 주파수를 한 번에 계산)
+    목표가 없는 포트는 |Z|가 가장 큰 점을 기록하고 Pass/Fail은 "N/A"로 둡니다.
+    """
+    magnitude = np.abs(z_self)
+    target = _target_matrix(frequencies, masks, port_nets)
+    ratio = magnitude / target
+
+    has_target = ~np.isnan(ratio).all(axis=0)
+    worst = np.where(
+        has_target,
+        np.where(np.isnan(ratio), -np.inf, ratio).argmax(axis=0),
+        magnitude.argmax(axis=0)
+    )
+    ports = np.arange(len(port_names))
+    worst_magnitude = magnitude[worst, ports]
+    worst_target = target[worst, ports]
+
+    df = pd.DataFrame({
+        "Net": port_nets,
+        "Port": port_names,
+        "Worst Frequency (MHz)": frequencies[worst] / 1e6,
+        "|Z| (mOhm)": worst_magnitude * 1e3,
+        "Target (mOhm)": worst_target * 1e3,
+        "Pass/Fail": np.where(~has_target, "N/A", np.where(worst_magnitude <= worst_target, "Pass", "Fail")),
+        "Margin (%)": (worst_target - worst_magnitude) / worst_target * 100,
+    }, columns=_IMPEDANCE_COLUMNS)
+    return df.sort_values(["Net", "Port"], kind="stable", na_position="last", ignore_index=True)
+
+
+# PowerSI
+class psi_postsim(LazyPipeline):
+    """
+    PowerSI touchstone 파일에서 임피던스 표 / 엑셀 / 그래프를 추출합니다.
+    """
+    # 결과물 : impedance(frequencies, z_self), analysis(df_impedance), result_excel, plots
+    def __init__(self, TOUCHSTONE_FILE_PATH, OUTPUT_FOLDER_PATH, TARGETS, PORT_NETS=None, PLOT=True, EXCEL_BACKEND="auto", LAZY=False):
+        # 상수
+        self.touchstone_file_path = os.path.normpath(TOUCHSTONE_FILE_PATH)
+        self.output_folder_path = os.path.normpath(OUTPUT_FOLDER_PATH)
+        self.output_plot_folder_path = os.path.normpath(os.path.join(self.output_folder_path, "plots"))
+        self.output_excel_file_path = os.path.normpath(os.path.join(self.output_folder_path, f"{os.path.basename(self.touchstone_file_path).split(".")[0]}_PSI_Result.xlsx"))
+        self.targets = TARGETS
+        self.port_nets = PORT_NETS
+        self.plot = PLOT
+        self.excel_backend = _excel_backend(EXCEL_BACKEND)
+
+        # 변수
+        self.frequencies = None
+        self.z_self = None
+        self.port_names = []
+        self.masks = dict()
+        self.df_impedance = None
+
+        # 함수 (LAZY면 compute() 또는 각 단계 메서드를 호출할 때 필요한 단계만 실행)
+        if not LAZY:
+            self.initialize()
+            self.analyze_impedance()
+            self.extract_excel()
+            self.extract_plots()
+
+    @artifact("impedance")
+    @instrumented
+    def initialize(self):
+        os.makedirs(self.output_folder_path, exist_ok=True)
+
+        self.frequencies, self.z_self, self.port_names = read_self_impedance(self.touchstone_file_path)
+        self.masks = _load_targets(self.targets)
+        if self.port_nets is None:
+            self.port_nets = _port_nets(self.port_names, self.masks)
+        elif isinstance(self.port_nets, dict):
+            self.port_nets = [self.port_nets.get(port) for port in self.port_names]
+        annotate(touchstone_bytes=os.path.getsize(self.touchstone_file_path), ports=len(self.port_names), frequencies=len(self.frequencies))
+
+        return None
+
+    @artifact("analysis", requires=["impedance"])
+    @instrumented
+    def analyze_impedance(self):
+        self.df_impedance = _analyze_impedance(self.frequencies, self.z_self, self.port_names, self.port_nets, self.masks)
+
+        counts = self.df_impedance["Pass/Fail"].value_counts()
+        logger.info(f"임피던스 판정 : Pass {counts.get('Pass', 0)}, Fail {counts.get('Fail', 0)}, N/A {counts.get('N/A', 0)}")
+        return None
+
+    @artifact("result_excel", requires=["analysis"])
+    @instrumented
+    def extract_excel(self):
+        _EXCEL_WRITERS[self.excel_backend](self.df_impedance.round(4), self.output_excel_file_path)
+        annotate(xlsx_rows=len(self.df_impedance))
+
+        return None
+
+    @artifact("plots", requires=["impedance"])
+    @instrumented
+    def extract_plots(self):
+        """
+        net별로 포트의 |Z|와 목표 임피던스를 log-log 그래프(plots/{net}.png)로 저장합니다.
+        """
+        if not self.plot:
+            return None
+        plt = _pyplot()
+        if plt is None:
+            logger.warning("matplotlib가 없어 임피던스 그래프를 생략합니다.")
+            return None
+
+        os.makedirs(self.output_plot_folder_path, exist_ok=True)
+        port_nets = np.array(self.port_nets, dtype=object)
+        for net in dict.fromkeys(net for net in self.port_nets if net is not None):
+            columns = np.flatnonzero(port_nets == net)
+            fig, ax = plt.subplots(figsize=(10, 6))
+            ax.loglog(self.frequencies, np.abs(self.z_self[:, columns]) * 1e3, linewidth=0.8)
+            if net in self.masks:
+                target = _target_matrix(self.frequencies, self.masks, [net])[:, 0]
+                ax.loglog(self.frequencies, target * 1e3, "r--", linewidth=1.5, label="Target")
+                ax.legend()
+            ax.set_title(net)
+            ax.set_xlabel("Frequency (Hz)")
+            ax.set_ylabel("|Z| (mOhm)")
+            ax.grid(True, which="both", alpha=0.3)
+            fig.savefig(os.path.join(self.output_plot_folder_path, f"{_safe_file_name(net)}.png"), dpi=120, bbox_inches="tight")
+            plt.close(fig)
 
-        logger.info(f"{self.__class__.__name__} : {inspect.currentframe().f_code.co_name} 완료")
         return None
\ No newline at end of file
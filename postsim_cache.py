@@ -0,0 +1,166 @@
+import os
+import json
+import hashlib
+import logging
+import threading
+from pathlib import Path
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger()
+
+# manifest 형식 버전 (형식이 바뀌면 올려서 기존 manifest를 무시)
+_MANIFEST_VERSION = 2
+
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def fingerprint(*parts):
+    """
+    parts(문자열 / 숫자 / None / 리스트 / dict)를 JSON으로 직렬화한 sha256 해시를 반환합니다.
+    """
+    return hashlib.sha256(json.dumps(parts, sort_keys=True, ensure_ascii=False, default=str).encode("utf-8")).hexdigest()
+
+
+def hash_stream(f, length=None, digest=None):
+    """
+    파일 객체 f에서 length 바이트(없으면 끝까지)를 고정 크기 단위로 읽어 sha256 해시를 반환합니다.
+    """
+    digest = digest or hashlib.sha256()
+    while length is None or length > 0:
+        chunk = f.read(_HASH_CHUNK_SIZE if length is None else min(length, _HASH_CHUNK_SIZE))
+        if not chunk:
+            break
+        digest.update(chunk)
+        if length is not None:
+            length -= len(chunk)
+    return digest.hexdigest()
+
+
+class PostsimManifest:
+    """
+    postsim 출력 폴더의 manifest(.json)에 리포트 지문과 결과물별 입력 지문(fingerprint)을 기록합니다.
+    결과물의 입력 지문이 기록과 같고 출력 파일의 크기 / 수정 시각이 기록(outputs)과 모두 같으면 다시 만들지 않아도 됩니다.
+    (출력 파일을 지우거나 덮어쓰면 다시 생성)
+    리포트는 크기 / 수정 시각이 기록과 같으면 내용을 다시 해시하지 않습니다.
+    """
+    def __init__(self, manifest_path):
+        # 상수
+        self.manifest_path = Path(manifest_path)
+        self.cache_folder_path = self.manifest_path.parent / ".cache"
+
+        # 변수
+        self.lock = threading.Lock()
+        self.data = self._load()
+
+    def _load(self):
+        try:
+            with open(self.manifest_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") == _MANIFEST_VERSION:
+                return data
+        except (OSError, ValueError):
+            pass
+        return {"version": _MANIFEST_VERSION, "report": None, "fingerprints": None, "artifacts": dict()}
+
+    def save(self):
+        self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.manifest_path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.data, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.manifest_path)
+        return None
+
+    def report_hash(self, report_file_path):
+        stat = os.stat(report_file_path)
+        recorded = self.data["report"]
+        if recorded and recorded["size"] == stat.st_size and recorded["mtime_ns"] == stat.st_mtime_ns:
+            return recorded["sha256"]
+        with open(report_file_path, "rb") as f:
+            return hash_stream(f)
+
+    def report_fingerprints(self, report_hash, parse_mode):
+        """
+        리포트 내용과 파싱 모드가 기록과 같으면 기록된 지문(섹션 / 이미지)을, 아니면 None을 반환합니다.
+        """
+        recorded = self.data["report"]
+        if recorded and recorded["sha256"] == report_hash and recorded["parse_mode"] == parse_mode:
+            return self.data["fingerprints"]
+        return None
+
+    def record_report(self, report_file_path, report_hash, parse_mode, fingerprints):
+        stat = os.stat(report_file_path)
+        with self.lock:
+            self.data["report"] = {
+                "path": str(report_file_path), "size": stat.st_size, "mtime_ns": stat.st_mtime_ns,
+                "sha256": report_hash, "parse_mode": parse_mode
+            }
+            self.data["fingerprints"] = fingerprints
+            self.save()
+        return None
+
+    @staticmethod
+    def stamp(files):
+        """
+        출력 파일들의 {경로: [크기, 수정 시각(ns)]}를 반환합니다. (record 시 결과물 기록의 "outputs"로 저장)
+        """
+        stamps = dict()
+        for path in files:
+            stat = os.stat(path)
+            stamps[str(path)] = [stat.st_size, stat.st_mtime_ns]
+        return stamps
+
+    def entry(self, name, key, files=()):
+        """
+        결과물 name의 기록이 입력 지문 key와 같고 files의 크기 / 수정 시각이 기록과 모두 같으면 기록(dict)을, 아니면 None을 반환합니다.
+        """
+        entry = self.data["artifacts"].get(name)
+        if entry is None or entry["fingerprint"] != key:
+            return None
+        recorded = entry.get("outputs", dict())
+        try:
+            if any(recorded.get(str(path)) != stamp for path, stamp in self.stamp(files).items()):
+                return None
+        except OSError:
+            return None
+        return entry
+
+    def record(self, entries):
+        """
+        {결과물 이름: {"fingerprint": 입력 지문, "outputs": stamp(출력 파일), ...}} 기록을 한 번에 갱신하고 저장합니다.
+        """
+        with self.lock:
+            self.data["artifacts"].update(entries)
+            self.save()
+        return None
+
+    # DataFrame 결과물 (.cache 폴더에 feather로 보관)
+    def load_frame(self, name, key):
+        entry = self.data["artifacts"].get(name)
+        path = self.cache_folder_path / entry["file"] if entry is not None else None
+        if path is None or self.entry(name, key, [path]) is None:
+            return None
+        try:
+            df = pd.read_feather(path)
+        except Exception as e:
+            logger.warning(f"postsim 캐시를 읽을 수 없습니다 : {name} ({e})")
+            return None
+        # 문자열 컬럼의 빈 값은 새로 만든 표와 같게 None -> NaN
+        for column in df.columns[df.dtypes == object]:
+            df[column] = df[column].where(df[column].notna(), np.nan)
+        return df
+
+    def save_frame(self, name, key, df):
+        self.cache_folder_path.mkdir(parents=True, exist_ok=True)
+        file_name = f"{self.manifest_path.stem}_{name}.feather"
+        tmp_path = self.cache_folder_path / f"{file_name}.tmp"
+        try:
+            df.reset_index(drop=True).to_feather(tmp_path)
+        except Exception as e:
+            # 컬럼 이름이 문자열이 아니거나 한 컬럼에 여러 타입이 섞인 표 등은 캐시하지 않음
+            logger.warning(f"postsim 캐시를 저장할 수 없습니다 : {name} ({e})")
+            Path(tmp_path).unlink(missing_ok=True)
+            return None
+        os.replace(tmp_path, self.cache_folder_path / file_name)
+        self.record({name: {"fingerprint": key, "file": file_name, "outputs": self.stamp([self.cache_folder_path / file_name])}})
+        return None
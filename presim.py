@@ -1,389 +1,1238 @@
-import xlwings as xw
+import os
+import json
+import shutil
+import hashlib
+import multiprocessing
+from io import StringIO
 import pandas as pd
 import numpy as np
 from pathlib import Path
+from itertools import repeat, product, chain
+from concurrent.futures import ProcessPoolExecutor
 import logging
-import inspect
+from etl_cache import ETL_CACHE
+from etl_schema import normalize_sheets, mangle_net_names, validate_sheets, as_text, explode_items, join_items, count_items, is_pin_list
+from connectivity import Connectivity, validate_connectivity
+from instrumentation import INSTRUMENTATION, instrumented, annotate, counted_lines
+from pipeline import LazyPipeline, artifact
 
 logger = logging.getLogger()
 
-# ETL 엑셀 파일 읽는 공통 함수
-def _read_excel(etl_file_path):
+# 이 크기 이상의 ETL 파일은 시트를 병렬로 읽음
+_PARALLEL_READ_MIN_BYTES = 4 * 1024 * 1024
+
+# 시트 병렬 읽기 프로세스 생성 방식
+#   LazyPipeline compute()의 스레드 풀 안에서도 호출되므로 fork 대신 spawn
+_READ_MP_CONTEXT = multiprocessing.get_context("spawn")
+
+# _read_excel 전처리 결과가 바뀌면 올려서 기존 ETL 캐시를 무효화
+_NORMALIZATION_VERSION = 5
+
+# TCL 스크립트 파일 쓰기 버퍼 크기
+_TCL_WRITE_BUFFER_SIZE = 1024 * 1024
+
+# TCL 렌더링 청크 크기 (행 수)
+_TCL_RENDER_CHUNK_ROWS = 5000
+
+# TCL 출력 모드
+#   unrolled : 핀마다 catch 블록을 펼쳐서 출력
+#   compact  : 데이터는 TCL 리스트로 한 번만 출력하고, 명령 종류별 foreach proc로 처리
+_TCL_MODES = ("unrolled", "compact")
+
+# 증분 생성 스냅샷 형식 버전 (형식이 바뀌면 올려서 이전 스냅샷을 무시)
+_SNAPSHOT_VERSION = 2
+
+# 파라미터 sweep manifest 형식 버전
+_SWEEP_MANIFEST_VERSION = 1
+
+# 시뮬레이션 기본 메쉬 크기 (MaxEdgeLength)
+_DEFAULT_MAX_EDGE_LENGTH = 0.001
+
+# openpyxl로 직접 읽을 수 있는 확장자
+_OPENPYXL_SUFFIXES = {".xlsx", ".xlsm", ".xltx", ".xltm"}
+
+
+# 엑셀 읽기 라이브러리는 ETL 캐시에 없을 때만 필요하므로 사용할 때 불러옴 (CLI 시작 시간 단축)
+# xlwings는 Windows + Excel 환경에서만 사용하는 선택 백엔드
+def _xlwings():
+    try:
+        import xlwings as xw
+    except ImportError:
+        raise RuntimeError("xlwings를 사용할 수 없습니다. (Windows + Excel 필요)") from None
+    return xw
+
+
+# ETL 엑셀 읽기 백엔드 : openpyxl (Excel 없이 .xlsx 직접 파싱)
+def _read_sheet_openpyxl(etl_file_path, sheet_name):
     """
-    엑셀 파일을 읽어 각 시트를 DataFrame으로 변환한 후 전처리하여 반환합니다.
+    read-only 모드로 시트 하나를 읽어 (used range에 해당하는 행 리스트, 첫 행(헤더)의 엑셀 행 번호)를 반환합니다.
+    숫자는 xlwings와 동일하게 float로 맞춥니다.
     """
-    app = xw.App(visible=False)
-    wb = app.books.open(etl_file_path)
-    dfs = {
-        sheet.name: sheet.used_range.options(pd.DataFrame, header=1, index=False).value.apply(lambda col: col.map(str))
-        for sheet in wb.sheets
-    }
-    for sheet_name, df in dfs.items():
-        df = (
-            df.replace("", np.nan)
-            .ffill()
-            .astype(str, errors="ignore")
-            .replace({" ": "", "\n": ","}, regex=True)
-        )
-        dfs[sheet_name] = df
+    import openpyxl
+
+    wb = openpyxl.load_workbook(etl_file_path, read_only=True, data_only=True)
+    try:
+        rows = [
+            [float(v) if type(v) is int else v for v in row]
+            for row in wb[sheet_name].iter_rows(values_only=True)
+        ]
+    finally:
+        wb.close()
+
+    # used range 밖의 빈 행/열 제거
+    used_rows = [i for i, row in enumerate(rows) if any(v is not None for v in row)]
+    if not used_rows:
+        return [], 1
+    rows = rows[used_rows[0]:used_rows[-1] + 1]
+    width = max(len(row) for row in rows)
+    rows = [row + [None] * (width - len(row)) for row in rows]
+    used_cols = [j for j in range(width) if any(row[j] is not None for row in rows)]
+    return [row[used_cols[0]:used_cols[-1] + 1] for row in rows], used_rows[0] + 1
+
+
+# 원본 시트 DataFrame의 index는 "엑셀 행 번호 - 2" (헤더가 1행이면 0부터)
+# 검증 / 연결 오류는 index + 2로 엑셀 행 번호를 보고하므로 used range 앞의 빈 행도 반영
+def _sheet_frame(rows, header_row):
+    if not rows:
+        return pd.DataFrame()
+    return pd.DataFrame(rows[1:], columns=rows[0], index=pd.RangeIndex(header_row - 1, header_row - 1 + len(rows) - 1))
+
+
+def _read_sheets_openpyxl(etl_file_path, max_workers=None):
+    import openpyxl
+
+    wb = openpyxl.load_workbook(etl_file_path, read_only=True)
+    sheet_names = wb.sheetnames
     wb.close()
-    app.quit()
+
+    if max_workers is None:
+        parallel = os.path.getsize(etl_file_path) >= _PARALLEL_READ_MIN_BYTES
+        max_workers = min(len(sheet_names), os.cpu_count() or 1) if parallel else 1
+
+    if max_workers > 1 and len(sheet_names) > 1:
+        with ProcessPoolExecutor(max_workers=max_workers, mp_context=_READ_MP_CONTEXT) as executor:
+            sheet_rows = list(executor.map(_read_sheet_openpyxl, repeat(str(etl_file_path)), sheet_names))
+    else:
+        sheet_rows = [_read_sheet_openpyxl(etl_file_path, sheet_name) for sheet_name in sheet_names]
+
+    # xlwings의 used_range.options(pd.DataFrame, header=1, index=False)와 동일한 형태
+    return {
+        sheet_name: _sheet_frame(rows, header_row)
+        for sheet_name, (rows, header_row) in zip(sheet_names, sheet_rows)
+    }
+
+
+# ETL 엑셀 읽기 백엔드 : xlwings (Excel COM, 선택)
+def _read_sheets_xlwings(etl_file_path, max_workers=None):
+    xw = _xlwings()
+
+    app = xw.App(visible=False)
+    try:
+        wb = app.books.open(etl_file_path)
+        dfs = dict()
+        for sheet in wb.sheets:
+            used_range = sheet.used_range
+            df = used_range.options(pd.DataFrame, header=1, index=False).value
+            df.index = df.index + used_range.row - 1
+            dfs[sheet.name] = df
+        wb.close()
+    finally:
+        app.quit()
+    return dfs
+
+
+_EXCEL_READERS = {
+    "openpyxl": _read_sheets_openpyxl,
+    "xlwings": _read_sheets_xlwings,
+}
+
+
+# ETL 엑셀 파일 읽는 공통 함수
+def _read_excel(etl_file_path, backend="auto", max_workers=None):
+    """
+    엑셀 파일을 읽어 각 시트를 DataFrame으로 변환한 후 etl_schema 기준으로 전처리하여 반환합니다.
+    backend는 "auto", "openpyxl", "xlwings" 중 하나이며, "auto"는 openpyxl로 직접 파싱하고
+    openpyxl로 읽을 수 없는 파일(.xls, .xlsb 등)만 xlwings로 읽습니다.
+    """
+    if backend == "auto":
+        from openpyxl.utils.exceptions import InvalidFileException
+
+        backend = "openpyxl" if Path(etl_file_path).suffix.lower() in _OPENPYXL_SUFFIXES else "xlwings"
+        try:
+            raw_dfs = _EXCEL_READERS[backend](etl_file_path, max_workers=max_workers)
+        except InvalidFileException:
+            logger.warning(f"openpyxl로 읽을 수 없는 파일입니다. xlwings로 다시 읽습니다 : {etl_file_path}")
+            raw_dfs = _read_sheets_xlwings(etl_file_path)
+    else:
+        raw_dfs = _EXCEL_READERS[backend](etl_file_path, max_workers=max_workers)
+
+    return normalize_sheets(raw_dfs)
+
+
+# ETL 캐시를 거쳐 엑셀 파일을 읽는 함수
+def _load_etl(etl_file_path, backend="auto", cache=ETL_CACHE, max_workers=None):
+    """
+    같은 내용의 ETL 파일은 캐시에서 바로 반환하고, 없으면 _read_excel로 읽은 뒤 캐시에 저장합니다.
+    cache가 None이면 매번 새로 읽습니다. max_workers는 시트 병렬 읽기 프로세스 수입니다. (None이면 파일 크기로 결정)
+    """
+    if cache is None:
+        return _read_excel(etl_file_path, backend=backend, max_workers=max_workers)
+
+    key = cache.key(etl_file_path, _NORMALIZATION_VERSION, backend)
+    dfs = cache.get(key)
+    if dfs is not None:
+        logger.info(f"ETL 캐시 사용 : {etl_file_path}")
+        annotate(etl_cache="hit")
+        return dfs
+
+    dfs = _read_excel(etl_file_path, backend=backend, max_workers=max_workers)
+    cache.put(key, dfs, etl_file_path)
+    annotate(etl_cache="miss")
     return dfs
 
+
+# 계측 활성 시 ETL 입력 크기 기록 (rows, nets, pins)
+def _annotate_etl(etl_file_path, dfs):
+    if not INSTRUMENTATION.enabled:
+        return None
+    pins = 0
+    nets = set()
+    for df in dfs.values():
+        for column in ("pin", "pp", "np"):
+            if column in df.columns:
+                pins += int(count_items(df[column]).sum())
+        for column in ("net", "subnet"):
+            if column in df.columns:
+                nets.update(df[column].dropna())
+    annotate(
+        etl_bytes=os.path.getsize(etl_file_path),
+        rows=sum(len(df) for df in dfs.values()),
+        nets=len(nets),
+        pins=pins
+    )
+    return None
+
+
+# TCL 스크립트 출력 공통 함수
+def _write_tcl(lines, tcl_file_path=None):
+    """
+    TCL 명령 줄을 생성되는 순서대로 버퍼링하여 파일에 기록하고 경로를 반환합니다.
+    tcl_file_path가 없으면 메모리 버퍼(StringIO)에 기록하여 반환합니다.
+    """
+    if tcl_file_path is None:
+        buffer = StringIO()
+        buffer.writelines(lines)
+        return buffer
+
+    with open(tcl_file_path, "w", encoding="utf-8", newline="\n", buffering=_TCL_WRITE_BUFFER_SIZE) as f:
+        f.writelines(lines)
+    return tcl_file_path
+
+
+# 핀 목록 컬럼(pin, pp, np)을 항목 하나당 한 행으로 펼친 long-format 프레임 (index는 원래 행 위치)
+def _explode_list_column(df, column):
+    positions, items = explode_items(df[column])
+    return df.drop(columns=column).iloc[positions].assign(**{column: items})
+
+
+# 스냅샷 / 비교용 프레임 (핀 목록은 콤마 구분 문자열)
+def _joined_frame(df):
+    return df.assign(**{column: join_items(df[column]) for column in df.columns if is_pin_list(df[column])})
+
+
+# DataFrame 기반 TCL 렌더링 공통 함수
+def _iter_rendered_tcl(df, render_row=None, render_items=()):
+    """
+    df를 청크 단위로 나누어 행 템플릿(render_row)과 콤마 구분 컬럼별 항목 템플릿(render_items)을 컬럼 전체에 한 번에 적용합니다.
+    출력 순서는 행마다 행 템플릿, 항목 템플릿(컬럼 순서, 항목 순서) 순이며 청크마다 문자열 하나를 반환합니다.
+    """
+    for start in range(0, len(df), _TCL_RENDER_CHUNK_ROWS):
+        chunk = df.iloc[start:start + _TCL_RENDER_CHUNK_ROWS].reset_index(drop=True)
+        parts = [] if render_row is None else [render_row(chunk)]
+        for column, render_item in render_items:
+            parts.append(render_item(_explode_list_column(chunk, column)))
+        rendered = pd.concat(parts)
+        order = np.argsort(rendered.index.to_numpy(), kind="stable")
+        yield "".join(rendered.to_numpy()[order])
+
+
+# compact 모드 TCL 데이터 출력 함수
+def _iter_tcl_data(name, df):
+    """
+    df의 각 행을 TCL 리스트 변수 name의 원소로 출력합니다. 각 필드는 {}로 감싸며,
+    proc에서는 lassign으로 필드를 꺼내 사용합니다.
+    """
+    def render_row(chunk):
+        row = "    {{" + chunk.iloc[:, 0]
+        for i in range(1, len(chunk.columns)):
+            row = row + "} {" + chunk.iloc[:, i]
+        return row + "}}\n"
+
+    yield f"set {name} {{\n"
+    yield from _iter_rendered_tcl(df, render_row)
+    yield "}\n\n"
+
+
+# unrolled 모드 TCL 템플릿
+def _render_classify_net(df, gnd):
+    return (
+        " if {[catch {sigrity::move net {PowerNets} {" + df["net"] + "} {!}}]} {\n"
+        " lappend error_nets {" + df["net"] + "}\n"
+        "}\n"
+        "catch {sigrity::update net {PowerGndPair} {" + gnd + "} {" + df["net"] + "} {!}}\n"
+    )
+
+
+def _render_pdc_elem(df, gnd, add_command):
+    return (
+        "catch {sigrity::add " + add_command + " {!}}\n"
+        "catch {sigrity::link pdcElem {" + df["port"] + "} {Negative Pin} {-Circuit {" + df["refdes"] + "} -Net {" + gnd + "}} -LinkCktNode {!}}\n"
+    )
+
+
+def _render_pdc_link_pin(df, error_list):
+    return (
+        "if {\n"
+        "    [catch {sigrity::link pdcElem {" + df["port"] + "} {Positive Pin} {-Circuit {" + df["refdes"] + "} -Node {" + df["pin"] + "}} -LinkCktNode {!}}]\n"
+        "} {\n"
+        "    lappend " + error_list + " {" + df["refdes"] + ": " + df["pin"] + "}\n"
+        "}\n"
+    )
+
+
+def _render_psi_port(df):
+    return (
+        "if  {\n"
+        "    [catch {sigrity::add port -name {" + df["port"] + "} {!}}]\n"
+        "} {\n"
+        "    lappend error_ports {" + df["port"] + "}\n"
+        "}\n"
+        "catch {sigrity::update -name {" + df["port"] + "} -refZ {1} {!}}\n"
+    )
+
+
+def _render_psi_hook_pin(df, column, option):
+    return (
+        "if  {\n"
+        "    [catch {sigrity::hook port -name {" + df["port"] + "} -c {" + df["refdes"] + "} " + option + " {" + df[column] + "} {!}}]\n"
+        "} {\n"
+        "    lappend error_pins {" + df[column] + "}\n"
+        "}\n"
+    )
+
+
+def _render_psi_nc(df):
+    return (
+        "if  {\n"
+        "    [catch {sigrity::update circuit -model {disable} {" + df["refdes"] + "} {!}}]\n"
+        "} {\n"
+        "    lappend error_components {" + df["refdes"] + "}\n"
+        "}\n"
+    )
+
+
+def _render_catch_command(df, key, command, error_list):
+    return (
+        "if {[catch {sigrity::" + command + " {" + df[key] + "} {!}}]} {\n"
+        "    lappend " + error_list + " {" + df[key] + "}\n"
+        "}\n"
+    )
+
+
+# classify 스크립트 (PowerDC/PowerSI 공통)
+def _iter_classify_tcl(nets, gnd, tcl_mode, removed_nets=None):
+    """
+    nets를 PowerNets로 분류하는 스크립트를 출력합니다.
+    removed_nets가 주어지면(증분 생성) 해당 net을 먼저 SignalNets로 되돌립니다.
+    """
+    yield from [
+        "sigrity::clear\n",
+        "sigrity::cls\n",
+        "set error_nets {}\n\n"
+    ]
+
+    if removed_nets is not None:
+        yield from _iter_rendered_tcl(removed_nets, lambda df: _render_catch_command(df, "net", "move net {SignalNets}", "error_nets"))
+
+    if tcl_mode == "compact":
+        yield from _iter_tcl_data("nets", nets)
+        yield _CLASSIFY_NETS_PROC
+        yield f"classify_nets {{{gnd}}} $nets\n"
+    else:
+        yield from _iter_rendered_tcl(nets, lambda df: _render_classify_net(df, gnd))
+
+    yield from [
+        "sigrity::save {!}\n",
+        "puts \"\\n=============================================\"\n",
+        "puts \"Error Nets : $error_nets\"\n",
+        "puts \"\\n=============================================\"\n"
+    ]
+
+
+# 파라미터 sweep
+def _hashed_lines(lines, digest):
+    # 줄을 그대로 넘기면서 내용 해시를 누적
+    for line in lines:
+        digest.update(line.encode("utf-8"))
+        yield line
+
+
+def _scaled_values(df, numbers, column, scale):
+    # port별 마지막 행 값(add 스크립트에서 최종 적용되는 값)에 scale을 곱한 문자열 프레임
+    values = pd.to_numeric(numbers, errors="coerce").to_numpy() * scale
+    df = df[["port"]].assign(**{column: pd.Series(values, index=df.index).round(9).astype(str)})
+    return df.drop_duplicates("port", keep="last")
+
+
+def _tcl_length(value):
+    # 기본값은 기존 출력("0.001000")을 유지하고, 나머지는 repr로 출력 ({:f}는 1e-7을 0.000000으로 만듦)
+    value = float(value)
+    if not value > 0:
+        raise ValueError(f"MaxEdgeLength는 0보다 커야 합니다 : {value}")
+    return f"{value:f}" if value == _DEFAULT_MAX_EDGE_LENGTH else repr(value)
+
+
+def _render_pdc_update(df, add_command, error_list):
+    return (
+        "if {[catch {sigrity::add " + add_command + " {!}}]} {\n"
+        "    lappend " + error_list + " {" + df["port"] + "}\n"
+        "}\n"
+    )
+
+
+# 증분 생성 : 스냅샷 비교
+def _diff_rows(old, new, key):
+    """
+    key 컬럼 기준으로 (추가, 삭제, 변경) key Index를 반환합니다.
+    같은 key의 행이 여러 개면 모든 행의 값을 이어 붙여 비교합니다.
+    """
+    def signature(df):
+        columns = [column for column in df.columns if column != key]
+        if not columns:
+            values = pd.Series("", index=df.index)
+        else:
+            values = df[columns[0]].str.cat([df[column] for column in columns[1:]], sep="\x1f")
+        return values.groupby(df[key], sort=False).agg("\x1e".join)
+
+    old_signature = signature(old)
+    new_signature = signature(new)
+    added = new_signature.index.difference(old_signature.index, sort=False)
+    removed = old_signature.index.difference(new_signature.index, sort=False)
+    common = new_signature.index.intersection(old_signature.index, sort=False)
+    changed = common[(new_signature[common] != old_signature[common]).to_numpy()]
+    return added, removed, changed
+
+
+def _load_snapshot(snapshot_path, gnd):
+    # 스냅샷 폴더 : meta.json(버전 / GND / 프레임 이름) + 프레임별 feather
+    try:
+        with open(snapshot_path / "meta.json", "r", encoding="utf-8") as f:
+            meta = json.load(f)
+        if meta.get("version") != _SNAPSHOT_VERSION or meta.get("gnd") != gnd:
+            return None
+        frames = {name: pd.read_feather(snapshot_path / f"{name}.feather") for name in meta["frames"]}
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning(f"스냅샷을 읽을 수 없습니다 : {snapshot_path} ({e})")
+        return None
+    return {"version": meta["version"], "gnd": meta["gnd"], **frames}
+
+
+def _replace_folder(src_path, dst_path):
+    shutil.rmtree(dst_path, ignore_errors=True)
+    os.replace(src_path, dst_path)
+    return None
+
+
+def _save_snapshot(snapshot_path, snapshot):
+    frames = {name: value for name, value in snapshot.items() if isinstance(value, pd.DataFrame)}
+    tmp_path = snapshot_path.with_name(f"{snapshot_path.name}.tmp")
+    shutil.rmtree(tmp_path, ignore_errors=True)
+    tmp_path.mkdir(parents=True)
+    for name, df in frames.items():
+        df.reset_index(drop=True).to_feather(tmp_path / f"{name}.feather")
+    with open(tmp_path / "meta.json", "w", encoding="utf-8") as f:
+        json.dump({"version": snapshot["version"], "gnd": snapshot["gnd"], "frames": list(frames)}, f, ensure_ascii=False)
+    _replace_folder(tmp_path, snapshot_path)
+    return None
+
+
+def _commit_snapshot(snapshot_path):
+    # generate_delta_tcl이 저장한 pending 스냅샷을 적용된 스냅샷으로 확정
+    pending_path = snapshot_path.with_name(f"{snapshot_path.name}.pending")
+    if not pending_path.exists():
+        logger.warning(f"확정할 스냅샷이 없습니다 : {pending_path}")
+        return False
+    _replace_folder(pending_path, snapshot_path)
+    logger.info(f"스냅샷 확정 : {snapshot_path}")
+    return True
+
+
+# compact 모드 proc 정의
+_CLASSIFY_NETS_PROC = """proc classify_nets {gnd nets} {
+    global error_nets
+    foreach row $nets {
+        lassign $row net
+        if {[catch {sigrity::move net {PowerNets} $net {!}}]} {
+            lappend error_nets $net
+        }
+        catch {sigrity::update net {PowerGndPair} $gnd $net {!}}
+    }
+}
+
+"""
+
+_PDC_ADD_PROCS = """proc add_vrms {gnd vrms} {
+    global error_vrms
+    foreach row $vrms {
+        lassign $row port refdes v pins
+        catch {sigrity::add pdcVRM -m -name $port -voltage $v {!}}
+        catch {sigrity::link pdcElem $port {Negative Pin} [list -Circuit $refdes -Net $gnd] -LinkCktNode {!}}
+        foreach pin $pins {
+            if {[catch {sigrity::link pdcElem $port {Positive Pin} [list -Circuit $refdes -Node $pin] -LinkCktNode {!}}]} {
+                lappend error_vrms "$refdes: $pin"
+            }
+        }
+    }
+}
+
+proc add_sinks {gnd sinks} {
+    global error_sinks
+    foreach row $sinks {
+        lassign $row port refdes i pins
+        catch {sigrity::add pdcSINK -m -name $port -current $i -lt {5,%} -ut {5,%} -model {Equal Current} {!}}
+        catch {sigrity::link pdcElem $port {Negative Pin} [list -Circuit $refdes -Net $gnd] -LinkCktNode {!}}
+        foreach pin $pins {
+            if {[catch {sigrity::link pdcElem $port {Positive Pin} [list -Circuit $refdes -Node $pin] -LinkCktNode {!}}]} {
+                lappend error_sinks "$refdes: $pin"
+            }
+        }
+    }
+}
+
+proc add_discs {discs} {
+    global error_discs
+    foreach row $discs {
+        lassign $row refdes r
+        if {[catch {sigrity::add pdcInter -auto -ckt $refdes -resistance $r {!}}]} {
+            lappend error_discs $refdes
+        }
+    }
+}
+
+"""
+
+_PDC_UPDATE_PROCS = """proc update_vrms {vrms} {
+    global error_vrms
+    foreach row $vrms {
+        lassign $row port v
+        if {[catch {sigrity::add pdcVRM -m -name $port -voltage $v {!}}]} {
+            lappend error_vrms $port
+        }
+    }
+}
+
+proc update_sinks {sinks} {
+    global error_sinks
+    foreach row $sinks {
+        lassign $row port i
+        if {[catch {sigrity::add pdcSINK -m -name $port -current $i -lt {5,%} -ut {5,%} -model {Equal Current} {!}}]} {
+            lappend error_sinks $port
+        }
+    }
+}
+
+"""
+
+_PSI_ADD_PROCS = """proc add_ports {ports} {
+    global error_ports error_pins
+    foreach row $ports {
+        lassign $row port refdes pps nps
+        if {[catch {sigrity::add port -name $port {!}}]} {
+            lappend error_ports $port
+        }
+        catch {sigrity::update -name $port -refZ {1} {!}}
+        foreach pp $pps {
+            if {[catch {sigrity::hook port -name $port -c $refdes -pn $pp {!}}]} {
+                lappend error_pins $pp
+            }
+        }
+        foreach np $nps {
+            if {[catch {sigrity::hook port -name $port -c $refdes -nn $np {!}}]} {
+                lappend error_pins $np
+            }
+        }
+    }
+}
+
+"""
+
+_PSI_NC_PROC = """proc disable_components {components} {
+    global error_components
+    foreach row $components {
+        lassign $row comp
+        if {[catch {sigrity::update circuit -model {disable} $comp {!}}]} {
+            lappend error_components $comp
+        }
+    }
+}
+
+"""
+
+
 # PowerDC
-class PdcPresim:
-    def __init__(self, GND_NAME, ETL_FILE_PATH):
+class PdcPresim(LazyPipeline):
+    """
+    ETL 엑셀에서 PowerDC TCL 스크립트를 생성합니다.
+    """
+    # 결과물 : sheets(dfs), connectivity, classify_tcl / add_tcl / simulation_setup_tcl / delta_tcl(tcl_outputs)
+    # 파라미터 sweep : generate_sweep_tcl() (sweep_base / sweep_{해시} 스크립트, sweep_manifest)
+    # ETL 검증 시 반드시 있어야 하는 시트/컬럼
+    required_columns = {
+        "vrm": ["refdes", "net", "subnet", "pin", "v"],
+        "sink": ["refdes", "net", "subnet", "pin", "current"],
+        "disc": ["refdes", "resistance"],
+    }
+
+    # connectivity 인덱스로 만들 net / 핀 컬럼
+    net_columns = ["net", "subnet"]
+    positive_pin_columns = ["pin"]
+    negative_pin_columns = []
+
+    def __init__(self, GND_NAME, ETL_FILE_PATH, TCL_FOLDER_PATH=None, TCL_MODE="unrolled", EXCEL_BACKEND="auto", ETL_CACHE=ETL_CACHE, VALIDATE=True, READ_WORKERS=None, LAZY=False):
+        if TCL_MODE not in _TCL_MODES:
+            raise ValueError(f"지원하지 않는 TCL_MODE 입니다 : {TCL_MODE}")
+
         # 상수
         self.gnd = GND_NAME
         self.etl_file_path = Path(ETL_FILE_PATH)
+        self.tcl_folder_path = Path(TCL_FOLDER_PATH) if TCL_FOLDER_PATH else None
+        self.tcl_mode = TCL_MODE
+        self.excel_backend = EXCEL_BACKEND
+        self.etl_cache = ETL_CACHE
+        self.validate = VALIDATE
+        self.read_workers = READ_WORKERS
 
         # 변수
         self.dfs = dict()
-        self.classify_tcl_commands = list()
-        self.add_tcl_commands = list()
-        self.simulation_setup_tcl_commands = list()
+        self.connectivity = None
+        self.tcl_outputs = dict()
+        self.sweep_manifest = None
 
-        # 함수
-        self.initialize()
-        self.generate_classify_tcl()
-        self.generate_add_tcl()
-        self.generate_simulation_setup_tcl()
+        # 함수 (LAZY면 compute() 또는 각 단계 메서드를 호출할 때 필요한 단계만 실행)
+        if not LAZY:
+            self.initialize()
+            self.index_connectivity()
+            self.generate_classify_tcl()
+            self.generate_add_tcl()
+            self.generate_simulation_setup_tcl()
+            self.generate_delta_tcl()
 
+    @artifact("sheets")
+    @instrumented
     def initialize(self):
-        logger.info(f"{self.__class__.__name__} : {inspect.currentframe().f_code.co_name} 실행 중")
+        self.dfs = _load_etl(self.etl_file_path, backend=self.excel_backend, cache=self.etl_cache, max_workers=self.read_workers)
 
-        self.dfs = _read_excel(self.etl_file_path)
+        validate_sheets(self.dfs, self.required_columns)
 
         # Cadence net 표기에 맞게 수정
-        self.dfs["vrm"][["subnet", "net"]] = self.dfs["vrm"][["subnet", "net"]].apply(lambda x: x.str.replace(".", "_"))
-        self.dfs["vrm"][["index", "pin"]] = self.dfs["vrm"][["index", "pin"]].map(
-            lambda x: str(int(float(x))) if x.replace(".", "", 1).isdigit() and float(x).is_integer() else x)
+        mangle_net_names(self.dfs)
+        _annotate_etl(self.etl_file_path, self.dfs)
 
-        self.dfs["sink"][["subnet", "net"]] = self.dfs["sink"][["subnet", "net"]].apply(lambda x: x.str.replace(".", "_"))
-        self.dfs["sink"][["index", "pin"]] = self.dfs["sink"][["index", "pin"]].map(
-            lambda x: str(int(float(x))) if x.replace(".", "", 1).isdigit() and float(x).is_integer() else x)
+        return None
+
+    @artifact("connectivity", requires=["sheets"])
+    @instrumented
+    def index_connectivity(self):
+        """
+        net / refdes / pin을 정수 ID로 인덱싱하고, VALIDATE면 TCL 생성 전에 연결 오류를 검사합니다.
+        """
+        self.connectivity = Connectivity(self.dfs, self.net_columns, self.positive_pin_columns, self.negative_pin_columns)
+        annotate(nets=len(self.connectivity.net_names), pins=len(self.connectivity.pin_id))
+        if self.validate:
+            validate_connectivity(self.connectivity, self.gnd)
 
-        logger.info(f"{self.__class__.__name__} : {inspect.currentframe().f_code.co_name} 완료")
         return None
 
-    def generate_classify_tcl(self):
-        logger.info(f"{self.__class__.__name__} : {inspect.currentframe().f_code.co_name} 실행 중")
+    def _emit_tcl(self, script_name, lines):
+        # TCL 폴더가 없으면 메모리 버퍼로 출력
+        tcl_file_path = None
+        if self.tcl_folder_path is not None:
+            self.tcl_folder_path.mkdir(parents=True, exist_ok=True)
+            tcl_file_path = self.tcl_folder_path / f"{self.etl_file_path.stem}_PDC_{script_name}.tcl"
+        self.tcl_outputs[script_name] = _write_tcl(counted_lines(lines), tcl_file_path)
+        return None
 
-        nets = set()
+    @artifact("classify_tcl", requires=["connectivity"])
+    @instrumented
+    def generate_classify_tcl(self):
+        self._emit_tcl("classify", self.iter_classify_tcl())
 
-        self.classify_tcl_commands.extend([
-            "sigrity::clear\n",
-            "sigrity::cls\n",
-            "set error_nets {}\n\n"
-        ])
-
-        for sheet_name, df in self.dfs.items():
-            if "net" in df.columns:
-                df["net"].apply(lambda x: nets.update(x.split(",")))
-            if "subnet" in df.columns:
-                df["subnet"].apply(lambda x: nets.update(x.split(",")))
-
-        for net in nets:
-            self.classify_tcl_commands.append(
-                f" if {{[catch {{sigrity::move net {{PowerNets}} {{{net}}} {{!}}}}]}} {{\n lappend error_nets {{{net}}}\n}}\n"
-            )
-            self.classify_tcl_commands.append(
-                f"catch {{sigrity::update net {{PowerGndPair}} {{{self.gnd}}} {{{net}}} {{!}}}}\n"
-            )
-        self.classify_tcl_commands.extend([
-            f"sigrity::save {{!}}\n",
-            "puts \n\"=============================================\"\n",
-            "puts \"Error Nets : $error_nets\"\n",
-            "puts \n\"=============================================\"\n"
-        ])
-
-        logger.info(f"{self.__class__.__name__} : {inspect.currentframe().f_code.co_name} 완료")
         return None
 
+    def iter_classify_tcl(self):
+        return _iter_classify_tcl(self.connectivity.classify_nets(), self.gnd, self.tcl_mode)
+
+    @artifact("add_tcl", requires=["connectivity"])
+    @instrumented
     def generate_add_tcl(self):
-        logger.info(f"{self.__class__.__name__} : {inspect.currentframe().f_code.co_name} 실행 중")
+        self._emit_tcl("add", self.iter_add_tcl())
 
-        self.add_tcl_commands.extend([
+        return None
+
+    def iter_add_tcl(self):
+        yield from [
             "sigrity::clear\n",
             "sigrity::cls\n",
             "set error_vrms {}\n",
             "set error_sinks {}\n",
             "set error_discs {}\n\n"
-        ])
+        ]
+
+        yield from self._iter_add_tcl_body(*self._elem_frames())
+
+        yield from [
+            "sigrity::save {!}\n",
+            "puts \"\\n=============================================\"\n",
+            "puts \"Error VRMs : $error_vrms\"\n",
+            "puts \"Error SINKs : $error_sinks\"\n",
+            "puts \"Error DISCs : $error_discs\"\n",
+            "puts \"\\n=============================================\"\n"
+        ]
+
+    def _elem_frames(self):
+        # (vrm, sink, disc) 시트를 TCL 렌더링용 문자열 프레임으로 변환
+        vrm = as_text(self.dfs["vrm"][["refdes", "net", "v", "pin"]])
+        vrm.insert(0, "port", "VRM_" + vrm["refdes"] + "_" + vrm["net"])
+
+        sink = as_text(self.dfs["sink"][["refdes", "net", "current", "pin"]])
+        sink.insert(0, "port", "SINK_" + sink["refdes"] + "_" + sink["net"])
+
+        disc = self.dfs["disc"][["refdes", "resistance"]].astype(str)
+        return vrm.drop(columns="net"), sink.drop(columns="net"), disc
+
+    def _iter_add_tcl_body(self, vrm, sink, disc):
+        if self.tcl_mode == "compact":
+            yield from self._iter_add_tcl_compact(vrm, sink, disc)
+        else:
+            yield from self._iter_add_tcl_unrolled(vrm, sink, disc)
 
+    def _iter_add_tcl_compact(self, vrm, sink, disc):
+        yield from _iter_tcl_data("vrms", vrm.assign(pin=join_items(vrm["pin"], " ")))
+        yield from _iter_tcl_data("sinks", sink.assign(pin=join_items(sink["pin"], " ")))
+        yield from _iter_tcl_data("discs", disc)
+        yield _PDC_ADD_PROCS
+        yield from [
+            f"add_vrms {{{self.gnd}}} $vrms\n",
+            f"add_sinks {{{self.gnd}}} $sinks\n",
+            "add_discs $discs\n"
+        ]
+
+    def _iter_add_tcl_unrolled(self, vrm, sink, disc):
         # vrm sheet
-        for _, row in self.dfs["vrm"].iterrows():
-            vrm_refdes = row["refdes"]
-            vrm_net = row["net"]
-            vrm_pins = row["pin"].split(",")
-            vrm_v = row["v"]
-            vrm_port = f"VRM_{vrm_refdes}_{vrm_net}"
-
-            self.add_tcl_commands.append(
-                f"catch {{sigrity::add pdcVRM -m -name {{{vrm_port}}} -voltage {{{vrm_v}}} {{!}}}}\n"
-            )
-            self.add_tcl_commands.append(
-                f"catch {{sigrity::link pdcElem {{{vrm_port}}} {{Negative Pin}} {{-Circuit {{{vrm_refdes}}} -Net {{{self.gnd}}}}} -LinkCktNode {{!}}}}\n"
-            )
-            for vrm_pin in vrm_pins:
-                self.add_tcl_commands.extend([
-                    f"if {{\n",
-                    "    [catch {sigrity::link pdcElem " +
-                    f"{{{vrm_port}}} {{Positive Pin}} {{-Circuit {{{vrm_refdes}}} -Node {{{vrm_pin}}}}} -LinkCktNode {{!}}}}]\n",
-                    "} {\n",
-                    f"    lappend error_vrms {{{vrm_refdes}: {vrm_pin}}}\n",
-                    "}\n"
-                ])
+        yield from _iter_rendered_tcl(
+            vrm,
+            lambda df: _render_pdc_elem(df, self.gnd, "pdcVRM -m -name {" + df["port"] + "} -voltage {" + df["v"] + "}"),
+            [("pin", lambda df: _render_pdc_link_pin(df, "error_vrms"))]
+        )
 
         # sink sheet
-        for _, row in self.dfs["sink"].iterrows():
-            sink_refdes = row["refdes"]
-            sink_net = row["net"]
-            sink_pins = row["pin"].split(",")
-            sink_v = row["voltage"]
-            sink_i = row["current"]
-            sink_port = f"SINK_{sink_refdes}_{sink_net}"
-
-        self.add_tcl_commands.append(
-            f"catch {{sigrity::add pdcSINK -m -name {{{sink_port}}} -current {{{sink_i}}} -lt {{5,%}} -ut {{5,%}} -model {{Equal Current}} {{!}}}}\n"
+        yield from _iter_rendered_tcl(
+            sink,
+            lambda df: _render_pdc_elem(
+                df, self.gnd,
+                "pdcSINK -m -name {" + df["port"] + "} -current {" + df["current"] + "} -lt {5,%} -ut {5,%} -model {Equal Current}"
+            ),
+            [("pin", lambda df: _render_pdc_link_pin(df, "error_sinks"))]
         )
-        self.add_tcl_commands.append(
-            f"catch {{sigrity::link pdcElem {{{sink_port}}} {{Negative Pin}} {{-Circuit {{{sink_refdes}}} -Net {{{self.gnd}}}}} -LinkCktNode {{!}}}}\n"
-        )
-        for sink_pin in sink_pins:
-            self.add_tcl_commands.extend([
-                "if {\n",
-                "    [catch {sigrity::link pdcElem " +
-                f"{{{sink_port}}} {{Positive Pin}} {{-Circuit {{{sink_refdes}}} -Node {{{sink_pin}}}}} -LinkCktNode {{!}}]\n",
-                "} {\n",
-                f"    lappend error_SINK {{{sink_refdes}: {sink_pin}}}\n",
-                "}\n"
-            ])
 
         # disc sheet
-        for _, row in self.dfs["disc"].iterrows():
-            disc_refdes = row["refdes"]
-            disc_r = row["resistance"]
-
-            self.add_tcl_commands.extend([
-                "if {\n",
-                f"    [catch {{sigrity::add pdcInter -auto -ckt {{{disc_refdes}}} -resistance {{{disc_r}}} {{!}}}}]\n",
-                "} {\n",
-                f"    lappend error_DISC {{{disc_refdes}}}\n",
+        yield from _iter_rendered_tcl(
+            disc,
+            lambda df: (
+                "if {\n"
+                "    [catch {sigrity::add pdcInter -auto -ckt {" + df["refdes"] + "} -resistance {" + df["resistance"] + "} {!}}]\n"
+                "} {\n"
+                "    lappend error_discs {" + df["refdes"] + "}\n"
                 "}\n"
-            ])
+            )
+        )
+
+    def _snapshot(self):
+        vrm, sink, disc = self._elem_frames()
+        return {
+            "version": _SNAPSHOT_VERSION,
+            "gnd": self.gnd,
+            "nets": self.connectivity.classify_nets(),
+            "vrm": _joined_frame(vrm),
+            "sink": _joined_frame(sink),
+            "disc": disc
+        }
+
+    @artifact("delta_tcl", requires=["connectivity"])
+    @instrumented
+    def generate_delta_tcl(self):
+        """
+        TCL 폴더의 적용된 스냅샷(마지막으로 design에 반영된 ETL)과 비교하여 바뀐 항목만 처리하는 classify_delta / add_delta 스크립트를
+        생성하고, 현재 ETL은 pending 스냅샷으로 저장합니다. 적용된 스냅샷이 없으면 이전 증분 스크립트를 지웁니다.
+        스냅샷은 commit_snapshot()을 호출하거나 SigrityPool.run_presim()이 성공했을 때만 갱신됩니다.
+        """
+        if self.tcl_folder_path is None:
+            logger.info("TCL 폴더가 없어 증분 생성을 건너뜁니다.")
+            return None
+
+        old = _load_snapshot(self._snapshot_path(), self.gnd)
+        new = self._snapshot()
+        if old is not None:
+            self._emit_tcl("classify_delta", self.iter_classify_delta_tcl(old, new))
+            self._emit_tcl("add_delta", self.iter_add_delta_tcl(old, new))
+        else:
+            # 기준이 없으므로 이전 실행의 증분 스크립트는 더 이상 유효하지 않음
+            for script_name in ("classify_delta", "add_delta"):
+                (self.tcl_folder_path / f"{self.etl_file_path.stem}_PDC_{script_name}.tcl").unlink(missing_ok=True)
+        _save_snapshot(self._snapshot_path(".pending"), new)
 
-        self.classify_tcl_commands.extend([
-            f"sigrity::save {{!}}\n",
-            "puts \n\"=============================================\"\n",
+        return None
+
+    def _snapshot_path(self, suffix=""):
+        return self.tcl_folder_path / f"{self.etl_file_path.stem}_PDC_snapshot{suffix}"
+
+    def commit_snapshot(self):
+        """
+        generate_delta_tcl()이 저장한 pending 스냅샷을 적용된 스냅샷으로 확정합니다. (스크립트를 design에 반영한 뒤 호출)
+        확정했으면 True를 반환합니다.
+        """
+        if self.tcl_folder_path is None:
+            return False
+        self.generate_delta_tcl()
+        return _commit_snapshot(self._snapshot_path())
+
+    def iter_classify_delta_tcl(self, old, new):
+        added, removed, _ = _diff_rows(old["nets"], new["nets"], "net")
+        return _iter_classify_tcl(
+            new["nets"][new["nets"]["net"].isin(added)], self.gnd, self.tcl_mode,
+            removed_nets=old["nets"][old["nets"]["net"].isin(removed)]
+        )
+
+    def iter_add_delta_tcl(self, old, new):
+        yield from [
+            "sigrity::clear\n",
+            "sigrity::cls\n",
+            "set error_vrms {}\n",
+            "set error_sinks {}\n",
+            "set error_discs {}\n",
+            "set error_deletes {}\n\n"
+        ]
+
+        # 삭제/변경된 항목은 지우고, 추가/변경된 항목만 다시 생성
+        fresh = dict()
+        for name, key, command in [
+            ("vrm", "port", "delete pdcElem"),
+            ("sink", "port", "delete pdcElem"),
+            ("disc", "refdes", "delete pdcInter -ckt")
+        ]:
+            added, removed, changed = _diff_rows(old[name], new[name], key)
+            stale = old[name][old[name][key].isin(removed.union(changed))].drop_duplicates(key)
+            yield from _iter_rendered_tcl(stale, lambda df, key=key, command=command: _render_catch_command(df, key, command, "error_deletes"))
+            fresh[name] = new[name][new[name][key].isin(added.union(changed))]
+
+        yield from self._iter_add_tcl_body(fresh["vrm"], fresh["sink"], fresh["disc"])
+
+        yield from [
+            "sigrity::save {!}\n",
+            "puts \"\\n=============================================\"\n",
             "puts \"Error VRMs : $error_vrms\"\n",
             "puts \"Error SINKs : $error_sinks\"\n",
             "puts \"Error DISCs : $error_discs\"\n",
-            "puts \n\"=============================================\"\n"
-        ])
-
-        logger.info(f"{self.__class__.__name__} : {inspect.currentframe().f_code.co_name} 완료")
-        return None
+            "puts \"Error Deletes : $error_deletes\"\n",
+            "puts \"\\n=============================================\"\n"
+        ]
 
+    @artifact("simulation_setup_tcl", requires=["connectivity"])
+    @instrumented
     def generate_simulation_setup_tcl(self):
-        logger.info(f"{self.__class__.__name__} : {inspect.currentframe().f_code.co_name} 실행 중")
+        self._emit_tcl("simulation_setup", self.iter_simulation_setup_tcl())
 
-        self.simulation_setup_tcl_commands.extend([
-            "sigrity::update option -MaxEdgeLength {0.001000} {!}\n",
+        return None
+
+    def iter_simulation_setup_tcl(self, max_edge_length=_DEFAULT_MAX_EDGE_LENGTH):
+        yield from [
+            f"sigrity::update option -MaxEdgeLength {{{_tcl_length(max_edge_length)}}} {{!}}\n",
             "sigrity::save {!}\n",
             # start simulation
-        ])
+        ]
 
-        logger.info(f"{self.__class__.__name__} : {inspect.currentframe().f_code.co_name} 완료")
-        return None
+    @instrumented
+    def generate_sweep_tcl(self, max_edge_lengths=(_DEFAULT_MAX_EDGE_LENGTH,), current_scales=(1.0,), voltage_scales=(1.0,)):
+        """
+        메쉬 크기 / sink 전류 배율 / VRM 전압 배율의 모든 조합(variant)에 대한 sweep 스크립트를 생성합니다.
+        classify + add는 공통 base 스크립트 하나로 출력하고, variant마다 바뀌는 값만 담은 override 스크립트는
+        내용 해시로 중복을 제거하여 출력합니다. variant 목록(manifest)을 sweep_manifest에 보관하고,
+        TCL 폴더가 있으면 {ETL}_PDC_sweep.json으로도 저장합니다.
+        """
+        self.index_connectivity()
+
+        digest = hashlib.sha256()
+        self._emit_tcl("sweep_base", _hashed_lines(chain(self.iter_classify_tcl(), self.iter_add_tcl()), digest))
+        manifest = {
+            "version": _SWEEP_MANIFEST_VERSION,
+            "etl": str(self.etl_file_path),
+            "gnd": self.gnd,
+            "tcl_mode": self.tcl_mode,
+            "base": self._sweep_entry("sweep_base", digest.hexdigest()),
+            "overrides": dict(),
+            "variants": []
+        }
+
+        grids = [list(dict.fromkeys(values)) for values in (max_edge_lengths, current_scales, voltage_scales)]
+        for max_edge_length, current_scale, voltage_scale in product(*grids):
+            lines = list(self.iter_sweep_override_tcl(max_edge_length, current_scale, voltage_scale))
+            digest = hashlib.sha256("".join(lines).encode("utf-8")).hexdigest()
+            key = digest[:12]
+            if key not in manifest["overrides"]:
+                self._emit_tcl(f"sweep_{key}", lines)
+                manifest["overrides"][key] = self._sweep_entry(f"sweep_{key}", digest)
+            manifest["variants"].append({
+                "name": f"mesh{max_edge_length:g}_i{current_scale:g}_v{voltage_scale:g}",
+                "max_edge_length": max_edge_length,
+                "current_scale": current_scale,
+                "voltage_scale": voltage_scale,
+                "override": key
+            })
+
+        if self.tcl_folder_path is not None:
+            manifest_path = self.tcl_folder_path / f"{self.etl_file_path.stem}_PDC_sweep.json"
+            with open(manifest_path, "w", encoding="utf-8") as f:
+                json.dump(manifest, f, ensure_ascii=False, indent=2)
+        self.sweep_manifest = manifest
+        annotate(variants=len(manifest["variants"]), scripts=len(manifest["overrides"]))
+        logger.info(f"sweep 스크립트 생성 완료 : variant {len(manifest['variants'])}개, override 스크립트 {len(manifest['overrides'])}개")
+
+        return manifest
+
+    def _sweep_entry(self, script_name, digest):
+        output = self.tcl_outputs[script_name]
+        return {"script": script_name, "file": output.name if isinstance(output, Path) else None, "sha256": digest}
+
+    def iter_sweep_override_tcl(self, max_edge_length=_DEFAULT_MAX_EDGE_LENGTH, current_scale=1.0, voltage_scale=1.0):
+        """
+        base 스크립트 이후에 실행하여 메쉬 크기와 (배율이 1이 아니면) VRM 전압 / sink 전류만 바꾸는 스크립트입니다.
+        """
+        vrm, sink, _ = self._elem_frames()
+        vrm = _scaled_values(vrm, self.dfs["vrm"]["v"], "v", voltage_scale) if voltage_scale != 1 else vrm.iloc[:0][["port", "v"]]
+        sink = _scaled_values(sink, self.dfs["sink"]["current"], "current", current_scale) if current_scale != 1 else sink.iloc[:0][["port", "current"]]
+
+        yield from [
+            "sigrity::cls\n",
+            "set error_vrms {}\n",
+            "set error_sinks {}\n\n"
+        ]
+
+        if self.tcl_mode == "compact":
+            yield from _iter_tcl_data("vrms", vrm)
+            yield from _iter_tcl_data("sinks", sink)
+            yield _PDC_UPDATE_PROCS
+            yield from [
+                "update_vrms $vrms\n",
+                "update_sinks $sinks\n"
+            ]
+        else:
+            yield from _iter_rendered_tcl(
+                vrm, lambda df: _render_pdc_update(df, "pdcVRM -m -name {" + df["port"] + "} -voltage {" + df["v"] + "}", "error_vrms")
+            )
+            yield from _iter_rendered_tcl(
+                sink, lambda df: _render_pdc_update(
+                    df, "pdcSINK -m -name {" + df["port"] + "} -current {" + df["current"] + "} -lt {5,%} -ut {5,%} -model {Equal Current}", "error_sinks"
+                )
+            )
+
+        yield from self.iter_simulation_setup_tcl(max_edge_length)
+        yield from [
+            "puts \"\\n=============================================\"\n",
+            "puts \"Error VRMs : $error_vrms\"\n",
+            "puts \"Error SINKs : $error_sinks\"\n",
+            "puts \"\\n=============================================\"\n"
+        ]
 
 
 # PowerSI
-class PsiPresim:
-    def __init__(self, GND_NAME, ETL_FILE_PATH):
+class PsiPresim(LazyPipeline):
+    """
+    ETL 엑셀에서 PowerSI TCL 스크립트를 생성합니다.
+    """
+    # 결과물 : sheets(dfs), connectivity, classify_tcl / add_tcl / nc_tcl / assign_tcl / delta_tcl(tcl_outputs)
+    # ETL 검증 시 반드시 있어야 하는 시트/컬럼
+    required_columns = {
+        "vrm": ["refdes", "net", "pp", "np"],
+        "sink": ["refdes", "net", "pp", "np"],
+        "nc": ["refdes"],
+    }
+
+    # connectivity 인덱스로 만들 net / 핀 컬럼
+    net_columns = ["net"]
+    positive_pin_columns = ["pp"]
+    negative_pin_columns = ["np"]
+
+    def __init__(self, GND_NAME, ETL_FILE_PATH, TCL_FOLDER_PATH=None, TCL_MODE="unrolled", EXCEL_BACKEND="auto", ETL_CACHE=ETL_CACHE, VALIDATE=True, READ_WORKERS=None, LAZY=False):
+        if TCL_MODE not in _TCL_MODES:
+            raise ValueError(f"지원하지 않는 TCL_MODE 입니다 : {TCL_MODE}")
+
         # 상수
         self.gnd = GND_NAME
         self.etl_file_path = Path(ETL_FILE_PATH)
+        self.tcl_folder_path = Path(TCL_FOLDER_PATH) if TCL_FOLDER_PATH else None
+        self.tcl_mode = TCL_MODE
+        self.excel_backend = EXCEL_BACKEND
+        self.etl_cache = ETL_CACHE
+        self.validate = VALIDATE
+        self.read_workers = READ_WORKERS
 
         # 변수
         self.dfs = dict()
-        self.classify_tcl_commands = list()
-        self.add_tcl_commands = list()
-        self.nc_tcl_commands = list()
-        self.assign_tcl_commands = list()
+        self.connectivity = None
+        self.tcl_outputs = dict()
 
-        # 함수
-        self.initialize()
-        self.generate_classify_tcl()
-        self.generate_add_tcl()
-        self.assign_tcl_commands()
+        # 함수 (LAZY면 compute() 또는 각 단계 메서드를 호출할 때 필요한 단계만 실행)
+        if not LAZY:
+            self.initialize()
+            self.index_connectivity()
+            self.generate_classify_tcl()
+            self.generate_add_tcl()
+            self.generate_nc_tcl()
+            self.generate_assign_tcl()
+            self.generate_delta_tcl()
 
+    @artifact("sheets")
+    @instrumented
     def initialize(self):
-        logger.info(f"{self.__class__.__name__} : {inspect.currentframe().f_code.co_name} 실행 중")
+        self.dfs = _load_etl(self.etl_file_path, backend=self.excel_backend, cache=self.etl_cache, max_workers=self.read_workers)
+        validate_sheets(self.dfs, self.required_columns)
+        _annotate_etl(self.etl_file_path, self.dfs)
 
-        self.dfs = _read_excel(self.etl_file_path)
+        return None
 
-        logger.info(f"{self.__class__.__name__} : {inspect.currentframe().f_code.co_name} 완료")
+    @artifact("connectivity", requires=["sheets"])
+    @instrumented
+    def index_connectivity(self):
+        """
+        net / refdes / pin을 정수 ID로 인덱싱하고, VALIDATE면 TCL 생성 전에 연결 오류를 검사합니다.
+        """
+        self.connectivity = Connectivity(self.dfs, self.net_columns, self.positive_pin_columns, self.negative_pin_columns)
+        annotate(nets=len(self.connectivity.net_names), pins=len(self.connectivity.pin_id))
+        if self.validate:
+            validate_connectivity(self.connectivity, self.gnd)
+
+        return None
+
+    def _emit_tcl(self, script_name, lines):
+        # TCL 폴더가 없으면 메모리 버퍼로 출력
+        tcl_file_path = None
+        if self.tcl_folder_path is not None:
+            self.tcl_folder_path.mkdir(parents=True, exist_ok=True)
+            tcl_file_path = self.tcl_folder_path / f"{self.etl_file_path.stem}_PSI_{script_name}.tcl"
+        self.tcl_outputs[script_name] = _write_tcl(counted_lines(lines), tcl_file_path)
         return None
 
+    @artifact("classify_tcl", requires=["connectivity"])
+    @instrumented
     def generate_classify_tcl(self):
-        logger.info(f"{self.__class__.__name__} : {inspect.currentframe().f_code.co_name} 실행 중")
+        self._emit_tcl("classify", self.iter_classify_tcl())
+
+        return None
+
+    def iter_classify_tcl(self):
+        return _iter_classify_tcl(self.connectivity.classify_nets(), self.gnd, self.tcl_mode)
 
-        nets = set()
+    @artifact("add_tcl", requires=["connectivity"])
+    @instrumented
+    def generate_add_tcl(self):
+        self._emit_tcl("add", self.iter_add_tcl())
+
+        return None
 
-        self.classify_tcl_commands.extend([
+    def iter_add_tcl(self):
+        yield from [
             "sigrity::clear\n",
             "sigrity::cls\n",
-            "set error_nets {}\n\n"
-        ])
+            "set error_ports {}\n",
+            "set error_pins {}\n",
+        ]
 
-        for sheet_name, df in self.dfs.items():
-            if "net" in df.columns:
-                df["net"].apply(lambda x: nets.update(x.split(",")))
+        yield from self._iter_ports_tcl(self._ports_frame())
 
-        for net in nets:
-            self.classify_tcl_commands.append(
-                f" if {{[catch {{sigrity::move net {{PowerNets}} {{{net}}} {{!}}}}]}} {{\n lappend error_nets {{{net}}}\n}}\n"
-            )
-            self.classify_tcl_commands.append(
-                f"catch {{sigrity::update net {{PowerGndPair}} {{{self.gnd}}} {{{net}}} {{!}}}}\n"
+        yield from [
+            "sigrity::save {!}\n",
+            "puts \"\\n=============================================\"\n",
+            "puts \"Error Ports : $error_ports\"\n",
+            "puts \"Error Pins : $error_pins\"\n",
+            "puts \"\\n=============================================\"\n"
+        ]
+
+    def _iter_ports_tcl(self, ports):
+        if self.tcl_mode == "compact":
+            yield from _iter_tcl_data("ports", ports.assign(
+                pp=join_items(ports["pp"], " "),
+                np=join_items(ports["np"], " ")
+            ))
+            yield _PSI_ADD_PROCS
+            yield "add_ports $ports\n"
+        else:
+            yield from _iter_rendered_tcl(
+                ports,
+                _render_psi_port,
+                [
+                    ("pp", lambda df: _render_psi_hook_pin(df, "pp", "-pn")),
+                    ("np", lambda df: _render_psi_hook_pin(df, "np", "-nn"))
+                ]
             )
-        self.classify_tcl_commands.extend([
+
+    def _ports_frame(self):
+        # (port, refdes, pp, np) : vrm 시트 다음 sink 시트 순서
+        vrm = as_text(self.dfs["vrm"][["refdes", "net", "pp", "np"]])
+        vrm_ports = vrm.assign(port="VRM_" + vrm["refdes"] + "_" + vrm["net"])
+
+        sink = self.dfs["sink"]
+        port_number = pd.to_numeric(sink["port"]) if "port" in sink.columns else pd.Series(np.nan, index=sink.index)
+        port_suffix = ("_P" + port_number.dropna().astype("int64").astype(str)).reindex(sink.index, fill_value="")
+        sink = as_text(sink[["refdes", "net", "pp", "np"]])
+        sink_ports = sink.assign(port="VRM_" + sink["refdes"] + "_" + sink["net"] + port_suffix)
+
+        return pd.concat([vrm_ports, sink_ports], ignore_index=True)[["port", "refdes", "pp", "np"]]
+
+    @artifact("nc_tcl", requires=["connectivity"])
+    @instrumented
+    def generate_nc_tcl(self):
+        self._emit_tcl("nc", self.iter_nc_tcl())
+
+        return None
+
+    def iter_nc_tcl(self):
+        yield from [
+            "sigrity::clear\n",
+            "sigrity::cls\n",
+            "set error_components {}\n\n"
+        ]
+
+        yield from self._iter_nc_tcl_body(self.dfs["nc"][["refdes"]].astype(str))
+
+        yield from [
             "sigrity::save {!}\n",
-            "puts \n\"=============================================\"\n",
-            "puts \"Error Nets : $error_nets\"\n",
-            "puts \n\"=============================================\"\n"
-        ])
+            "puts \"\\n=============================================\"\n",
+            "puts \"Error Components : $error_components\"\n",
+            "puts \"\\n=============================================\"\n"
+        ]
+
+    def _iter_nc_tcl_body(self, nc):
+        if self.tcl_mode == "compact":
+            yield from _iter_tcl_data("components", nc)
+            yield _PSI_NC_PROC
+            yield "disable_components $components\n"
+        else:
+            yield from _iter_rendered_tcl(nc, _render_psi_nc)
+
+    def _snapshot(self):
+        return {
+            "version": _SNAPSHOT_VERSION,
+            "gnd": self.gnd,
+            "nets": self.connectivity.classify_nets(),
+            "ports": _joined_frame(self._ports_frame()),
+            "nc": self.dfs["nc"][["refdes"]].astype(str)
+        }
+
+    @artifact("delta_tcl", requires=["connectivity"])
+    @instrumented
+    def generate_delta_tcl(self):
+        """
+        TCL 폴더의 적용된 스냅샷(마지막으로 design에 반영된 ETL)과 비교하여 바뀐 항목만 처리하는 classify_delta / add_delta / nc_delta 스크립트를
+        생성하고, 현재 ETL은 pending 스냅샷으로 저장합니다. 적용된 스냅샷이 없으면 이전 증분 스크립트를 지웁니다.
+        스냅샷은 commit_snapshot()을 호출하거나 SigrityPool.run_presim()이 성공했을 때만 갱신됩니다.
+        """
+        if self.tcl_folder_path is None:
+            logger.info("TCL 폴더가 없어 증분 생성을 건너뜁니다.")
+            return None
+
+        old = _load_snapshot(self._snapshot_path(), self.gnd)
+        new = self._snapshot()
+        if old is not None:
+            self._emit_tcl("classify_delta", self.iter_classify_delta_tcl(old, new))
+            self._emit_tcl("add_delta", self.iter_add_delta_tcl(old, new))
+            self._emit_tcl("nc_delta", self.iter_nc_delta_tcl(old, new))
+        else:
+            # 기준이 없으므로 이전 실행의 증분 스크립트는 더 이상 유효하지 않음
+            for script_name in ("classify_delta", "add_delta", "nc_delta"):
+                (self.tcl_folder_path / f"{self.etl_file_path.stem}_PSI_{script_name}.tcl").unlink(missing_ok=True)
+        _save_snapshot(self._snapshot_path(".pending"), new)
 
-        logger.info(f"{self.__class__.__name__} : {inspect.currentframe().f_code.co_name} 완료")
         return None
 
-    def generate_add_tcl(self):
-        logger.info(f"{self.__class__.__name__} : {inspect.currentframe().f_code.co_name} 실행 중")
+    def _snapshot_path(self, suffix=""):
+        return self.tcl_folder_path / f"{self.etl_file_path.stem}_PSI_snapshot{suffix}"
+
+    def commit_snapshot(self):
+        """
+        generate_delta_tcl()이 저장한 pending 스냅샷을 적용된 스냅샷으로 확정합니다. (스크립트를 design에 반영한 뒤 호출)
+        확정했으면 True를 반환합니다.
+        """
+        if self.tcl_folder_path is None:
+            return False
+        self.generate_delta_tcl()
+        return _commit_snapshot(self._snapshot_path())
 
-        self.add_tcl_commands.extend([
+    def iter_classify_delta_tcl(self, old, new):
+        added, removed, _ = _diff_rows(old["nets"], new["nets"], "net")
+        return _iter_classify_tcl(
+            new["nets"][new["nets"]["net"].isin(added)], self.gnd, self.tcl_mode,
+            removed_nets=old["nets"][old["nets"]["net"].isin(removed)]
+        )
+
+    def iter_add_delta_tcl(self, old, new):
+        yield from [
             "sigrity::clear\n",
             "sigrity::cls\n",
             "set error_ports {}\n",
             "set error_pins {}\n",
-        ])
+            "set error_deletes {}\n"
+        ]
 
-        # vrm sheet
-        for _, row in self.dfs["vrm"].iterrows():
-            vrm_refdes = row["refdes"]
-            vrm_net = row["net"]
-            vrm_pps = row["pp"]
-            vrm_nps = row["np"]
-            vrm_port = f"VRM_{vrm_refdes}_{vrm_net}"
-
-            self.add_tcl_commands.extend([
-                "if  {\n",
-                f"    [catch {{sigrity::add port -name {{{vrm_port}}} {{!}}}}]\n",
-                "} {\n",
-                f"    lappend error_ports {{{vrm_port}}}\n",
-                "}\n",
-                f"catch {{sigrity::update -name {{{vrm_port}}} -refZ {{1}} {{!}}}}\n"
-            ])
-
-            for pp in vrm_pps.split(","):
-                self.add_tcl_commands.extend([
-                    "if  {\n",
-                    f"    [catch {{sigrity::hook port -name {{{vrm_port}}} -c {{{vrm_refdes}}} -pn {{{pp}}} {{!}}}}]\n",
-                    "} {\n",
-                    f"    lappend error_pins {{{pp}}}\n",
-                    "}\n"
-                ])
-
-            for np_val in vrm_nps.split(","):
-                self.add_tcl_commands.extend([
-                    "if  {\n",
-                    f"    [catch {{sigrity::hook port -name {{{vrm_port}}} -c {{{vrm_refdes}}} -nn {{{np_val}}} {{!}}}}]\n",
-                    "} {\n",
-                    f"    lappend error_pins {{{np_val}}}\n",
-                    "}\n"
-                ])
+        # 삭제/변경된 port는 지우고, 추가/변경된 port만 다시 생성
+        added, removed, changed = _diff_rows(old["ports"], new["ports"], "port")
+        stale = old["ports"][old["ports"]["port"].isin(removed.union(changed))].drop_duplicates("port")
+        yield from _iter_rendered_tcl(stale, lambda df: _render_catch_command(df, "port", "delete port -name", "error_deletes"))
+        yield from self._iter_ports_tcl(new["ports"][new["ports"]["port"].isin(added.union(changed))])
 
-        # sink sheet
-        for _, row in self.dfs["sink"].iterrows():
-            sink_refdes = row["refdes"]
-            sink_net = row["net"]
-            sink_pps = row["pp"]
-            sink_nps = row["np"]
-            sink_port = f"VRM_{sink_refdes}_{sink_net}" + (
-                f"_P{int(float(row['port']))}" if pd.notna(row["port"]) else ""
-            )
-
-            self.add_tcl_commands.extend([
-                "if  {\n",
-                f"    [catch {{sigrity::add port -name {{{sink_port}}} {{!}}}}]\n",
-                "} {\n",
-                f"    lappend error_ports {{{sink_port}}}\n",
-                "}\n",
-                f"catch {{sigrity::update -name {{{sink_port}}} -refZ {{1}} {{!}}}}\n"
-            ])
-
-            for pp in sink_pps.split(","):
-                self.add_tcl_commands.extend([
-                    "if  {\n",
-                    f"    [catch {{sigrity::hook port -name {{{sink_port}}} -c {{{sink_refdes}}} -pn {{{pp}}} {{!}}}}]\n",
-                    "} {\n",
-                    f"    lappend error_pins {{{pp}}}\n",
-                    "}\n"
-                ])
-
-            for np in sink_nps.split(","):
-                self.add_tcl_commands.extend([
-                    "if  {\n",
-                    f"    [catch {{sigrity::hook port -name {{{sink_port}}} -c {{{sink_refdes}}} -nn {{{np}}} {{!}}}}]\n",
-                    "} {\n",
-                    f"    lappend error_pins {{{np}}}\n",
-                    "}\n"
-                ])
-
-        self.classify_tcl_commands.extend([
-            f"sigrity::save {{!}}\n",
-            "puts \n\"=============================================\"\n",
+        yield from [
+            "sigrity::save {!}\n",
+            "puts \"\\n=============================================\"\n",
             "puts \"Error Ports : $error_ports\"\n",
             "puts \"Error Pins : $error_pins\"\n",
-            "puts \n\"=============================================\"\n"
-        ])
-
-        logger.info(f"{self.__class__.__name__} : {inspect.currentframe().f_code.co_name} 완료")
-        return None
+            "puts \"Error Deletes : $error_deletes\"\n",
+            "puts \"\\n=============================================\"\n"
+        ]
 
-    def generate_nc_tcl(self):
-        logger.info(f"{self.__class__.__name__} : {inspect.currentframe().f_code.co_name} 실행 중")
-
-        self.nc_tcl_commands.extend([
+    def iter_nc_delta_tcl(self, old, new):
+        yield from [
             "sigrity::clear\n",
             "sigrity::cls\n",
             "set error_components {}\n\n"
-        ])
+        ]
 
-        for _, row in self.dfs["nc"].iterrows():
-            nc_comp = row["refdes"]
-
-            self.nc_tcl_commands.extend([
-                "if  {\n",
-                f"    [catch {{sigrity::update circuit -model {{disable}} {{{nc_comp}}} {{!}}}}]\n",
-                "} {\n",
-                f"    lappend error_components {{{nc_comp}}}\n",
-                "}\n"
-            ])
+        # NC에서 빠진 부품은 다시 활성화, 새로 추가된 부품만 비활성화
+        added, removed, _ = _diff_rows(old["nc"], new["nc"], "refdes")
+        enabled = old["nc"][old["nc"]["refdes"].isin(removed)].drop_duplicates("refdes")
+        yield from _iter_rendered_tcl(enabled, lambda df: _render_catch_command(df, "refdes", "update circuit -model {enable}", "error_components"))
+        yield from self._iter_nc_tcl_body(new["nc"][new["nc"]["refdes"].isin(added)].drop_duplicates("refdes"))
 
-        self.classify_tcl_commands.extend([
-            f"sigrity::save {{!}}\n",
-            "puts \n\"=============================================\"\n",
+        yield from [
+            "sigrity::save {!}\n",
+            "puts \"\\n=============================================\"\n",
             "puts \"Error Components : $error_components\"\n",
-            "puts \n\"=============================================\"\n"
-        ])
-
-        logger.info(f"{self.__class__.__name__} : {inspect.currentframe().f_code.co_name} 완료")
-        return None
+            "puts \"\\n=============================================\"\n"
+        ]
 
+    @artifact("assign_tcl", requires=["connectivity"])
+    @instrumented
     def generate_assign_tcl(self):
-        logger.info(f"{self.__class__.__name__} : {inspect.currentframe().f_code.co_name} 실행 중")
-
         """
         sigrity::update cktdef {$p/n} -head {ExtNode = 1 2
         } -Definition {S1 1 2 3 2
@@ -391,5 +1240,4 @@ class PsiPresim:
         V 3 2 0} -check {!}
         """
 
-        logger.info(f"{self.__class__.__name__} : {inspect.currentframe().f_code.co_name} 완료")
         return None
\ No newline at end of file
@@ -0,0 +1,123 @@
+import re
+import logging
+from typing import NamedTuple
+
+logger = logging.getLogger()
+
+# pdc_postsim에서 사용하는 리포트 섹션
+PDC_REPORT_SECTIONS = (
+    "ElectricalSetup",
+    "ElectricalResultsTable",
+    "ImageLayoutTop",
+    "ImageLayoutBottom",
+    "DistributionPlot",
+)
+
+# 리포트 읽기 단위
+_CHUNK_SIZE = 1024 * 1024
+
+# 따옴표로 시작하는 data URL 속성 값 (src="data:..." 등)
+_DATA_URL_PATTERN = re.compile(rb"""["']data:""")
+_DATA_URL_PATTERN_LENGTH = len(b'"data:')
+
+# 치환된 data URL 표기 (src="span:N")
+SPAN_PREFIX = "span:"
+
+
+class DataSpan(NamedTuple):
+    """
+    리포트 파일 안의 data URL payload 위치 (바이트 오프셋, [start, end))
+    """
+    start: int
+    end: int
+    mime: str
+    base64: bool
+
+
+def parse_data_url_header(header):
+    # b"data:image/png;base64" -> ("image/png", True)
+    params = header.decode("ascii", errors="replace")[len("data:"):].split(";")
+    return params[0] or "text/plain", "base64" in params[1:]
+
+
+def _scan_data_urls(f, chunk_size=_CHUNK_SIZE):
+    """
+    리포트를 청크 단위로 읽으면서 data URL payload를 span:N 표기로 치환한 HTML(bytes)과
+    원본 payload의 바이트 위치 목록을 반환합니다. payload는 메모리에 올리지 않습니다.
+    """
+    html_parts = []
+    span_bounds = []
+    carry = b""
+    base = 0          # carry[0]의 파일 오프셋
+    quote = None      # payload 안이면 닫는 따옴표
+    payload_start = 0
+
+    for chunk in iter(lambda: f.read(chunk_size), b""):
+        data = carry + chunk
+        i = 0
+        while True:
+            if quote is None:
+                match = _DATA_URL_PATTERN.search(data, i)
+                if match is None:
+                    # 패턴이 청크 경계에 걸칠 수 있으므로 끝부분은 다음 청크로 넘김
+                    keep = max(i, len(data) - (_DATA_URL_PATTERN_LENGTH - 1))
+                    html_parts.append(data[i:keep])
+                    carry = data[keep:]
+                    base += keep
+                    break
+                j = match.start()
+                html_parts.append(data[i:j + 1])
+                quote = data[j:j + 1]
+                payload_start = base + j + 1
+                i = j + 1
+            else:
+                k = data.find(quote, i)
+                if k == -1:
+                    # payload는 버리고 위치만 기록
+                    carry = b""
+                    base += len(data)
+                    break
+                html_parts.append(f"{SPAN_PREFIX}{len(span_bounds)}".encode())
+                span_bounds.append((payload_start, base + k))
+                quote = None
+                i = k
+    html_parts.append(carry)
+
+    # payload 앞부분에서 MIME 정보 읽기
+    spans = []
+    for start, end in span_bounds:
+        f.seek(start)
+        head = f.read(min(end - start, 256))
+        comma = head.find(b",")
+        header = head[:comma] if comma != -1 else head
+        mime, is_base64 = parse_data_url_header(header)
+        spans.append(DataSpan(start + len(header) + 1, end, mime, is_base64))
+    return b"".join(html_parts), spans
+
+
+def parse_report(report_file_path, section_ids=PDC_REPORT_SECTIONS, chunk_size=_CHUNK_SIZE):
+    """
+    리포트를 스트리밍으로 읽어 section_ids에 해당하는 요소만 BeautifulSoup 트리로 만들고 (soup, spans)를 반환합니다.
+    이미지 등 data URL 속성 값은 "span:N"으로 치환되며, spans[N]으로 원본 파일의 payload 위치를 알 수 있습니다.
+    """
+    from bs4 import BeautifulSoup, SoupStrainer
+
+    with open(report_file_path, "rb") as f:
+        html, spans = _scan_data_urls(f, chunk_size)
+
+    soup = BeautifulSoup(
+        html.decode("utf-8", errors="replace"),
+        "html.parser",
+        parse_only=SoupStrainer(id=list(section_ids))
+    )
+    logger.info(f"리포트 파싱 : HTML {len(html) / 1e6:.1f} MB, data URL {len(spans)}개")
+    return soup, spans
+
+
+def read_span(report_file_path, span):
+    """
+    span 위치의 payload(base64 텍스트 또는 원본 바이트)를 읽어 반환합니다.
+    """
+    with open(report_file_path, "rb") as f:
+        f.seek(span.start)
+        return f.read(span.end - span.start)
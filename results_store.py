@@ -0,0 +1,171 @@
+import os
+import re
+import logging
+from pathlib import Path
+from datetime import datetime
+from urllib.parse import quote, unquote
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+from etl_cache import cadence_root
+
+logger = logging.getLogger()
+
+# 파티션 컬럼 (저장 경로 : board=.../revision=.../run=.../result.parquet)
+PARTITION_COLUMNS = ("board", "revision", "run")
+
+# run 표기 (정렬하면 시간 순서)
+RUN_FORMAT = "%Y%m%dT%H%M%S"
+
+# 숫자 컬럼 : 이름이 단위 표기("Min Voltage (V)", "Margin (%)" 등)로 끝나는 컬럼은 float64, 나머지는 string
+#   값으로 타입을 추론하면 같은 컬럼이 실행마다 float64 / string으로 갈려 이력을 합칠 수 없으므로 이름으로 고정
+_NUMERIC_COLUMN_PATTERN = re.compile(r"\([^()]*\)\s*$")
+
+_PARTITIONING = ds.partitioning(
+    pa.schema([(column, pa.string()) for column in PARTITION_COLUMNS]),
+    flavor="hive"
+)
+
+
+def run_id(timestamp=None):
+    """
+    timestamp(datetime 또는 epoch 초, 없으면 현재 시각)를 run 표기로 변환합니다.
+    """
+    if timestamp is None:
+        timestamp = datetime.now()
+    elif not isinstance(timestamp, datetime):
+        timestamp = datetime.fromtimestamp(timestamp)
+    return timestamp.strftime(RUN_FORMAT)
+
+
+def result_schema(columns):
+    """
+    결과 컬럼 이름 목록의 고정 스키마(단위 표기 컬럼은 float64, 나머지는 string)를 반환합니다.
+    """
+    return pa.schema([
+        (column, pa.float64() if _NUMERIC_COLUMN_PATTERN.search(column) else pa.string())
+        for column in map(str, columns)
+    ])
+
+
+def _normalize_types(df):
+    # result_schema 기준으로 변환 (숫자 컬럼의 숫자가 아닌 값("N/A" 등)은 NaN)
+    df = df.copy()
+    df.columns = [str(column) for column in df.columns]
+    for field in result_schema(df.columns):
+        if pa.types.is_floating(field.type):
+            df[field.name] = pd.to_numeric(df[field.name], errors="coerce").astype("float64")
+        else:
+            df[field.name] = df[field.name].astype("string")
+    return df
+
+
+class ResultsStore:
+    """
+    postsim 결과 테이블(df_merged)을 board / revision / run 파티션으로 나눠 parquet로 누적 저장합니다.
+    이력 조회 시 HTML 리포트를 다시 파싱하지 않고 parquet만 읽습니다.
+    컬럼 타입은 result_schema로 고정하므로 실행마다 값이 달라도 같은 컬럼은 같은 타입입니다.
+    기본 위치는 CADENCE_RESULTS_DIR, 없으면 ETL 캐시와 같은 루트의 results 폴더입니다.
+    """
+    def __init__(self, root_dir=None):
+        # 상수
+        if root_dir is None:
+            root_dir = os.environ.get("CADENCE_RESULTS_DIR", cadence_root() / "results")
+        self.root_dir = Path(root_dir)
+
+    def _partition_dir(self, board, revision, run):
+        return self.root_dir.joinpath(*(
+            f"{column}={quote(str(value), safe='')}"
+            for column, value in zip(PARTITION_COLUMNS, (board, revision, run))
+        ))
+
+    def append(self, df, board, revision, run=None):
+        """
+        결과 테이블 하나를 저장합니다. 같은 board / revision / run이 이미 있으면 덮어씁니다.
+        """
+        run = run or run_id()
+        partition_dir = self._partition_dir(board, revision, run)
+        partition_dir.mkdir(parents=True, exist_ok=True)
+
+        tmp_path = partition_dir / f".result.{os.getpid()}.parquet"
+        df = _normalize_types(df)
+        pq.write_table(pa.Table.from_pandas(df, schema=result_schema(df.columns), preserve_index=False), tmp_path)
+        os.replace(tmp_path, partition_dir / "result.parquet")
+
+        logger.info(f"결과 저장 : {board} / {revision} / {run} ({len(df)}행)")
+        return partition_dir
+
+    def runs(self, board=None, revision=None):
+        """
+        저장된 실행 목록(board, revision, run, path)을 run 순서로 반환합니다. (파일 내용은 읽지 않음)
+        """
+        rows = []
+        for path in self.root_dir.glob("board=*/revision=*/run=*/result.parquet"):
+            values = [unquote(part.split("=", 1)[1]) for part in path.parent.relative_to(self.root_dir).parts]
+            rows.append(values + [str(path)])
+        runs = pd.DataFrame(rows, columns=[*PARTITION_COLUMNS, "path"])
+        if board is not None:
+            runs = runs[runs["board"].isin([board] if isinstance(board, str) else board)]
+        if revision is not None:
+            runs = runs[runs["revision"].isin([revision] if isinstance(revision, str) else revision)]
+        return runs.sort_values(["run", "board", "revision"], ignore_index=True)
+
+    def load(self, board=None, revision=None, run=None, columns=None):
+        """
+        조건(값 또는 값 리스트)에 맞는 실행 결과를 한 번에 읽어 하나의 DataFrame으로 반환합니다.
+        실행마다 컬럼이 다르면 없는 값은 NA로 채웁니다.
+        """
+        runs = self.runs(board, revision)
+        if run is not None:
+            runs = runs[runs["run"].isin([run] if isinstance(run, str) else run)]
+        if runs.empty:
+            return pd.DataFrame(columns=[*PARTITION_COLUMNS, *(columns or [])])
+
+        # 실행마다 컬럼 구성이 달라도 컬럼 이름으로 타입이 정해지므로 스키마를 합칠 때 충돌하지 않음
+        columns_seen = dict.fromkeys(name for path in runs["path"] for name in pq.read_schema(path).names)
+        schema = result_schema(columns_seen)
+        for column in PARTITION_COLUMNS:
+            schema = schema.append(pa.field(column, pa.string()))
+        dataset = ds.dataset(runs["path"].tolist(), schema=schema, format="parquet", partitioning=_PARTITIONING, partition_base_dir=str(self.root_dir))
+        read_columns = None if columns is None else [*PARTITION_COLUMNS, *columns]
+        history = dataset.to_table(columns=read_columns).to_pandas()
+        return history.sort_values(["run", "board", "revision"], kind="stable", ignore_index=True)
+
+
+RESULTS_STORE = ResultsStore()
+
+
+# 이력 분석 함수 (ResultsStore.load 결과를 입력으로 받음)
+def run_deltas(history, key, value):
+    """
+    board + key(sink 식별 컬럼) 별로 run 순서대로 정렬해 직전 run 대비 value 변화량을 계산합니다.
+    prev_run, prev_{value}, {value}_delta 컬럼을 추가해 반환합니다.
+    """
+    key = [key] if isinstance(key, str) else list(key)
+    history = history.sort_values(["board", *key, "run"], kind="stable")
+    grouped = history.groupby(["board", *key], sort=False, dropna=False)
+    history["prev_run"] = grouped["run"].shift()
+    history[f"prev_{value}"] = grouped[value].shift()
+    history[f"{value}_delta"] = history[value] - history[f"prev_{value}"]
+    return history.sort_index()
+
+
+def worst_margins(history, key, margin):
+    """
+    board + key 별로 전체 이력 중 margin이 가장 작은 행(어느 revision / run인지 포함)을 반환합니다.
+    """
+    key = [key] if isinstance(key, str) else list(key)
+    history = history.dropna(subset=[margin])
+    worst = history.loc[history.groupby(["board", *key], dropna=False)[margin].idxmin()]
+    return worst.sort_values(margin, ignore_index=True)
+
+
+def regressions(history, key, value, threshold=0.0, higher_is_worse=True):
+    """
+    직전 run 대비 value가 threshold보다 크게 나빠진 행만 반환합니다.
+    higher_is_worse가 True면 증가(IR drop 등), False면 감소(margin 등)를 악화로 판단합니다.
+    """
+    deltas = run_deltas(history, key, value)
+    change = deltas[f"{value}_delta"] if higher_is_worse else -deltas[f"{value}_delta"]
+    return deltas[change > threshold].sort_values(f"{value}_delta", ascending=not higher_is_worse, ignore_index=True)
@@ -0,0 +1,454 @@
+import os
+import re
+import json
+import time
+import queue
+import shutil
+import logging
+import tempfile
+import itertools
+import threading
+import subprocess
+from io import StringIO
+from pathlib import Path
+from typing import NamedTuple
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+
+logger = logging.getLogger()
+
+# Sigrity 실행 파일 (환경 변수 CADENCE_SIGRITY_EXE로 변경, 테스트 시 tclsh 등 대체 인터프리터 사용 가능)
+SIGRITY_EXECUTABLE = os.environ.get("CADENCE_SIGRITY_EXE", "PowerDC")
+
+# 실행 인자 ({bootstrap}은 세션 bootstrap 스크립트 경로로 치환)
+#   Sigrity : PowerDC -tcl bootstrap.tcl
+#   tclsh   : tclsh bootstrap.tcl
+_SIGRITY_ARGS = ("-tcl", "{bootstrap}")
+_TCLSH_ARGS = ("{bootstrap}",)
+
+# presim 스크립트 실행 순서 (tcl_outputs 키)
+SCRIPT_ORDER = ("classify", "add", "nc", "assign", "simulation_setup")
+DELTA_SCRIPT_ORDER = ("classify_delta", "add_delta", "nc_delta")
+
+# 세션 프로토콜 표시 줄
+#   Python -> 도구 : 스크립트 줄들 + "#__END__ {id}"
+#   도구 -> Python : 스크립트 출력 + ("__ERROR__ {id} {메시지}") + "__DONE__ {id} {catch 코드}"
+#   (출력 마지막 줄에 줄바꿈이 없으면 표시가 그 줄 뒤에 붙어서 오므로 줄 끝에서 찾음)
+_END_MARKER = "#__END__"
+_ERROR_MARKER = "__ERROR__"
+_DONE_MARKER = "__DONE__"
+
+# 도구 안에서 stdin을 읽어 스크립트 단위로 실행하는 루프
+_BOOTSTRAP_TCL = """\
+fconfigure stdin -encoding utf-8 -translation auto
+fconfigure stdout -encoding utf-8 -translation lf -buffering line
+set __session_buffer ""
+while {[gets stdin __session_line] >= 0} {
+    if {[string match "#__END__ *" $__session_line]} {
+        set __session_id [lindex $__session_line 1]
+        set __session_code [catch {uplevel #0 $__session_buffer} __session_result]
+        set __session_buffer ""
+        if {$__session_code == 1} {
+            puts "__ERROR__ $__session_id [string map {"\\n" " "} $__session_result]"
+        }
+        puts "__DONE__ $__session_id $__session_code"
+        flush stdout
+    } else {
+        append __session_buffer $__session_line "\\n"
+    }
+}
+exit
+"""
+
+# presim 스크립트 결과 줄 ("Error Nets : {VDD_1} VDD_2", "Error VRMs : {U1: 3}")
+_ERROR_LINE_PATTERN = re.compile(r"^Error ([A-Za-z ]+?)\s*:\s*(.*)$")
+
+
+class SigrityError(RuntimeError):
+    pass
+
+
+class ScriptResult(NamedTuple):
+    name: str
+    status: str         # "ok" | "error" (처리되지 않은 TCL 오류)
+    errors: dict        # {"nets": [...], "vrms": [...], ...}
+    output: list
+    message: str
+    seconds: float
+
+
+def parse_tcl_list(text):
+    """
+    TCL 리스트 문자열을 항목 목록으로 변환합니다. ({...}는 한 항목, 중첩 괄호 / "..." / 백슬래시 지원)
+    """
+    items = []
+    i, n = 0, len(text)
+    while i < n:
+        while i < n and text[i].isspace():
+            i += 1
+        if i >= n:
+            break
+        if text[i] == "{":
+            depth, start = 1, i + 1
+            i += 1
+            while i < n and depth:
+                if text[i] == "\\":
+                    i += 1
+                elif text[i] == "{":
+                    depth += 1
+                elif text[i] == "}":
+                    depth -= 1
+                i += 1
+            items.append(text[start:i - 1])
+        elif text[i] == "\"":
+            start = i + 1
+            i += 1
+            while i < n and text[i] != "\"":
+                i += 2 if text[i] == "\\" else 1
+            items.append(text[start:i])
+            i += 1
+        else:
+            start = i
+            while i < n and not text[i].isspace():
+                i += 2 if text[i] == "\\" else 1
+            items.append(text[start:i])
+    return items
+
+
+def parse_error_lines(lines):
+    """
+    "Error Nets : ..." 형식의 결과 줄을 {"nets": [...]}로 변환합니다.
+    """
+    errors = dict()
+    for line in lines:
+        match = _ERROR_LINE_PATTERN.match(line.strip())
+        if match:
+            errors[match.group(1).strip().lower().replace(" ", "_")] = parse_tcl_list(match.group(2))
+    return errors
+
+
+def _is_script_file(source):
+    return isinstance(source, Path) or (isinstance(source, str) and "\n" not in source and os.path.isfile(source))
+
+
+def _script_text(source):
+    # tcl_outputs 값(파일 경로 또는 StringIO) 또는 TCL 문자열
+    if isinstance(source, StringIO):
+        return source.getvalue()
+    if _is_script_file(source):
+        with open(source, "r", encoding="utf-8") as f:
+            return f.read()
+    return source
+
+
+def presim_scripts(presim, delta=False):
+    """
+    PdcPresim / PsiPresim의 tcl_outputs를 실행 순서대로 [(이름, 스크립트)] 목록으로 반환합니다.
+    delta면 증분 스크립트(classify_delta 등)만 반환합니다.
+    """
+    return [(name, presim.tcl_outputs[name]) for name in (DELTA_SCRIPT_ORDER if delta else SCRIPT_ORDER) if name in presim.tcl_outputs]
+
+
+def sweep_scripts(sweep):
+    """
+    PdcPresim(generate_sweep_tcl 실행 후) 또는 sweep manifest(.json) 경로에서
+    (base 스크립트, {override 키: 스크립트}, variant 목록)을 반환합니다.
+    """
+    if isinstance(sweep, (str, Path)):
+        manifest_path = Path(sweep)
+        with open(manifest_path, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+        source = lambda entry: manifest_path.parent / entry["file"]
+    else:
+        manifest = sweep.sweep_manifest
+        if manifest is None:
+            raise ValueError("generate_sweep_tcl()을 먼저 실행해야 합니다.")
+        source = lambda entry: sweep.tcl_outputs[entry["script"]]
+    overrides = {key: source(entry) for key, entry in manifest["overrides"].items()}
+    return source(manifest["base"]), overrides, manifest["variants"]
+
+
+class SigritySession:
+    """
+    Sigrity(PowerDC / PowerSI) 프로세스 하나를 띄워두고 stdin으로 스크립트를 보내 실행하는 세션입니다.
+    design은 open_design()에서 한 번만 열고, 이후 스크립트는 같은 프로세스에서 이어서 실행합니다.
+    executable을 tclsh로 바꾸고 preload로 sigrity:: 대체 proc를 읽으면 라이선스 없이 테스트할 수 있습니다.
+    """
+    _ids = itertools.count(1)
+
+    def __init__(self, executable=None, args=None, preload=(), timeout=None, cwd=None):
+        # 상수
+        self.executable = executable or SIGRITY_EXECUTABLE
+        if args is None:
+            args = _TCLSH_ARGS if Path(self.executable).name.lower().startswith(("tclsh", "wish")) else _SIGRITY_ARGS
+        self.args = list(args)
+        self.preload = [Path(path) for path in preload]
+        self.timeout = timeout
+        self.cwd = cwd
+
+        # 변수
+        self.design = None
+        self.process = None
+        self._lines = queue.Queue()
+        self._bootstrap_path = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    @property
+    def alive(self):
+        return self.process is not None and self.process.poll() is None
+
+    def start(self):
+        if self.alive:
+            return self
+        with tempfile.NamedTemporaryFile("w", suffix=".tcl", prefix="sigrity_session_", delete=False, encoding="utf-8") as f:
+            f.write(_BOOTSTRAP_TCL)
+            self._bootstrap_path = f.name
+        command = [self.executable] + [arg.format(bootstrap=self._bootstrap_path) for arg in self.args]
+        logger.info(f"Sigrity 세션 시작 : {' '.join(command)}")
+        self.process = subprocess.Popen(
+            command, stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+            cwd=self.cwd, text=True, encoding="utf-8", errors="replace", bufsize=1
+        )
+        self._lines = queue.Queue()
+        threading.Thread(target=self._read_stdout, args=(self.process.stdout, self._lines), daemon=True).start()
+
+        for path in self.preload:
+            self.run_script(f"source {{{path.as_posix()}}}\n", name=f"preload:{path.name}", check=True)
+        return self
+
+    @staticmethod
+    def _read_stdout(stdout, lines):
+        for line in stdout:
+            lines.put(line.rstrip("\r\n"))
+        lines.put(None)
+
+    def _readline(self, deadline):
+        try:
+            line = self._lines.get(timeout=None if deadline is None else max(deadline - time.monotonic(), 0))
+        except queue.Empty:
+            self.close(kill=True)
+            raise SigrityError(f"Sigrity 응답 시간 초과 ({self.timeout}s)")
+        if line is None:
+            code = self.process.wait()
+            self.close()
+            raise SigrityError(f"Sigrity 프로세스가 종료되었습니다 (exit code {code})")
+        return line
+
+    def run_script(self, source, name=None, check=False):
+        """
+        스크립트(파일 경로 / StringIO / TCL 문자열)를 세션에서 실행하고 출력과 "Error ..." 결과 줄을 ScriptResult로 반환합니다.
+        check면 처리되지 않은 TCL 오류를 SigrityError로 발생시킵니다.
+        """
+        if not self.alive:
+            self.start()
+        name = name or (Path(source).name if _is_script_file(source) else "script")
+        script_id = next(self._ids)
+        text = _script_text(source)
+        start = time.perf_counter()
+        deadline = None if self.timeout is None else time.monotonic() + self.timeout
+
+        try:
+            self.process.stdin.write(text if text.endswith("\n") else text + "\n")
+            self.process.stdin.write(f"{_END_MARKER} {script_id}\n")
+            self.process.stdin.flush()
+        except (BrokenPipeError, OSError) as e:
+            raise SigrityError(f"Sigrity 세션에 스크립트를 보낼 수 없습니다 : {e}") from e
+
+        # 스크립트 출력이 줄바꿈 없이 끝나면(puts -nonewline 등) 표시가 같은 줄 뒤에 붙으므로 줄 안 어디서든 찾음
+        done_pattern = re.compile(rf"{_DONE_MARKER} {script_id} (-?\d+)$")
+        error_pattern = re.compile(rf"{_ERROR_MARKER} {script_id} (.*)$")
+        output = []
+        message = ""
+        while True:
+            line = self._readline(deadline)
+            match = done_pattern.search(line) or error_pattern.search(line)
+            if match is None:
+                output.append(line)
+                continue
+            if match.start():
+                output.append(line[:match.start()])
+            if match.re is error_pattern:
+                message = match.group(1)
+                continue
+            code = int(match.group(1))
+            break
+
+        result = ScriptResult(name, "ok" if code != 1 else "error", parse_error_lines(output), output, message, time.perf_counter() - start)
+        failed = {key: len(values) for key, values in result.errors.items() if values}
+        if result.status == "error":
+            logger.error(f"Sigrity : {name} 실패 - {message}")
+            if check:
+                raise SigrityError(f"{name} 실행 실패 : {message}")
+        elif failed:
+            logger.warning(f"Sigrity : {name} 완료 ({result.seconds:.1f}s), 오류 항목 {failed}")
+        else:
+            logger.info(f"Sigrity : {name} 완료 ({result.seconds:.1f}s)")
+        return result
+
+    def open_design(self, design_file_path):
+        """
+        design을 엽니다. 이미 같은 design이 열려 있으면 다시 열지 않습니다.
+        """
+        design_file_path = Path(design_file_path)
+        if self.alive and self.design == design_file_path:
+            return None
+        self.run_script(f"sigrity::open document {{{design_file_path.as_posix()}}} {{!}}\n", name=f"open:{design_file_path.name}", check=True)
+        self.design = design_file_path
+        return None
+
+    def run_scripts(self, scripts, design_file_path=None):
+        """
+        [(이름, 스크립트)] 또는 [스크립트] 목록을 순서대로 실행합니다. design_file_path가 있으면 먼저 엽니다.
+        """
+        if design_file_path is not None:
+            self.open_design(design_file_path)
+        results = []
+        for script in scripts:
+            name, source = script if isinstance(script, tuple) else (None, script)
+            results.append(self.run_script(source, name=name))
+        return results
+
+    def close(self, kill=False):
+        if self.process is not None:
+            try:
+                if kill:
+                    self.process.kill()
+                else:
+                    # stdin을 닫으면 bootstrap 루프가 끝나고 도구가 종료됨
+                    self.process.stdin.close()
+                    self.process.wait(timeout=30)
+            except (OSError, subprocess.TimeoutExpired):
+                self.process.kill()
+            self.process = None
+        if self._bootstrap_path is not None:
+            Path(self._bootstrap_path).unlink(missing_ok=True)
+            self._bootstrap_path = None
+        self.design = None
+        return None
+
+
+class SigrityPool:
+    """
+    SigritySession을 최대 size개까지 재사용하는 pool입니다. 같은 design을 요청하면 이미 그 design을 연 세션을 우선 사용하므로
+    design 로드는 보드마다 한 번만 합니다.
+    """
+    def __init__(self, size=1, **session_kwargs):
+        # 상수
+        self.size = size
+        self.session_kwargs = session_kwargs
+
+        # 변수
+        self.sessions = []
+        self._idle = []
+        self._condition = threading.Condition()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _acquire(self, design_file_path):
+        design_file_path = Path(design_file_path) if design_file_path else None
+        with self._condition:
+            while True:
+                for session in self._idle:
+                    if session.design == design_file_path and session.alive:
+                        self._idle.remove(session)
+                        return session
+                if len(self.sessions) < self.size:
+                    session = SigritySession(**self.session_kwargs)
+                    self.sessions.append(session)
+                    return session
+                if self._idle:
+                    # 다른 design을 연 세션 재사용 (design 다시 로드)
+                    return self._idle.pop(0)
+                self._condition.wait()
+
+    def _release(self, session):
+        with self._condition:
+            if session.alive:
+                self._idle.append(session)
+            else:
+                self.sessions.remove(session)
+            self._condition.notify()
+        return None
+
+    @contextmanager
+    def session(self, design_file_path=None):
+        """
+        design을 연 세션을 빌려줍니다. with 블록이 끝나면 pool로 돌아갑니다.
+        """
+        session = self._acquire(design_file_path)
+        try:
+            session.start()
+            if design_file_path is not None:
+                session.open_design(design_file_path)
+            yield session
+        finally:
+            self._release(session)
+
+    def run(self, design_file_path, scripts):
+        with self.session(design_file_path) as session:
+            return session.run_scripts(scripts)
+
+    def run_presim(self, design_file_path, presim, delta=False):
+        """
+        PdcPresim / PsiPresim이 만든 스크립트를 design 하나에 SCRIPT_ORDER 순서로 실행합니다.
+        delta면 증분 스크립트만 실행합니다. (증분 스크립트가 없으면 전체 스크립트 실행)
+        모든 스크립트가 오류 항목 없이 끝나면 presim의 증분 스냅샷을 확정(commit_snapshot)합니다.
+        """
+        scripts = presim_scripts(presim, delta)
+        if delta and not scripts:
+            logger.info("적용된 스냅샷이 없어 전체 스크립트를 실행합니다.")
+            scripts = presim_scripts(presim)
+        results = self.run(design_file_path, scripts)
+
+        if results and all(result.status == "ok" and not any(result.errors.values()) for result in results):
+            if hasattr(presim, "commit_snapshot"):
+                presim.commit_snapshot()
+        else:
+            logger.warning("실패한 스크립트 또는 오류 항목이 있어 증분 스냅샷을 갱신하지 않습니다.")
+        return results
+
+    def run_sweep(self, design_file_path, sweep, sweep_folder_path=None):
+        """
+        design을 sweep_folder_path/base/ 에 복사하여 base 스크립트를 한 번 실행(저장)한 뒤, override 스크립트마다
+        base 복사본을 다시 복사하여 최대 size개 세션에서 동시에 실행합니다. 원본 design은 수정하지 않습니다.
+        override 복사본은 sweep_folder_path/{override 키}/ 에 만들며
+        {variant 이름: ScriptResult}를 반환합니다. (같은 override를 쓰는 variant는 결과를 공유)
+        """
+        design_file_path = Path(design_file_path)
+        sweep_folder_path = Path(sweep_folder_path) if sweep_folder_path else design_file_path.parent / f"{design_file_path.stem}_sweep"
+        base, overrides, variants = sweep_scripts(sweep)
+
+        base_design_path = sweep_folder_path / "base" / design_file_path.name
+        base_design_path.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copy2(design_file_path, base_design_path)
+        base_result = self.run(base_design_path, [("sweep_base", base)])[0]
+        if base_result.status != "ok":
+            raise SigrityError(f"sweep base 스크립트 실행 실패 : {base_result.message}")
+
+        designs = dict()
+        for key in overrides:
+            designs[key] = sweep_folder_path / key / design_file_path.name
+            designs[key].parent.mkdir(parents=True, exist_ok=True)
+            shutil.copy2(base_design_path, designs[key])
+
+        with ThreadPoolExecutor(max_workers=self.size) as executor:
+            futures = {key: executor.submit(self.run, designs[key], [(f"sweep_{key}", source)]) for key, source in overrides.items()}
+            results = {key: future.result()[0] for key, future in futures.items()}
+        return {variant["name"]: results[variant["override"]] for variant in variants}
+
+    def close(self):
+        with self._condition:
+            for session in self.sessions:
+                session.close()
+            self.sessions.clear()
+            self._idle.clear()
+        return None
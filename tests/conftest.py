@@ -0,0 +1,20 @@
+import logging
+import pytest
+from benchmarks.synthetic import build_etl_workbook
+from etl_cache import EtlCache
+
+
+@pytest.fixture
+def etl_file(tmp_path):
+    # net 3개, net당 핀 16개인 작은 ETL 엑셀
+    return build_etl_workbook(tmp_path / "board.xlsx", nets=3, pins_per_net=16, pins_per_row=4)
+
+
+@pytest.fixture
+def etl_cache(tmp_path):
+    return EtlCache(tmp_path / "cache")
+
+
+@pytest.fixture(autouse=True)
+def _log_level(caplog):
+    caplog.set_level(logging.INFO)
@@ -0,0 +1,70 @@
+sigrity::clear
+sigrity::cls
+set error_vrms {}
+set error_sinks {}
+set error_discs {}
+
+set vrms {
+    {{VRM_PMIC0_VDD_0_0} {PMIC0} {0.8} {V0_0 V0_1 V0_2 V0_3}}
+    {{VRM_PMIC1_VDD_1_0} {PMIC1} {1.0} {V1_0 V1_1 V1_2 V1_3}}
+}
+
+set sinks {
+    {{SINK_U0_0_VDD_0_0} {U0_0} {0.01} {A0_0_0 A0_0_1 A0_0_2 A0_0_3}}
+    {{SINK_U0_0_VDD_0_0} {U0_0} {0.02} {A0_1_0 A0_1_1 A0_1_2 A0_1_3}}
+    {{SINK_U1_0_VDD_1_0} {U1_0} {0.01} {A1_0_0 A1_0_1 A1_0_2 A1_0_3}}
+    {{SINK_U1_0_VDD_1_0} {U1_0} {0.02} {A1_1_0 A1_1_1 A1_1_2 A1_1_3}}
+}
+
+set discs {
+    {{R0} {0.001}}
+    {{R1} {0.001}}
+}
+
+proc add_vrms {gnd vrms} {
+    global error_vrms
+    foreach row $vrms {
+        lassign $row port refdes v pins
+        catch {sigrity::add pdcVRM -m -name $port -voltage $v {!}}
+        catch {sigrity::link pdcElem $port {Negative Pin} [list -Circuit $refdes -Net $gnd] -LinkCktNode {!}}
+        foreach pin $pins {
+            if {[catch {sigrity::link pdcElem $port {Positive Pin} [list -Circuit $refdes -Node $pin] -LinkCktNode {!}}]} {
+                lappend error_vrms "$refdes: $pin"
+            }
+        }
+    }
+}
+
+proc add_sinks {gnd sinks} {
+    global error_sinks
+    foreach row $sinks {
+        lassign $row port refdes i pins
+        catch {sigrity::add pdcSINK -m -name $port -current $i -lt {5,%} -ut {5,%} -model {Equal Current} {!}}
+        catch {sigrity::link pdcElem $port {Negative Pin} [list -Circuit $refdes -Net $gnd] -LinkCktNode {!}}
+        foreach pin $pins {
+            if {[catch {sigrity::link pdcElem $port {Positive Pin} [list -Circuit $refdes -Node $pin] -LinkCktNode {!}}]} {
+                lappend error_sinks "$refdes: $pin"
+            }
+        }
+    }
+}
+
+proc add_discs {discs} {
+    global error_discs
+    foreach row $discs {
+        lassign $row refdes r
+        if {[catch {sigrity::add pdcInter -auto -ckt $refdes -resistance $r {!}}]} {
+            lappend error_discs $refdes
+        }
+    }
+}
+
+add_vrms {GND} $vrms
+add_sinks {GND} $sinks
+add_discs $discs
+sigrity::save {!}
+puts "\n============================================="
+puts "Error VRMs : $error_vrms"
+puts "Error SINKs : $error_sinks"
+puts "Error DISCs : $error_discs"
+puts "\n============================================="
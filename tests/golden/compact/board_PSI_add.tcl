@@ -0,0 +1,40 @@
+sigrity::clear
+sigrity::cls
+set error_ports {}
+set error_pins {}
+set ports {
+    {{VRM_PMIC0_VDD_0.0} {PMIC0} {V0_0 V0_1 V0_2 V0_3} {G0}}
+    {{VRM_PMIC1_VDD_1.0} {PMIC1} {V1_0 V1_1 V1_2 V1_3} {G1}}
+    {{VRM_U0_0_VDD_0.0_P0} {U0_0} {A0_0_0 A0_0_1 A0_0_2 A0_0_3} {G0_0}}
+    {{VRM_U0_0_VDD_0.0_P1} {U0_0} {A0_1_0 A0_1_1 A0_1_2 A0_1_3} {G0_1}}
+    {{VRM_U1_0_VDD_1.0_P0} {U1_0} {A1_0_0 A1_0_1 A1_0_2 A1_0_3} {G1_0}}
+    {{VRM_U1_0_VDD_1.0_P1} {U1_0} {A1_1_0 A1_1_1 A1_1_2 A1_1_3} {G1_1}}
+}
+
+proc add_ports {ports} {
+    global error_ports error_pins
+    foreach row $ports {
+        lassign $row port refdes pps nps
+        if {[catch {sigrity::add port -name $port {!}}]} {
+            lappend error_ports $port
+        }
+        catch {sigrity::update -name $port -refZ {1} {!}}
+        foreach pp $pps {
+            if {[catch {sigrity::hook port -name $port -c $refdes -pn $pp {!}}]} {
+                lappend error_pins $pp
+            }
+        }
+        foreach np $nps {
+            if {[catch {sigrity::hook port -name $port -c $refdes -nn $np {!}}]} {
+                lappend error_pins $np
+            }
+        }
+    }
+}
+
+add_ports $ports
+sigrity::save {!}
+puts "\n============================================="
+puts "Error Ports : $error_ports"
+puts "Error Pins : $error_pins"
+puts "\n============================================="
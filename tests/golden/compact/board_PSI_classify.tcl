@@ -0,0 +1,25 @@
+sigrity::clear
+sigrity::cls
+set error_nets {}
+
+set nets {
+    {{VDD_0.0}}
+    {{VDD_1.0}}
+}
+
+proc classify_nets {gnd nets} {
+    global error_nets
+    foreach row $nets {
+        lassign $row net
+        if {[catch {sigrity::move net {PowerNets} $net {!}}]} {
+            lappend error_nets $net
+        }
+        catch {sigrity::update net {PowerGndPair} $gnd $net {!}}
+    }
+}
+
+classify_nets {GND} $nets
+sigrity::save {!}
+puts "\n============================================="
+puts "Error Nets : $error_nets"
+puts "\n============================================="
@@ -0,0 +1,24 @@
+sigrity::clear
+sigrity::cls
+set error_components {}
+
+set components {
+    {{C0}}
+    {{C1}}
+}
+
+proc disable_components {components} {
+    global error_components
+    foreach row $components {
+        lassign $row comp
+        if {[catch {sigrity::update circuit -model {disable} $comp {!}}]} {
+            lappend error_components $comp
+        }
+    }
+}
+
+disable_components $components
+sigrity::save {!}
+puts "\n============================================="
+puts "Error Components : $error_components"
+puts "\n============================================="
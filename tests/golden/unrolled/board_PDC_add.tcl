@@ -0,0 +1,154 @@
+sigrity::clear
+sigrity::cls
+set error_vrms {}
+set error_sinks {}
+set error_discs {}
+
+catch {sigrity::add pdcVRM -m -name {VRM_PMIC0_VDD_0_0} -voltage {0.8} {!}}
+catch {sigrity::link pdcElem {VRM_PMIC0_VDD_0_0} {Negative Pin} {-Circuit {PMIC0} -Net {GND}} -LinkCktNode {!}}
+if {
+    [catch {sigrity::link pdcElem {VRM_PMIC0_VDD_0_0} {Positive Pin} {-Circuit {PMIC0} -Node {V0_0}} -LinkCktNode {!}}]
+} {
+    lappend error_vrms {PMIC0: V0_0}
+}
+if {
+    [catch {sigrity::link pdcElem {VRM_PMIC0_VDD_0_0} {Positive Pin} {-Circuit {PMIC0} -Node {V0_1}} -LinkCktNode {!}}]
+} {
+    lappend error_vrms {PMIC0: V0_1}
+}
+if {
+    [catch {sigrity::link pdcElem {VRM_PMIC0_VDD_0_0} {Positive Pin} {-Circuit {PMIC0} -Node {V0_2}} -LinkCktNode {!}}]
+} {
+    lappend error_vrms {PMIC0: V0_2}
+}
+if {
+    [catch {sigrity::link pdcElem {VRM_PMIC0_VDD_0_0} {Positive Pin} {-Circuit {PMIC0} -Node {V0_3}} -LinkCktNode {!}}]
+} {
+    lappend error_vrms {PMIC0: V0_3}
+}
+catch {sigrity::add pdcVRM -m -name {VRM_PMIC1_VDD_1_0} -voltage {1.0} {!}}
+catch {sigrity::link pdcElem {VRM_PMIC1_VDD_1_0} {Negative Pin} {-Circuit {PMIC1} -Net {GND}} -LinkCktNode {!}}
+if {
+    [catch {sigrity::link pdcElem {VRM_PMIC1_VDD_1_0} {Positive Pin} {-Circuit {PMIC1} -Node {V1_0}} -LinkCktNode {!}}]
+} {
+    lappend error_vrms {PMIC1: V1_0}
+}
+if {
+    [catch {sigrity::link pdcElem {VRM_PMIC1_VDD_1_0} {Positive Pin} {-Circuit {PMIC1} -Node {V1_1}} -LinkCktNode {!}}]
+} {
+    lappend error_vrms {PMIC1: V1_1}
+}
+if {
+    [catch {sigrity::link pdcElem {VRM_PMIC1_VDD_1_0} {Positive Pin} {-Circuit {PMIC1} -Node {V1_2}} -LinkCktNode {!}}]
+} {
+    lappend error_vrms {PMIC1: V1_2}
+}
+if {
+    [catch {sigrity::link pdcElem {VRM_PMIC1_VDD_1_0} {Positive Pin} {-Circuit {PMIC1} -Node {V1_3}} -LinkCktNode {!}}]
+} {
+    lappend error_vrms {PMIC1: V1_3}
+}
+catch {sigrity::add pdcSINK -m -name {SINK_U0_0_VDD_0_0} -current {0.01} -lt {5,%} -ut {5,%} -model {Equal Current} {!}}
+catch {sigrity::link pdcElem {SINK_U0_0_VDD_0_0} {Negative Pin} {-Circuit {U0_0} -Net {GND}} -LinkCktNode {!}}
+if {
+    [catch {sigrity::link pdcElem {SINK_U0_0_VDD_0_0} {Positive Pin} {-Circuit {U0_0} -Node {A0_0_0}} -LinkCktNode {!}}]
+} {
+    lappend error_sinks {U0_0: A0_0_0}
+}
+if {
+    [catch {sigrity::link pdcElem {SINK_U0_0_VDD_0_0} {Positive Pin} {-Circuit {U0_0} -Node {A0_0_1}} -LinkCktNode {!}}]
+} {
+    lappend error_sinks {U0_0: A0_0_1}
+}
+if {
+    [catch {sigrity::link pdcElem {SINK_U0_0_VDD_0_0} {Positive Pin} {-Circuit {U0_0} -Node {A0_0_2}} -LinkCktNode {!}}]
+} {
+    lappend error_sinks {U0_0: A0_0_2}
+}
+if {
+    [catch {sigrity::link pdcElem {SINK_U0_0_VDD_0_0} {Positive Pin} {-Circuit {U0_0} -Node {A0_0_3}} -LinkCktNode {!}}]
+} {
+    lappend error_sinks {U0_0: A0_0_3}
+}
+catch {sigrity::add pdcSINK -m -name {SINK_U0_0_VDD_0_0} -current {0.02} -lt {5,%} -ut {5,%} -model {Equal Current} {!}}
+catch {sigrity::link pdcElem {SINK_U0_0_VDD_0_0} {Negative Pin} {-Circuit {U0_0} -Net {GND}} -LinkCktNode {!}}
+if {
+    [catch {sigrity::link pdcElem {SINK_U0_0_VDD_0_0} {Positive Pin} {-Circuit {U0_0} -Node {A0_1_0}} -LinkCktNode {!}}]
+} {
+    lappend error_sinks {U0_0: A0_1_0}
+}
+if {
+    [catch {sigrity::link pdcElem {SINK_U0_0_VDD_0_0} {Positive Pin} {-Circuit {U0_0} -Node {A0_1_1}} -LinkCktNode {!}}]
+} {
+    lappend error_sinks {U0_0: A0_1_1}
+}
+if {
+    [catch {sigrity::link pdcElem {SINK_U0_0_VDD_0_0} {Positive Pin} {-Circuit {U0_0} -Node {A0_1_2}} -LinkCktNode {!}}]
+} {
+    lappend error_sinks {U0_0: A0_1_2}
+}
+if {
+    [catch {sigrity::link pdcElem {SINK_U0_0_VDD_0_0} {Positive Pin} {-Circuit {U0_0} -Node {A0_1_3}} -LinkCktNode {!}}]
+} {
+    lappend error_sinks {U0_0: A0_1_3}
+}
+catch {sigrity::add pdcSINK -m -name {SINK_U1_0_VDD_1_0} -current {0.01} -lt {5,%} -ut {5,%} -model {Equal Current} {!}}
+catch {sigrity::link pdcElem {SINK_U1_0_VDD_1_0} {Negative Pin} {-Circuit {U1_0} -Net {GND}} -LinkCktNode {!}}
+if {
+    [catch {sigrity::link pdcElem {SINK_U1_0_VDD_1_0} {Positive Pin} {-Circuit {U1_0} -Node {A1_0_0}} -LinkCktNode {!}}]
+} {
+    lappend error_sinks {U1_0: A1_0_0}
+}
+if {
+    [catch {sigrity::link pdcElem {SINK_U1_0_VDD_1_0} {Positive Pin} {-Circuit {U1_0} -Node {A1_0_1}} -LinkCktNode {!}}]
+} {
+    lappend error_sinks {U1_0: A1_0_1}
+}
+if {
+    [catch {sigrity::link pdcElem {SINK_U1_0_VDD_1_0} {Positive Pin} {-Circuit {U1_0} -Node {A1_0_2}} -LinkCktNode {!}}]
+} {
+    lappend error_sinks {U1_0: A1_0_2}
+}
+if {
+    [catch {sigrity::link pdcElem {SINK_U1_0_VDD_1_0} {Positive Pin} {-Circuit {U1_0} -Node {A1_0_3}} -LinkCktNode {!}}]
+} {
+    lappend error_sinks {U1_0: A1_0_3}
+}
+catch {sigrity::add pdcSINK -m -name {SINK_U1_0_VDD_1_0} -current {0.02} -lt {5,%} -ut {5,%} -model {Equal Current} {!}}
+catch {sigrity::link pdcElem {SINK_U1_0_VDD_1_0} {Negative Pin} {-Circuit {U1_0} -Net {GND}} -LinkCktNode {!}}
+if {
+    [catch {sigrity::link pdcElem {SINK_U1_0_VDD_1_0} {Positive Pin} {-Circuit {U1_0} -Node {A1_1_0}} -LinkCktNode {!}}]
+} {
+    lappend error_sinks {U1_0: A1_1_0}
+}
+if {
+    [catch {sigrity::link pdcElem {SINK_U1_0_VDD_1_0} {Positive Pin} {-Circuit {U1_0} -Node {A1_1_1}} -LinkCktNode {!}}]
+} {
+    lappend error_sinks {U1_0: A1_1_1}
+}
+if {
+    [catch {sigrity::link pdcElem {SINK_U1_0_VDD_1_0} {Positive Pin} {-Circuit {U1_0} -Node {A1_1_2}} -LinkCktNode {!}}]
+} {
+    lappend error_sinks {U1_0: A1_1_2}
+}
+if {
+    [catch {sigrity::link pdcElem {SINK_U1_0_VDD_1_0} {Positive Pin} {-Circuit {U1_0} -Node {A1_1_3}} -LinkCktNode {!}}]
+} {
+    lappend error_sinks {U1_0: A1_1_3}
+}
+if {
+    [catch {sigrity::add pdcInter -auto -ckt {R0} -resistance {0.001} {!}}]
+} {
+    lappend error_discs {R0}
+}
+if {
+    [catch {sigrity::add pdcInter -auto -ckt {R1} -resistance {0.001} {!}}]
+} {
+    lappend error_discs {R1}
+}
+sigrity::save {!}
+puts "\n============================================="
+puts "Error VRMs : $error_vrms"
+puts "Error SINKs : $error_sinks"
+puts "Error DISCs : $error_discs"
+puts "\n============================================="
@@ -0,0 +1,2 @@
+sigrity::update option -MaxEdgeLength {0.001000} {!}
+sigrity::save {!}
@@ -0,0 +1,195 @@
+sigrity::clear
+sigrity::cls
+set error_ports {}
+set error_pins {}
+if  {
+    [catch {sigrity::add port -name {VRM_PMIC0_VDD_0.0} {!}}]
+} {
+    lappend error_ports {VRM_PMIC0_VDD_0.0}
+}
+catch {sigrity::update -name {VRM_PMIC0_VDD_0.0} -refZ {1} {!}}
+if  {
+    [catch {sigrity::hook port -name {VRM_PMIC0_VDD_0.0} -c {PMIC0} -pn {V0_0} {!}}]
+} {
+    lappend error_pins {V0_0}
+}
+if  {
+    [catch {sigrity::hook port -name {VRM_PMIC0_VDD_0.0} -c {PMIC0} -pn {V0_1} {!}}]
+} {
+    lappend error_pins {V0_1}
+}
+if  {
+    [catch {sigrity::hook port -name {VRM_PMIC0_VDD_0.0} -c {PMIC0} -pn {V0_2} {!}}]
+} {
+    lappend error_pins {V0_2}
+}
+if  {
+    [catch {sigrity::hook port -name {VRM_PMIC0_VDD_0.0} -c {PMIC0} -pn {V0_3} {!}}]
+} {
+    lappend error_pins {V0_3}
+}
+if  {
+    [catch {sigrity::hook port -name {VRM_PMIC0_VDD_0.0} -c {PMIC0} -nn {G0} {!}}]
+} {
+    lappend error_pins {G0}
+}
+if  {
+    [catch {sigrity::add port -name {VRM_PMIC1_VDD_1.0} {!}}]
+} {
+    lappend error_ports {VRM_PMIC1_VDD_1.0}
+}
+catch {sigrity::update -name {VRM_PMIC1_VDD_1.0} -refZ {1} {!}}
+if  {
+    [catch {sigrity::hook port -name {VRM_PMIC1_VDD_1.0} -c {PMIC1} -pn {V1_0} {!}}]
+} {
+    lappend error_pins {V1_0}
+}
+if  {
+    [catch {sigrity::hook port -name {VRM_PMIC1_VDD_1.0} -c {PMIC1} -pn {V1_1} {!}}]
+} {
+    lappend error_pins {V1_1}
+}
+if  {
+    [catch {sigrity::hook port -name {VRM_PMIC1_VDD_1.0} -c {PMIC1} -pn {V1_2} {!}}]
+} {
+    lappend error_pins {V1_2}
+}
+if  {
+    [catch {sigrity::hook port -name {VRM_PMIC1_VDD_1.0} -c {PMIC1} -pn {V1_3} {!}}]
+} {
+    lappend error_pins {V1_3}
+}
+if  {
+    [catch {sigrity::hook port -name {VRM_PMIC1_VDD_1.0} -c {PMIC1} -nn {G1} {!}}]
+} {
+    lappend error_pins {G1}
+}
+if  {
+    [catch {sigrity::add port -name {VRM_U0_0_VDD_0.0_P0} {!}}]
+} {
+    lappend error_ports {VRM_U0_0_VDD_0.0_P0}
+}
+catch {sigrity::update -name {VRM_U0_0_VDD_0.0_P0} -refZ {1} {!}}
+if  {
+    [catch {sigrity::hook port -name {VRM_U0_0_VDD_0.0_P0} -c {U0_0} -pn {A0_0_0} {!}}]
+} {
+    lappend error_pins {A0_0_0}
+}
+if  {
+    [catch {sigrity::hook port -name {VRM_U0_0_VDD_0.0_P0} -c {U0_0} -pn {A0_0_1} {!}}]
+} {
+    lappend error_pins {A0_0_1}
+}
+if  {
+    [catch {sigrity::hook port -name {VRM_U0_0_VDD_0.0_P0} -c {U0_0} -pn {A0_0_2} {!}}]
+} {
+    lappend error_pins {A0_0_2}
+}
+if  {
+    [catch {sigrity::hook port -name {VRM_U0_0_VDD_0.0_P0} -c {U0_0} -pn {A0_0_3} {!}}]
+} {
+    lappend error_pins {A0_0_3}
+}
+if  {
+    [catch {sigrity::hook port -name {VRM_U0_0_VDD_0.0_P0} -c {U0_0} -nn {G0_0} {!}}]
+} {
+    lappend error_pins {G0_0}
+}
+if  {
+    [catch {sigrity::add port -name {VRM_U0_0_VDD_0.0_P1} {!}}]
+} {
+    lappend error_ports {VRM_U0_0_VDD_0.0_P1}
+}
+catch {sigrity::update -name {VRM_U0_0_VDD_0.0_P1} -refZ {1} {!}}
+if  {
+    [catch {sigrity::hook port -name {VRM_U0_0_VDD_0.0_P1} -c {U0_0} -pn {A0_1_0} {!}}]
+} {
+    lappend error_pins {A0_1_0}
+}
+if  {
+    [catch {sigrity::hook port -name {VRM_U0_0_VDD_0.0_P1} -c {U0_0} -pn {A0_1_1} {!}}]
+} {
+    lappend error_pins {A0_1_1}
+}
+if  {
+    [catch {sigrity::hook port -name {VRM_U0_0_VDD_0.0_P1} -c {U0_0} -pn {A0_1_2} {!}}]
+} {
+    lappend error_pins {A0_1_2}
+}
+if  {
+    [catch {sigrity::hook port -name {VRM_U0_0_VDD_0.0_P1} -c {U0_0} -pn {A0_1_3} {!}}]
+} {
+    lappend error_pins {A0_1_3}
+}
+if  {
+    [catch {sigrity::hook port -name {VRM_U0_0_VDD_0.0_P1} -c {U0_0} -nn {G0_1} {!}}]
+} {
+    lappend error_pins {G0_1}
+}
+if  {
+    [catch {sigrity::add port -name {VRM_U1_0_VDD_1.0_P0} {!}}]
+} {
+    lappend error_ports {VRM_U1_0_VDD_1.0_P0}
+}
+catch {sigrity::update -name {VRM_U1_0_VDD_1.0_P0} -refZ {1} {!}}
+if  {
+    [catch {sigrity::hook port -name {VRM_U1_0_VDD_1.0_P0} -c {U1_0} -pn {A1_0_0} {!}}]
+} {
+    lappend error_pins {A1_0_0}
+}
+if  {
+    [catch {sigrity::hook port -name {VRM_U1_0_VDD_1.0_P0} -c {U1_0} -pn {A1_0_1} {!}}]
+} {
+    lappend error_pins {A1_0_1}
+}
+if  {
+    [catch {sigrity::hook port -name {VRM_U1_0_VDD_1.0_P0} -c {U1_0} -pn {A1_0_2} {!}}]
+} {
+    lappend error_pins {A1_0_2}
+}
+if  {
+    [catch {sigrity::hook port -name {VRM_U1_0_VDD_1.0_P0} -c {U1_0} -pn {A1_0_3} {!}}]
+} {
+    lappend error_pins {A1_0_3}
+}
+if  {
+    [catch {sigrity::hook port -name {VRM_U1_0_VDD_1.0_P0} -c {U1_0} -nn {G1_0} {!}}]
+} {
+    lappend error_pins {G1_0}
+}
+if  {
+    [catch {sigrity::add port -name {VRM_U1_0_VDD_1.0_P1} {!}}]
+} {
+    lappend error_ports {VRM_U1_0_VDD_1.0_P1}
+}
+catch {sigrity::update -name {VRM_U1_0_VDD_1.0_P1} -refZ {1} {!}}
+if  {
+    [catch {sigrity::hook port -name {VRM_U1_0_VDD_1.0_P1} -c {U1_0} -pn {A1_1_0} {!}}]
+} {
+    lappend error_pins {A1_1_0}
+}
+if  {
+    [catch {sigrity::hook port -name {VRM_U1_0_VDD_1.0_P1} -c {U1_0} -pn {A1_1_1} {!}}]
+} {
+    lappend error_pins {A1_1_1}
+}
+if  {
+    [catch {sigrity::hook port -name {VRM_U1_0_VDD_1.0_P1} -c {U1_0} -pn {A1_1_2} {!}}]
+} {
+    lappend error_pins {A1_1_2}
+}
+if  {
+    [catch {sigrity::hook port -name {VRM_U1_0_VDD_1.0_P1} -c {U1_0} -pn {A1_1_3} {!}}]
+} {
+    lappend error_pins {A1_1_3}
+}
+if  {
+    [catch {sigrity::hook port -name {VRM_U1_0_VDD_1.0_P1} -c {U1_0} -nn {G1_1} {!}}]
+} {
+    lappend error_pins {G1_1}
+}
+sigrity::save {!}
+puts "\n============================================="
+puts "Error Ports : $error_ports"
+puts "Error Pins : $error_pins"
+puts "\n============================================="
@@ -0,0 +1,16 @@
+sigrity::clear
+sigrity::cls
+set error_nets {}
+
+ if {[catch {sigrity::move net {PowerNets} {VDD_0.0} {!}}]} {
+ lappend error_nets {VDD_0.0}
+}
+catch {sigrity::update net {PowerGndPair} {GND} {VDD_0.0} {!}}
+ if {[catch {sigrity::move net {PowerNets} {VDD_1.0} {!}}]} {
+ lappend error_nets {VDD_1.0}
+}
+catch {sigrity::update net {PowerGndPair} {GND} {VDD_1.0} {!}}
+sigrity::save {!}
+puts "\n============================================="
+puts "Error Nets : $error_nets"
+puts "\n============================================="
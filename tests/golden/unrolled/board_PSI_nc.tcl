@@ -0,0 +1,18 @@
+sigrity::clear
+sigrity::cls
+set error_components {}
+
+if  {
+    [catch {sigrity::update circuit -model {disable} {C0} {!}}]
+} {
+    lappend error_components {C0}
+}
+if  {
+    [catch {sigrity::update circuit -model {disable} {C1} {!}}]
+} {
+    lappend error_components {C1}
+}
+sigrity::save {!}
+puts "\n============================================="
+puts "Error Components : $error_components"
+puts "\n============================================="
@@ -0,0 +1,49 @@
+import os
+import pytest
+import batch
+
+_run_job = batch._run_job
+
+
+# name이 "crash"인 작업은 작업 프로세스를 강제 종료 (worker crash 재현)
+def _crashing_run_job(job):
+    if job["name"] == "crash":
+        os._exit(3)
+    return _run_job(job)
+
+
+def _jobs(etl_file, tmp_path, names):
+    return [
+        {"kind": "pdc_presim", "name": name, "etl": str(etl_file), "output": str(tmp_path / name), "gnd": "GND"}
+        for name in names
+    ]
+
+
+@pytest.fixture(autouse=True)
+def _cache_dir(tmp_path, monkeypatch):
+    # 작업 프로세스의 ETL 캐시 / 결과 저장소가 실제 ~/.cache/cadence에 쓰지 않도록 (spawn 작업 프로세스는 환경 변수를 물려받음)
+    monkeypatch.setenv("CADENCE_CACHE_DIR", str(tmp_path / "cadence"))
+
+
+def test_run_batch_reports_failures_per_job(etl_file, tmp_path):
+    jobs = _jobs(etl_file, tmp_path, ["a", "b"])
+    jobs.append({"kind": "pdc_postsim", "name": "missing", "report": str(tmp_path / "missing.htm"), "output": str(tmp_path / "missing")})
+    results = {result["name"]: result for result in batch.run_batch(jobs, max_workers=2)}
+
+    assert results["a"]["status"] == results["b"]["status"] == "ok"
+    assert results["missing"]["status"] == "failed"
+    assert (tmp_path / "a" / "board_PDC_add.tcl").exists()
+    assert any((tmp_path / "cadence" / "etl").iterdir())
+
+
+def test_crashed_worker_only_fails_its_own_job(etl_file, tmp_path, monkeypatch):
+    monkeypatch.setattr(batch, "_run_job", _crashing_run_job)
+    jobs = _jobs(etl_file, tmp_path, ["crash", "a", "b", "c"])
+    results = {result["name"]: result for result in batch.run_batch(jobs, max_workers=2, summary_path=tmp_path / "summary.json")}
+
+    assert sorted(results) == ["a", "b", "c", "crash"]
+    assert results["crash"]["status"] == "failed"
+    assert "비정상 종료" in results["crash"]["error"] and results["crash"]["retried"]
+    for name in ("a", "b", "c"):
+        assert results[name]["status"] == "ok", results[name]["error"]
+        assert (tmp_path / name / "board_PDC_add.tcl").exists()
@@ -0,0 +1,39 @@
+import logging
+import pandas as pd
+import pytest
+from connectivity import Connectivity, validate_connectivity
+from etl_schema import EtlValidationError, normalize_sheets
+
+
+def _connectivity(sink_nets, sink_pins=("A1", "A2")):
+    dfs = normalize_sheets({
+        "vrm": pd.DataFrame({"refdes": ["PMIC"], "net": ["VIN"], "subnet": ["VDD_CORE"], "pin": ["V1"], "v": [0.8]}),
+        "sink": pd.DataFrame({
+            "refdes": [f"U{i}" for i in range(len(sink_nets))], "net": list(sink_nets), "subnet": list(sink_nets),
+            "pin": list(sink_pins)[:len(sink_nets)], "current": [0.1] * len(sink_nets),
+        }),
+    })
+    return Connectivity(dfs, ["net", "subnet"], ["pin"])
+
+
+def test_vrm_subnet_counts_as_source():
+    warnings = validate_connectivity(_connectivity(["VDD_CORE", "VIN"]), "GND")
+    assert warnings.empty
+
+
+def test_orphan_and_gnd_nets_are_warnings(caplog):
+    warnings = validate_connectivity(_connectivity(["VDD_IO", "GND"]), "GND")
+
+    assert warnings[["row", "value", "problem"]].values.tolist()[:2] == [[2, "VDD_IO", "VRM이 없는 net"], [3, "GND", "VRM이 없는 net"]]
+    assert "GND net" in warnings["problem"].tolist()
+    assert any(record.levelno == logging.WARNING and "연결 검증 경고" in record.message for record in caplog.records)
+
+
+def test_duplicate_pins_still_raise():
+    dfs = normalize_sheets({
+        "vrm": pd.DataFrame({"refdes": ["PMIC"], "net": ["VIN"], "subnet": ["VIN"], "pin": ["V1"], "v": [0.8]}),
+        "sink": pd.DataFrame({"refdes": ["U1", "U1"], "net": ["VIN", "VIN"], "subnet": ["VIN", "VIN"], "pin": ["A1", "A1"], "current": [0.1, 0.1]}),
+    })
+    with pytest.raises(EtlValidationError) as e:
+        validate_connectivity(Connectivity(dfs, ["net", "subnet"], ["pin"]), "GND")
+    assert set(e.value.issues["problem"]) == {"핀 중복"}
@@ -0,0 +1,106 @@
+import shutil
+import pytest
+import presim
+from benchmarks.synthetic import build_etl_workbook
+from sigrity import SigrityPool
+
+TCLSH = shutil.which("tclsh")
+
+# 모든 sigrity:: 명령을 성공으로 처리하는 대체 proc
+_STUB = """
+namespace eval sigrity {}
+foreach command {clear cls move update add link save delete hook open} {
+    proc sigrity::$command {args} {}
+}
+"""
+
+
+def _presim(etl_file, tcl_folder):
+    return presim.PdcPresim("GND", etl_file, tcl_folder, ETL_CACHE=None, LAZY=True)
+
+
+def _build(path, discs):
+    return build_etl_workbook(path, nets=2, pins_per_net=8, pins_per_row=4, discs=discs, ncs=2)
+
+
+def _delta_path(tcl_folder, name):
+    return tcl_folder / f"board_PDC_{name}.tcl"
+
+
+def test_snapshot_is_feather_and_json(tmp_path):
+    etl_file = _build(tmp_path / "board.xlsx", discs=2)
+    p = _presim(etl_file, tmp_path / "tcl")
+    p.compute("delta_tcl")
+    assert p.commit_snapshot()
+
+    snapshot_path = tmp_path / "tcl" / "board_PDC_snapshot"
+    assert sorted(path.name for path in snapshot_path.iterdir()) == ["disc.feather", "meta.json", "nets.feather", "sink.feather", "vrm.feather"]
+    assert not (tmp_path / "tcl" / "board_PDC_snapshot.pending").exists()
+
+
+def test_snapshot_advances_only_on_commit(tmp_path):
+    tcl_folder = tmp_path / "tcl"
+    etl_file = _build(tmp_path / "board.xlsx", discs=2)
+    p = _presim(etl_file, tcl_folder)
+    p.compute("delta_tcl")
+    assert not _delta_path(tcl_folder, "add_delta").exists()
+    p.commit_snapshot()
+
+    # 적용하지 않고 두 번 생성해도 기준은 마지막 commit 시점 그대로
+    _build(etl_file, discs=3)
+    for _ in range(2):
+        _presim(etl_file, tcl_folder).compute("delta_tcl")
+        assert "-ckt {R2}" in _delta_path(tcl_folder, "add_delta").read_text(encoding="utf-8")
+
+    p = _presim(etl_file, tcl_folder)
+    p.compute("delta_tcl")
+    p.commit_snapshot()
+    _presim(etl_file, tcl_folder).compute("delta_tcl")
+    assert "-ckt {R2}" not in _delta_path(tcl_folder, "add_delta").read_text(encoding="utf-8")
+
+
+def test_stale_delta_scripts_removed_without_snapshot(tmp_path):
+    tcl_folder = tmp_path / "tcl"
+    etl_file = _build(tmp_path / "board.xlsx", discs=2)
+    p = _presim(etl_file, tcl_folder)
+    p.compute("delta_tcl")
+    p.commit_snapshot()
+    _presim(etl_file, tcl_folder).compute("delta_tcl")
+    assert _delta_path(tcl_folder, "classify_delta").exists()
+
+    # 적용된 스냅샷이 사라지면(GND 변경 등) 이전 증분 스크립트도 지움
+    shutil.rmtree(tcl_folder / "board_PDC_snapshot")
+    _presim(etl_file, tcl_folder).compute("delta_tcl")
+    assert not _delta_path(tcl_folder, "classify_delta").exists()
+    assert not _delta_path(tcl_folder, "add_delta").exists()
+
+
+@pytest.mark.skipif(TCLSH is None, reason="tclsh 없음")
+@pytest.mark.parametrize("fail", [False, True])
+def test_run_presim_commits_snapshot_on_success(tmp_path, fail):
+    stub_path = tmp_path / "stub.tcl"
+    stub_path.write_text(_STUB + ("proc sigrity::add {args} {error \"no license\"}\n" if fail else ""), encoding="utf-8")
+    design_path = tmp_path / "board.spd"
+    design_path.write_text("design", encoding="utf-8")
+
+    etl_file = _build(tmp_path / "board.xlsx", discs=2)
+    p = _presim(etl_file, tmp_path / "tcl")
+    p.compute()
+    with SigrityPool(executable=TCLSH, preload=[stub_path], timeout=60) as pool:
+        results = pool.run_presim(design_path, p)
+
+    assert [result.name for result in results] == ["classify", "add", "simulation_setup"]
+    assert (tmp_path / "tcl" / "board_PDC_snapshot").exists() != fail
+
+
+def test_psi_delta_against_committed_snapshot(tmp_path):
+    tcl_folder = tmp_path / "tcl"
+    etl_file = build_etl_workbook(tmp_path / "board.xlsx", nets=2, pins_per_net=8, pins_per_row=4, discs=2, ncs=2)
+    p = presim.PsiPresim("GND", etl_file, tcl_folder, ETL_CACHE=None, LAZY=True)
+    p.compute("delta_tcl")
+    p.commit_snapshot()
+
+    build_etl_workbook(etl_file, nets=2, pins_per_net=8, pins_per_row=4, discs=2, ncs=3)
+    presim.PsiPresim("GND", etl_file, tcl_folder, ETL_CACHE=None, LAZY=True).compute("delta_tcl")
+    nc_delta = (tcl_folder / "board_PSI_nc_delta.tcl").read_text(encoding="utf-8")
+    assert "C2" in nc_delta and "C1" not in nc_delta
@@ -0,0 +1,78 @@
+import shutil
+import pandas as pd
+import presim
+from etl_cache import EtlCache
+
+
+def _assert_same_dfs(left, right):
+    assert list(left) == list(right)
+    for sheet_name in left:
+        pd.testing.assert_frame_equal(left[sheet_name], right[sheet_name])
+
+
+def _load(etl_file, cache, backend="openpyxl"):
+    return presim._load_etl(etl_file, backend=backend, cache=cache)
+
+
+def test_memory_and_disk_hits_match_fresh_read(etl_file, etl_cache, tmp_path):
+    fresh = presim._read_excel(etl_file, backend="openpyxl")
+    _assert_same_dfs(_load(etl_file, etl_cache), fresh)
+
+    # 메모리 캐시
+    _assert_same_dfs(_load(etl_file, etl_cache), fresh)
+
+    # 디스크 캐시 (새 프로세스와 같은 상태)
+    _assert_same_dfs(_load(etl_file, EtlCache(tmp_path / "cache")), fresh)
+
+
+def test_hit_does_not_read_excel(etl_file, etl_cache, monkeypatch):
+    _load(etl_file, etl_cache)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("캐시 적중인데 엑셀을 다시 읽음")
+    monkeypatch.setattr(presim, "_read_excel", fail)
+    _load(etl_file, etl_cache)
+    etl_cache.memory.clear()
+    _load(etl_file, etl_cache)
+
+
+def test_blank_header_is_same_on_every_layer(tmp_path, etl_cache):
+    # 빈 헤더(None) 컬럼이 메모리 / 디스크 / 새로 읽기에서 같은 이름("")이어야 함
+    raw = {"nc": pd.DataFrame([["C1", "x"], ["C2", None]], columns=["refdes", None])}
+    dfs = presim.normalize_sheets(raw)
+    assert list(dfs["nc"].columns) == ["refdes", ""]
+
+    etl_file = tmp_path / "dummy.xlsx"
+    etl_file.write_bytes(b"dummy")
+    key = etl_cache.key(etl_file, 1)
+    etl_cache.put(key, dfs, etl_file)
+    _assert_same_dfs(etl_cache.get(key), dfs)
+    etl_cache.memory.clear()
+    _assert_same_dfs(etl_cache.get(key), dfs)
+
+
+def test_key_depends_on_backend(etl_file, etl_cache):
+    assert etl_cache.key(etl_file, 1, "openpyxl") != etl_cache.key(etl_file, 1, "xlwings")
+
+
+def test_evict_skips_entries_removed_by_other_process(etl_file, tmp_path, monkeypatch):
+    cache = EtlCache(tmp_path / "cache", max_bytes=0)
+    _load(etl_file, cache)
+    removed = tmp_path / "cache" / "etl" / "removed"
+    entries = cache._entries() + [removed]
+    monkeypatch.setattr(cache, "_entries", lambda: entries)
+    cache._evict()
+    assert not any(path.exists() for path in entries)
+
+
+def test_get_tolerates_entry_removed_after_read(etl_file, etl_cache, monkeypatch):
+    _load(etl_file, etl_cache)
+    etl_cache.memory.clear()
+    key = etl_cache.key(etl_file, presim._NORMALIZATION_VERSION, "openpyxl")
+
+    utime = presim.os.utime
+    def removing_utime(path, *args, **kwargs):
+        shutil.rmtree(path)
+        return utime(path, *args, **kwargs)
+    monkeypatch.setattr("etl_cache.os.utime", removing_utime)
+    assert etl_cache.get(key) is not None
@@ -0,0 +1,53 @@
+import openpyxl
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+import presim
+from etl_schema import EtlValidationError, normalize_sheets, validate_sheets
+
+
+def _workbook_with_offset(path):
+    # 헤더가 C3에서 시작하고 중간에 빈 행이 있는 disc 시트
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.title = "disc"
+    ws["C3"], ws["D3"] = "refdes", "resistance"
+    ws["C4"], ws["D4"] = "R1", 0.001
+    ws["C6"], ws["D6"] = "R2", "abc"
+    ws["C7"], ws["D7"] = None, 0.002
+    wb.save(path)
+    return path
+
+
+def test_validation_reports_excel_row_numbers(tmp_path):
+    dfs = presim._read_excel(_workbook_with_offset(tmp_path / "offset.xlsx"), backend="openpyxl")
+    with pytest.raises(EtlValidationError) as e:
+        validate_sheets(dfs, {"disc": ["refdes", "resistance"]})
+    issues = e.value.issues
+    assert issues[["row", "column", "problem"]].values.tolist() == [[6, "resistance", "숫자 아님"]]
+
+
+def test_ffill_and_row_numbers_of_blank_required_values(tmp_path):
+    raw = presim._read_sheets_openpyxl(_workbook_with_offset(tmp_path / "offset.xlsx"), max_workers=1)
+    assert raw["disc"].index.tolist() == [2, 3, 4, 5]
+    dfs = normalize_sheets(raw)
+    # refdes는 ffill 대상이므로 7행은 R2로 채워지고, 빈 5행은 제거
+    assert dfs["disc"]["refdes"].tolist() == ["R1", "R2", "R2"]
+    assert (dfs["disc"].index + 2).tolist() == [4, 6, 7]
+
+
+def test_missing_sheet_and_column(tmp_path):
+    raw = {"disc": presim.pd.DataFrame({"refdes": ["R1"]})}
+    with pytest.raises(EtlValidationError) as e:
+        validate_sheets(normalize_sheets(raw), {"disc": ["refdes", "resistance"], "vrm": ["refdes"]})
+    assert sorted(e.value.issues["problem"]) == ["시트 없음", "컬럼 없음"]
+
+
+def test_parallel_read_from_thread_matches_sequential(etl_file):
+    # LazyPipeline compute()처럼 스레드 안에서 시트 병렬 읽기 (spawn 프로세스)
+    sequential = presim._read_sheets_openpyxl(etl_file, max_workers=1)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        parallel = executor.submit(presim._read_sheets_openpyxl, etl_file, 2).result()
+
+    assert list(parallel) == list(sequential)
+    for sheet_name, df in sequential.items():
+        presim.pd.testing.assert_frame_equal(parallel[sheet_name], df)
@@ -0,0 +1,38 @@
+import os
+import json
+import threading
+from instrumentation import Instrumentation
+
+
+def test_trace_written_once_with_pid(tmp_path):
+    instrumentation = Instrumentation(enabled=True, trace_file_path=str(tmp_path / "trace.json"))
+    for name in ("a", "b"):
+        with instrumentation.stage(name, owner="Test"):
+            with instrumentation.stage("inner"):
+                pass
+    trace_path = tmp_path / f"trace.{os.getpid()}.json"
+    assert not trace_path.exists()
+
+    assert instrumentation.write_trace() == str(trace_path)
+    events = json.loads(trace_path.read_text(encoding="utf-8"))["traceEvents"]
+    assert [event["name"] for event in events] == ["inner", "Test.a", "inner", "Test.b"]
+    assert not any(event["args"].get("memory_shared") for event in events)
+    instrumentation.reset()
+
+
+def test_concurrent_stages_marked_memory_shared():
+    instrumentation = Instrumentation(enabled=True)
+    barrier = threading.Barrier(2)
+
+    def run(name):
+        with instrumentation.stage(name):
+            barrier.wait()
+            barrier.wait()
+
+    threads = [threading.Thread(target=run, args=(name,)) for name in ("a", "b")]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert all(event["args"]["memory_shared"] for event in instrumentation.events)
+    instrumentation.reset()
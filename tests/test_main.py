@@ -0,0 +1,47 @@
+import shutil
+import pytest
+import main
+from benchmarks.synthetic import build_pdc_report
+
+
+@pytest.fixture(autouse=True)
+def _cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("CADENCE_CACHE_DIR", str(tmp_path / "cadence"))
+
+
+def test_presim_validate_only(etl_file, tmp_path):
+    assert main.main(["--log", "", "presim", "pdc", str(etl_file), "-o", str(tmp_path / "out"), "--validate-only", "--no-cache"]) == 0
+    assert not list((tmp_path / "out").glob("*.tcl"))
+
+
+def test_presim_only_one_artifact(etl_file, tmp_path):
+    output = tmp_path / "out"
+    assert main.main(["--log", "", "presim", "pdc", str(etl_file), "-o", str(output), "--only", "add_tcl", "--no-cache"]) == 0
+    assert sorted(path.name for path in output.glob("*.tcl")) == ["board_PDC_add.tcl"]
+
+
+def test_presim_unknown_artifact(etl_file, tmp_path):
+    with pytest.raises(SystemExit, match="오류"):
+        main.main(["--log", "", "presim", "pdc", str(etl_file), "--only", "nope", "--no-cache"])
+
+
+def test_postsim_only_result_excel(tmp_path):
+    report = build_pdc_report(tmp_path / "board.htm", sinks=8, images=1, image_size=8, distinct_images=1)
+    output = tmp_path / "out"
+    assert main.main(["--log", "", "postsim", "pdc", str(report), str(output), "--only", "result_excel", "--no-store"]) == 0
+    assert (output / "board_PDC_Result.xlsx").exists()
+    assert not list(output.rglob("*.png"))
+    assert not (tmp_path / "cadence" / "results").exists()
+
+
+def test_missing_etl_exits_without_traceback(tmp_path, caplog):
+    assert main.main(["--log", "", "presim", "pdc", str(tmp_path / "missing.xlsx"), "--no-cache"]) == 1
+    assert "missing.xlsx" in caplog.text
+
+
+@pytest.mark.skipif(shutil.which("tclsh") is None, reason="tclsh 없음")
+def test_sigrity_error_exits_without_traceback(etl_file, tmp_path, caplog):
+    # tclsh에는 sigrity::open이 없으므로 design 열기가 SigrityError로 실패
+    args = ["--log", "", "presim", "pdc", str(etl_file), "-o", str(tmp_path / "out"), "--no-cache", "--design", str(tmp_path / "board.spd"), "--sigrity", shutil.which("tclsh")]
+    assert main.main(args) == 1
+    assert "실행 실패" in caplog.text
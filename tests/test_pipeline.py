@@ -0,0 +1,54 @@
+import pytest
+from pipeline import LazyPipeline, artifact
+
+
+class _Pipeline(LazyPipeline):
+    def __init__(self):
+        self.calls = []
+
+    @artifact("source")
+    def load(self):
+        self.calls.append("source")
+        return len(self.calls)
+
+    @artifact("left", requires=["source"])
+    def make_left(self):
+        self.calls.append("left")
+        return "left"
+
+    @artifact("right", requires=["source"])
+    def make_right(self):
+        self.calls.append("right")
+
+
+def test_artifact_memoized_with_value():
+    pipeline = _Pipeline()
+    assert pipeline.load() == 1
+    assert pipeline.load() == 1
+    assert pipeline.make_left() == "left"
+    assert pipeline.calls == ["source", "left"]
+
+
+def test_artifact_rejects_arguments():
+    with pytest.raises(TypeError):
+        _Pipeline().load(1)
+    with pytest.raises(TypeError):
+        _Pipeline().make_left(force=True)
+
+
+def test_compute_runs_shared_requirement_once():
+    pipeline = _Pipeline()
+    pipeline.compute("left", "right")
+    assert sorted(pipeline.calls) == ["left", "right", "source"]
+
+
+def test_invalidate_reruns_dependents():
+    pipeline = _Pipeline()
+    pipeline.compute()
+    pipeline.invalidate("source")
+    assert not pipeline.is_computed("left")
+    pipeline.compute("left")
+    assert pipeline.calls.count("source") == 2 and pipeline.calls.count("left") == 2
+    assert pipeline.load() == 4
+    with pytest.raises(KeyError):
+        pipeline.compute("missing")
@@ -0,0 +1,55 @@
+import os
+import pytest
+import pandas as pd
+import postsim
+from benchmarks.synthetic import build_pdc_report
+from results_store import ResultsStore
+
+
+@pytest.fixture
+def report_file(tmp_path):
+    return build_pdc_report(tmp_path / "report.htm", sinks=40, images=3, image_size=16, distinct_images=2)
+
+
+def _run(report_file, output, store):
+    return postsim.pdc_postsim(report_file, output, RESULTS_STORE=store, BOARD="board")
+
+
+def test_rerun_hits_cache_without_parsing(report_file, tmp_path):
+    store = ResultsStore(tmp_path / "store")
+    first = _run(report_file, tmp_path / "out", store)
+    second = _run(report_file, tmp_path / "out", store)
+
+    assert not second.is_computed("report")
+    pd.testing.assert_frame_equal(second.df_merged, first.df_merged)
+    pd.testing.assert_frame_equal(second.df_result, first.df_result)
+    assert len(store.runs()) == 1
+    assert sorted(os.listdir(tmp_path / "out" / ".cache")) == ["report_PDC_manifest_result_table.feather"]
+
+
+def test_modified_outputs_are_rebuilt(report_file, tmp_path):
+    first = _run(report_file, tmp_path / "out", None)
+    excel = first.output_excel_file_path
+    image = os.path.join(first.output_pic_folder_path, "Layer_1.png")
+    excel_bytes = open(excel, "rb").read()
+    image_bytes = open(image, "rb").read()
+
+    # 파일이 있어도 크기 / 수정 시각이 기록과 다르면 다시 생성
+    with open(excel, "wb") as f:
+        f.write(b"truncated")
+    with open(image, "ab") as f:
+        f.write(b"junk")
+    _run(report_file, tmp_path / "out", None)
+
+    assert open(excel, "rb").read() != b"truncated" and len(open(excel, "rb").read()) == len(excel_bytes)
+    assert open(image, "rb").read() == image_bytes
+
+
+def test_corrupt_frame_cache_falls_back_to_report(report_file, tmp_path):
+    first = _run(report_file, tmp_path / "out", None)
+    cache_path = tmp_path / "out" / ".cache" / "report_PDC_manifest_result_table.feather"
+    cache_path.write_bytes(b"not feather")
+    second = _run(report_file, tmp_path / "out", None)
+
+    assert second.is_computed("report")
+    pd.testing.assert_frame_equal(second.df_merged, first.df_merged)
@@ -0,0 +1,56 @@
+import base64
+from io import BytesIO
+import numpy as np
+from PIL import Image
+import postsim
+
+
+def _png_bytes(seed=0, size=16):
+    buffer = BytesIO()
+    Image.fromarray(np.random.default_rng(seed).integers(0, 255, (size, size, 3), dtype=np.uint8)).save(buffer, "PNG")
+    return buffer.getvalue()
+
+
+def _data_url(data, mime="image/png"):
+    return f"data:{mime};base64," + base64.b64encode(data).decode()
+
+
+def test_png_payload_written_without_reencoding(tmp_path):
+    data = _png_bytes()
+    result = postsim._extract_image(_data_url(data), str(tmp_path / "a.png"), thumbnail_size=(4, 4), webp=True)
+
+    assert result["error"] == "" and not result["converted"]
+    assert (tmp_path / "a.png").read_bytes() == data
+    assert (tmp_path / "a_thumb.png").exists() and (tmp_path / "a.webp").exists()
+
+
+def test_non_png_payload_does_not_create_file(tmp_path):
+    save_path = tmp_path / "a.png"
+    result = postsim._extract_image(_data_url(b"not a png image at all"), str(save_path))
+
+    assert "PNG 데이터가 아닙니다" in result["error"]
+    assert not save_path.exists()
+
+
+def test_corrupt_png_payload_removes_partial_file(tmp_path):
+    # PNG 시그니처 뒤에서 base64가 깨진 payload (파일을 연 뒤 실패), 이전 실행의 파일도 남지 않아야 함
+    save_path = tmp_path / "a.png"
+    save_path.write_bytes(_png_bytes(1))
+    (tmp_path / "a_thumb.png").write_bytes(b"old")
+    source = _data_url(_png_bytes()[:48]) + "A"
+    result = postsim._extract_image(source, str(save_path), thumbnail_size=(4, 4))
+
+    assert result["error"]
+    assert not save_path.exists()
+    assert not (tmp_path / "a_thumb.png").exists()
+
+
+def test_extract_images_in_threads_matches_sequential(tmp_path):
+    sources = [_data_url(_png_bytes(seed)) for seed in range(4)]
+    sources.append(_data_url(_png_bytes(9)).replace("image/png", "image/x-unknown"))
+    sequential = postsim._extract_images([(source, str(tmp_path / f"s{i}.png")) for i, source in enumerate(sources)], max_workers=1)
+    threaded = postsim._extract_images([(source, str(tmp_path / f"t{i}.png")) for i, source in enumerate(sources)], max_workers=3)
+
+    assert [result["error"] == "" for result in threaded] == [result["error"] == "" for result in sequential]
+    for i in range(len(sources)):
+        assert (tmp_path / f"s{i}.png").read_bytes() == (tmp_path / f"t{i}.png").read_bytes()
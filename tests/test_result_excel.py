@@ -0,0 +1,60 @@
+import openpyxl
+from openpyxl.cell.cell import MergedCell
+import pandas as pd
+import pytest
+import postsim
+
+
+def _result_frame():
+    # A열 refdes : U1 3행, U2 1행, U3 2행 연속 / F열 Pass/Fail
+    return pd.DataFrame({
+        "refdes": ["U1", "U1", "U1", "U2", "U3", "U3"],
+        "net": ["VDD", "VCC", "VDD_한글", "VDD", "VDD", "VCC"],
+        "Voltage (V)": [1.0, 0.98, 0.97, 1.0, 0.9, 1.123456789012345],
+        "IR Drop (mV)": [1, 20, 30, 1, 100, 2],
+        "Spec (mV)": [50, 50, 50, 50, 50, 50],
+        "Pass/Fail": ["Pass", "Pass", "Fail", "Pass", "Fail", "Pass"],
+        "Margin (%)": [98.0, 60.0, 40.0, None, -100.0, 96.0],
+    })
+
+
+def test_merge_ranges():
+    assert postsim._merge_ranges(["U1", "U1", "U1", "U2", "U3", "U3"]) == [(0, 2), (4, 5)]
+    assert postsim._merge_ranges([None, None, "U1"]) == [(0, 1)]
+    assert postsim._merge_ranges([]) == []
+
+
+def test_openpyxl_writer_formats(tmp_path):
+    df = _result_frame()
+    path = tmp_path / "result.xlsx"
+    postsim._write_result_openpyxl(df, path)
+    ws = openpyxl.load_workbook(path)["Sheet1"]
+
+    # refdes 병합 (병합된 아래쪽 셀은 비움)
+    assert sorted(str(cell_range) for cell_range in ws.merged_cells.ranges) == ["A2:A4", "A6:A7"]
+    assert [ws.cell(row, 1).value for row in range(2, 8)] == ["U1", None, None, "U2", "U3", None]
+    assert [ws.cell(row, 2).value for row in range(2, 8)] == df["net"].tolist()
+    assert ws["G5"].value is None
+
+    # 헤더 / Fail 행 / 일반 행 서식
+    for cell in ws[1]:
+        assert cell.fill.fgColor.rgb.endswith("CCFF99")
+    fail_rows = {4, 6}
+    for row in range(2, 8):
+        # 병합된 아래쪽 셀은 openpyxl이 읽을 때 서식을 버림
+        for cell in (cell for cell in ws[row] if not isinstance(cell, MergedCell)):
+            if row in fail_rows:
+                assert cell.fill.fgColor.rgb.endswith("FFCCCC")
+                assert cell.font.color.rgb.endswith("FF0000")
+            else:
+                assert cell.fill.fill_type is None
+    for row in ws.iter_rows(min_row=1, max_row=7):
+        for cell in (cell for cell in row if not isinstance(cell, MergedCell)):
+            assert cell.font.name == "현대하모니 M" and cell.font.sz == 16
+            assert {cell.border.left.style, cell.border.right.style, cell.border.top.style, cell.border.bottom.style} == {"thin"}
+
+    # 열 너비 : 표시 글자 수(한글 2칸, 숫자는 최대 11자) * 16 / 11 + 2
+    expected = [len("refdes"), len("VDD_") + 2 * 2, len("Voltage (V)"), len("IR Drop (mV)"), len("Spec (mV)"), len("Pass/Fail"), len("Margin (%)")]
+    widths = [ws.column_dimensions[letter].width for letter in "ABCDEFG"]
+    assert widths == pytest.approx([length * 16 / 11 + 2 for length in expected])
+    assert postsim._column_widths(pd.DataFrame({"x": [1.123456789012345]}))[0] == pytest.approx(11 * 16 / 11 + 2)
@@ -0,0 +1,83 @@
+import pandas as pd
+import pytest
+from etl_cache import EtlCache
+from results_store import ResultsStore, regressions, run_deltas, worst_margins
+
+
+def test_default_store_shares_root_with_etl_cache(tmp_path, monkeypatch):
+    monkeypatch.setenv("CADENCE_CACHE_DIR", str(tmp_path))
+    monkeypatch.delenv("CADENCE_RESULTS_DIR", raising=False)
+    assert ResultsStore().root_dir == tmp_path / "results"
+    assert EtlCache().cache_dir == tmp_path / "etl"
+
+
+def test_column_types_fixed_across_runs(tmp_path):
+    # 같은 컬럼이 한 실행에서는 숫자, 다른 실행에서는 문자열이어도 이력을 합칠 수 있어야 함
+    store = ResultsStore(tmp_path)
+    store.append(pd.DataFrame({"Name": ["S1", "S2"], "Margin (%)": [1.5, -0.5], "Note": [1, 2]}), "board", "A", "20260101T000000")
+    store.append(pd.DataFrame({"Name": ["S1", "S2"], "Margin (%)": ["1.0", "N/A"], "Note": ["x", None]}), "board", "B", "20260102T000000")
+    store.append(pd.DataFrame({"Name": ["S1"], "IR Drop (mV)": [3]}), "board", "B", "20260103T000000")
+
+    history = store.load()
+    assert history["Margin (%)"].dtype == "float64"
+    assert history["Margin (%)"].tolist()[:3] == [1.5, -0.5, 1.0]
+    assert history["Margin (%)"].isna().sum() == 2
+    assert history["Note"].tolist()[:4] == ["1", "2", "x", None]
+    assert history["IR Drop (mV)"].dtype == "float64"
+
+    deltas = run_deltas(history[history["run"] < "20260103"], "Name", "Margin (%)")
+    assert deltas.loc[deltas["revision"] == "B", "Margin (%)_delta"].tolist()[0] == -0.5
+
+
+@pytest.fixture
+def history(tmp_path):
+    # revision A -> B -> C 순서의 run, board2는 C 없음 / board1 S2의 C margin은 비어 있음
+    store = ResultsStore(tmp_path)
+    rows = {
+        ("board1", "A"): {"Name": ["S1", "S2"], "IR Drop (mV)": [10, 5], "Margin (%)": [5, 1]},
+        ("board1", "B"): {"Name": ["S1", "S2"], "IR Drop (mV)": [12, 9], "Margin (%)": [2, 3]},
+        ("board1", "C"): {"Name": ["S1", "S2"], "IR Drop (mV)": [11, 9.5], "Margin (%)": [4, None]},
+        ("board2", "A"): {"Name": ["S1"], "IR Drop (mV)": [7], "Margin (%)": [0]},
+        ("board2", "B"): {"Name": ["S1"], "IR Drop (mV)": [7], "Margin (%)": [-1]},
+    }
+    for (board, revision), values in rows.items():
+        store.append(pd.DataFrame(values), board, revision, f"2026010{'ABC'.index(revision) + 1}T000000")
+    return store.load()
+
+
+def _rows(df, *columns):
+    return df[["board", "Name", "revision", *columns]].values.tolist()
+
+
+def test_worst_margins_per_board_and_sink(history):
+    worst = worst_margins(history, "Name", "Margin (%)")
+    assert _rows(worst, "Margin (%)") == [
+        ["board2", "S1", "B", -1],
+        ["board1", "S2", "A", 1],
+        ["board1", "S1", "B", 2],
+    ]
+
+
+def test_regressions_higher_is_worse(history):
+    # board1 S1 : 10 -> 12 (+2) -> 11, S2 : 5 -> 9 (+4) -> 9.5 (+0.5), board2 S1 : 7 -> 7
+    assert _rows(regressions(history, "Name", "IR Drop (mV)"), "IR Drop (mV)_delta") == [
+        ["board1", "S2", "B", 4],
+        ["board1", "S1", "B", 2],
+        ["board1", "S2", "C", 0.5],
+    ]
+    assert _rows(regressions(history, "Name", "IR Drop (mV)", threshold=1), "IR Drop (mV)_delta") == [
+        ["board1", "S2", "B", 4],
+        ["board1", "S1", "B", 2],
+    ]
+
+
+def test_regressions_lower_is_worse(history):
+    # margin 감소가 악화 : board1 S1 5 -> 2 (-3), board2 S1 0 -> -1 (-1), 비어 있는 값은 제외
+    regressed = regressions(history, "Name", "Margin (%)", higher_is_worse=False)
+    assert _rows(regressed, "prev_run", "Margin (%)_delta") == [
+        ["board1", "S1", "B", "20260101T000000", -3],
+        ["board2", "S1", "B", "20260101T000000", -1],
+    ]
+    assert _rows(regressions(history, "Name", "Margin (%)", threshold=1, higher_is_worse=False), "Margin (%)_delta") == [
+        ["board1", "S1", "B", -3],
+    ]
@@ -0,0 +1,64 @@
+import shutil
+import pytest
+from sigrity import SigrityError, SigritySession, parse_tcl_list
+
+TCLSH = shutil.which("tclsh")
+pytestmark = pytest.mark.skipif(TCLSH is None, reason="tclsh 없음")
+
+# sigrity:: 명령 대체 proc (open은 design 경로를 기록)
+_STUB = """
+namespace eval sigrity {}
+proc sigrity::open {args} {global opened; set opened [lindex $args 1]}
+proc sigrity::move {args} {if {[lindex $args 2] eq "BAD"} {error "no such net"}}
+"""
+
+
+@pytest.fixture
+def session(tmp_path):
+    stub_path = tmp_path / "stub.tcl"
+    stub_path.write_text(_STUB, encoding="utf-8")
+    with SigritySession(executable=TCLSH, preload=[stub_path], timeout=30) as session:
+        yield session
+
+
+def test_output_without_trailing_newline(session):
+    # 마지막 출력에 줄바꿈이 없어도 완료 표시를 찾아야 함 (이전에는 세션이 멈춤)
+    result = session.run_script('puts "first"\nputs -nonewline "partial"\n')
+    assert result.status == "ok"
+    assert result.output == ["first", "partial"]
+
+    result = session.run_script('puts -nonewline "x"; error "boom"')
+    assert result.status == "error" and result.message == "boom"
+    assert result.output == ["x"]
+
+
+def test_state_persists_and_error_lines_parsed(session):
+    session.run_script("set error_nets {}")
+    result = session.run_script(
+        'foreach net {VDD BAD {A B}} {\n'
+        '    if {[catch {sigrity::move net {PowerNets} $net {!}}]} {lappend error_nets $net}\n'
+        '}\n'
+        'puts "Error Nets : $error_nets"\n'
+    )
+    assert result.status == "ok"
+    assert result.errors == {"nets": ["BAD"]}
+
+
+def test_open_design_once_and_check(session, tmp_path):
+    design_path = tmp_path / "board.spd"
+    session.open_design(design_path)
+    session.open_design(design_path)
+    assert session.run_script("puts $opened").output == [design_path.as_posix()]
+    with pytest.raises(SigrityError):
+        session.run_script("error {bad script}", check=True)
+
+
+def test_closed_process_raises(tmp_path):
+    with SigritySession(executable=TCLSH, timeout=30) as session:
+        with pytest.raises(SigrityError):
+            session.run_script("exit 3")
+        assert session.run_script("puts ok").output == ["ok"]
+
+
+def test_parse_tcl_list():
+    assert parse_tcl_list('{VDD 1} "a b" c\\ d {x {y}}') == ["VDD 1", "a b", "c\\ d", "x {y}"]
@@ -0,0 +1,110 @@
+import json
+import shutil
+import pytest
+import presim
+from sigrity import SigrityPool
+
+TCLSH = shutil.which("tclsh")
+
+# save는 열린 design 파일에 "saved"를 덧붙임 (design 변경 추적)
+_STUB = """
+namespace eval sigrity {}
+foreach command {clear cls move update add link delete hook} {
+    proc sigrity::$command {args} {}
+}
+proc sigrity::open {args} {global doc; set doc [lindex $args 1]}
+proc sigrity::save {args} {global doc; set f [::open $doc a]; puts $f saved; close $f}
+"""
+
+
+# conftest etl_file : net마다 VRM 1개 (v 0.8 / 1.0 / 1.2), sink port 1개에 4행 (current 0.01 ~ 0.04, 마지막 행 0.04)
+_VRMS = {"VRM_PMIC0_VDD_0_0": 0.8, "VRM_PMIC1_VDD_1_0": 1.0, "VRM_PMIC2_VDD_2_0": 1.2}
+_SINKS = ["SINK_U0_0_VDD_0_0", "SINK_U1_0_VDD_1_0", "SINK_U2_0_VDD_2_0"]
+
+
+@pytest.fixture
+def pdc(etl_file, tmp_path):
+    return presim.PdcPresim("GND", etl_file, tmp_path / "tcl", ETL_CACHE=None, LAZY=True)
+
+
+def _override(pdc, *args):
+    return "".join(pdc.iter_sweep_override_tcl(*args))
+
+
+def test_mesh_length_keeps_small_values(pdc):
+    assert "-MaxEdgeLength {0.001000}" in "".join(pdc.iter_simulation_setup_tcl())
+    assert "-MaxEdgeLength {1e-07}" in "".join(pdc.iter_simulation_setup_tcl(1e-7))
+    assert "-MaxEdgeLength {0.0025}" in "".join(pdc.iter_simulation_setup_tcl(0.0025))
+    with pytest.raises(ValueError):
+        "".join(pdc.iter_simulation_setup_tcl(0))
+
+
+def test_sweep_variants_keep_distinct_small_mesh(pdc):
+    manifest = pdc.generate_sweep_tcl(max_edge_lengths=(1e-7, 2e-7))
+    assert len(manifest["overrides"]) == 2
+
+
+def test_override_scales_last_row_values(pdc):
+    pdc.initialize()
+    script = _override(pdc, 0.001, 1.5, 1.1)
+
+    for port, v in _VRMS.items():
+        assert f"-name {{{port}}} -voltage {{{round(v * 1.1, 9)}}} " in script
+    for port in _SINKS:
+        # 같은 port의 4행 중 마지막 행(0.04) 값만 한 번
+        assert script.count(f"-name {{{port}}} ") == 1
+        assert f"-name {{{port}}} -current {{0.06}} " in script
+
+
+def test_override_scales_last_row_values_compact(etl_file, tmp_path):
+    pdc = presim.PdcPresim("GND", etl_file, None, TCL_MODE="compact", ETL_CACHE=None, LAZY=True)
+    pdc.initialize()
+    script = _override(pdc, 0.001, 1.5, 1.1)
+
+    assert "{{VRM_PMIC2_VDD_2_0} {1.32}}" in script
+    assert all(f"{{{{{port}}} {{0.06}}}}" in script for port in _SINKS)
+    assert not any(port in _override(pdc, 0.001, 1.0, 1.0) for port in [*_VRMS, *_SINKS])
+
+
+def test_unit_scale_emits_no_updates(pdc):
+    pdc.initialize()
+    script = _override(pdc, 0.002, 1.0, 1.0)
+
+    assert "pdcVRM" not in script and "pdcSINK" not in script
+    assert "-MaxEdgeLength {0.002}" in script
+    assert "pdcSINK" in _override(pdc, 0.002, 1.2, 1.0) and "pdcVRM" not in _override(pdc, 0.002, 1.2, 1.0)
+
+
+def test_identical_overrides_share_key(pdc, tmp_path):
+    # 1.5와 1.5000000001은 반올림 후 같은 전류 (0.06) -> override 스크립트 하나
+    manifest = pdc.generate_sweep_tcl(max_edge_lengths=(0.001,), current_scales=(1.0, 1.5, 1.5000000001))
+
+    keys = [variant["override"] for variant in manifest["variants"]]
+    assert len(keys) == 3 and keys[1] == keys[2] != keys[0]
+    assert sorted(manifest["overrides"]) == sorted(set(keys))
+    files = {path.name for path in (tmp_path / "tcl").glob("board_PDC_sweep_*.tcl")}
+    assert files == {manifest["base"]["file"], *(entry["file"] for entry in manifest["overrides"].values())}
+    assert len(files) == 3
+
+    with open(tmp_path / "tcl" / "board_PDC_sweep.json", "r", encoding="utf-8") as f:
+        assert json.load(f) == pdc.sweep_manifest
+
+
+@pytest.mark.skipif(TCLSH is None, reason="tclsh 없음")
+def test_run_sweep_never_modifies_design(pdc, tmp_path):
+    stub_path = tmp_path / "stub.tcl"
+    stub_path.write_text(_STUB, encoding="utf-8")
+    design_path = tmp_path / "board.spd"
+    design_path.write_text("design\n", encoding="utf-8")
+    pdc.generate_sweep_tcl(max_edge_lengths=(0.001, 0.002), current_scales=(1.0, 1.2))
+
+    with SigrityPool(size=2, executable=TCLSH, preload=[stub_path], timeout=60) as pool:
+        results = pool.run_sweep(design_path, pdc, tmp_path / "sweep")
+
+    assert design_path.read_text(encoding="utf-8") == "design\n"
+    base = (tmp_path / "sweep" / "base" / "board.spd").read_text(encoding="utf-8")
+    assert base.startswith("design\nsaved\n")
+    assert len(results) == 4 and all(result.status == "ok" for result in results.values())
+    for key in pdc.sweep_manifest["overrides"]:
+        override = (tmp_path / "sweep" / key / "board.spd").read_text(encoding="utf-8")
+        assert override.startswith(base) and len(override) > len(base)
@@ -0,0 +1,61 @@
+import shutil
+import subprocess
+from pathlib import Path
+import pytest
+import presim
+from benchmarks.synthetic import build_etl_workbook
+from etl_cache import EtlCache
+
+# golden 파일 : user-004(unrolled) / user-005(compact) 시점 출력 (이후 렌더링 변경은 바이트 단위로 같아야 함)
+GOLDEN = Path(__file__).parent / "golden"
+SCRIPTS = ["PDC_classify", "PDC_add", "PDC_simulation_setup", "PSI_classify", "PSI_add", "PSI_nc"]
+TCLSH = shutil.which("tclsh")
+
+# sigrity:: 명령을 실행하지 않고 인자만 기록하는 대체 proc
+_RECORDER = """
+namespace eval sigrity {}
+foreach command {clear cls move update add link save delete hook open} {
+    proc sigrity::$command {args} [list puts "CALL $command \\$args"]
+}
+"""
+
+
+@pytest.fixture
+def golden_etl(tmp_path):
+    return build_etl_workbook(tmp_path / "board.xlsx", nets=2, pins_per_net=8, pins_per_row=4, discs=2, ncs=2)
+
+
+def _generate(etl_file, tcl_folder, mode, cache=None):
+    presim.PdcPresim("GND", etl_file, tcl_folder, TCL_MODE=mode, ETL_CACHE=cache)
+    presim.PsiPresim("GND", etl_file, tcl_folder, TCL_MODE=mode, ETL_CACHE=cache)
+    return {script: (tcl_folder / f"board_{script}.tcl").read_bytes() for script in SCRIPTS}
+
+
+@pytest.mark.parametrize("mode", ["unrolled", "compact"])
+def test_tcl_matches_golden(golden_etl, tmp_path, mode):
+    outputs = _generate(golden_etl, tmp_path / "tcl", mode)
+    for script, output in outputs.items():
+        assert output == (GOLDEN / mode / f"board_{script}.tcl").read_bytes(), script
+
+
+@pytest.mark.parametrize("mode", ["unrolled", "compact"])
+def test_tcl_from_disk_cache_matches_golden(golden_etl, tmp_path, mode):
+    # 캐시 저장 후 새 캐시 객체(디스크 feather)로 다시 생성해도 같아야 함
+    _generate(golden_etl, tmp_path / "first", mode, EtlCache(tmp_path / "cache"))
+    outputs = _generate(golden_etl, tmp_path / "second", mode, EtlCache(tmp_path / "cache"))
+    for script, output in outputs.items():
+        assert output == (GOLDEN / mode / f"board_{script}.tcl").read_bytes(), script
+
+
+@pytest.mark.skipif(TCLSH is None, reason="tclsh 없음")
+@pytest.mark.parametrize("script", ["PDC_classify", "PDC_add", "PSI_classify", "PSI_add", "PSI_nc"])
+def test_compact_issues_same_commands_as_unrolled(script, tmp_path):
+    # 두 모드의 스크립트를 tclsh에서 실행해 sigrity:: 호출 순서와 오류 목록이 같은지 비교
+    def run(mode):
+        path = tmp_path / f"{mode}.tcl"
+        path.write_text(_RECORDER + (GOLDEN / mode / f"board_{script}.tcl").read_text(encoding="utf-8"), encoding="utf-8")
+        return subprocess.run([TCLSH, str(path)], capture_output=True, text=True, check=True).stdout
+
+    unrolled = run("unrolled")
+    assert "CALL" in unrolled
+    assert run("compact") == unrolled
@@ -0,0 +1,188 @@
+import numpy as np
+import pandas as pd
+import pytest
+import postsim
+from touchstone import read_self_impedance
+
+
+def _write(path, text):
+    path.write_text(text)
+    return path
+
+
+def _z(path):
+    frequencies, z_self, names = read_self_impedance(path)
+    return frequencies, z_self, names
+
+
+# S11 = 0.5 -> Z = 50 * (1 + 0.5) / (1 - 0.5) = 150 Ohm
+@pytest.mark.parametrize("option, row", [
+    ("# MHz S RI R 50", "1 0.5 0"),
+    ("# MHz S MA R 50", "1 0.5 0"),
+    ("# MHz S DB R 50", f"1 {float(20 * np.log10(0.5))!r} 0"),
+])
+def test_s_formats(tmp_path, option, row):
+    frequencies, z_self, names = _z(_write(tmp_path / "a.s1p", f"{option}\n{row}\n"))
+
+    assert frequencies.tolist() == [1e6]
+    assert z_self[0, 0] == pytest.approx(150)
+    assert names == ["Port1"]
+
+
+def test_ma_angle(tmp_path):
+    # S11 = 1∠90° -> Z = 50 * (1 + j) / (1 - j) = 50j
+    _, z_self, _ = _z(_write(tmp_path / "a.s1p", "# Hz S MA R 50\n1 1 90\n"))
+
+    assert z_self[0, 0] == pytest.approx(50j)
+
+
+def test_v1_normalizes_y_and_z(tmp_path):
+    # Touchstone 1.0의 Y/Z는 R로 정규화된 값
+    _, z_from_z, _ = _z(_write(tmp_path / "z.s1p", "# Hz Z RI R 50\n1 0.5 0\n"))
+    _, z_from_y, _ = _z(_write(tmp_path / "y.s1p", "# Hz Y RI R 50\n1 2 0\n"))
+
+    assert z_from_z[0, 0] == pytest.approx(25)
+    assert z_from_y[0, 0] == pytest.approx(25)
+
+
+def test_v2_y_and_z_are_not_normalized(tmp_path):
+    header = "[Version] 2.0\n# Hz {} RI R 50\n[Number of Ports] 1\n[Network Data]\n"
+    _, z_from_z, _ = _z(_write(tmp_path / "z.s1p", header.format("Z") + "1 0.5 0\n[End]\n"))
+    _, z_from_y, _ = _z(_write(tmp_path / "y.s1p", header.format("Y") + "1 0.02 0\n[End]\n"))
+
+    assert z_from_z[0, 0] == pytest.approx(0.5)
+    assert z_from_y[0, 0] == pytest.approx(50)
+
+
+def test_s2p_matrix_conversion(tmp_path):
+    # S = [[0, 0.5], [0.5, 0]] -> Z = 50 / 0.75 * [[1.25, 1], [1, 1.25]]
+    _, z_self, _ = _z(_write(tmp_path / "a.s2p", "# Hz S RI R 50\n1 0 0 0.5 0 0.5 0 0 0\n"))
+
+    assert z_self[0] == pytest.approx([50 * 1.25 / 0.75, 50 * 1.25 / 0.75])
+
+
+@pytest.mark.parametrize("reference", ["[Reference] 1 1", "[Reference] 1\n1", "[Reference]\n1\n1"])
+def test_v2_reference_scales_s_to_z(tmp_path, reference):
+    # PsiPresim 포트(refZ=1) : S11 = 0, S22 = 0.5 -> Z11 = 1, Z22 = 3 (옵션 줄의 R 50은 쓰지 않음)
+    text = f"[Version] 2.0\n# Hz S RI R 50\n[Number of Ports] 2\n{reference}\n[Number of Frequencies] 1\n[Network Data]\n1 0 0 0 0 0 0 0.5 0\n[End]\n"
+    _, z_self, _ = _z(_write(tmp_path / "a.s2p", text))
+
+    assert z_self[0] == pytest.approx([1, 3])
+
+
+def test_v2_reference_count_must_match_ports(tmp_path):
+    text = "[Version] 2.0\n# Hz S RI R 50\n[Number of Ports] 2\n[Reference] 1 1 1\n[Network Data]\n1 0 0 0 0 0 0 0 0\n"
+    with pytest.raises(ValueError, match=r"\[Reference\]"):
+        _z(_write(tmp_path / "a.s2p", text))
+
+
+def test_v2_noise_data_is_not_network_data(tmp_path):
+    text = (
+        "[Version] 2.0\n# GHz S RI R 50\n[Number of Ports] 2\n[Two-Port Data Order] 12_21\n[Number of Frequencies] 2\n"
+        "[Number of Noise Frequencies] 1\n[Network Data]\n"
+        "1 0 0 0 0 0 0 0 0\n2 0.5 0 0 0 0 0 0.5 0\n"
+        "[Noise Data]\n1 1.5 0.5 30 0.4\n[End]\n"
+    )
+    frequencies, z_self, _ = _z(_write(tmp_path / "a.s2p", text))
+
+    assert frequencies.tolist() == [1e9, 2e9]
+    assert z_self[1] == pytest.approx([150, 150])
+
+
+def test_bad_token_reports_line(tmp_path):
+    path = _write(tmp_path / "a.s1p", "# Hz S RI R 50\n1 0 0\n2 N/A 0\n3 0 0\n")
+    with pytest.raises(ValueError, match="2 N/A 0"):
+        _z(path)
+
+
+def test_value_count_mismatch(tmp_path):
+    with pytest.raises(ValueError, match="남은 값 2개"):
+        _z(_write(tmp_path / "a.s1p", "# Hz S RI R 50\n1 0 0\n2 0\n"))
+
+
+def test_port_name_comments(tmp_path):
+    text = "! Port[1] = VRM_U1_VDD\n! Port2 = U2_VDD_P1\n# Hz Z RI R 50\n1 1 0 0 0 0 0 2 0\n"
+    _, z_self, names = _z(_write(tmp_path / "a.s2p", text))
+
+    assert names == ["VRM_U1_VDD", "U2_VDD_P1"]
+    assert z_self[0] == pytest.approx([50, 100])
+
+
+def test_load_targets_dict_and_csv(tmp_path):
+    masks = postsim._load_targets({"VDD": 0.01, "VCC": [(1e8, 0.1), (1e6, 0.001)]})
+    assert masks["VDD"][0].tolist() == [0, np.inf] and masks["VDD"][1].tolist() == [0.01, 0.01]
+    assert masks["VCC"][0].tolist() == [1e6, 1e8]
+
+    csv = tmp_path / "targets.csv"
+    pd.DataFrame({"net": ["VCC", "VCC"], "frequency": [1e8, 1e6], "impedance": [0.1, 0.001]}).to_csv(csv, index=False)
+    from_csv = postsim._load_targets(csv)
+    assert from_csv["VCC"][0].tolist() == [1e6, 1e8] and from_csv["VCC"][1].tolist() == [0.001, 0.1]
+
+
+def test_port_nets_prefers_longest_match():
+    names = ["VRM_U1_VDD_CORE", "U2_VDD_CORE_P3", "U3_CORE_P1", "U4_GND_P1"]
+
+    assert postsim._port_nets(names, ["CORE", "VDD_CORE"]) == ["VDD_CORE", "VDD_CORE", "CORE", None]
+
+
+def test_target_matrix_log_log_interpolation():
+    masks = postsim._load_targets({"VCC": [(1e6, 1e-3), (1e8, 1e-1)], "VDD": 0.01})
+    frequencies = np.array([1e5, 1e6, 1e7, 1e8, 1e9])
+    target = postsim._target_matrix(frequencies, masks, ["VCC", "VDD", None])
+
+    assert np.isnan(target[[0, 4], 0]).all()
+    assert target[1:4, 0] == pytest.approx([1e-3, 1e-2, 1e-1])
+    assert target[:, 1] == pytest.approx([0.01] * 5)
+    assert np.isnan(target[:, 2]).all()
+
+
+def test_analyze_impedance_outcomes():
+    frequencies = np.array([1e6, 1e7, 1e8])
+    masks = postsim._load_targets({"VCC": [(1e6, 1e-3), (1e8, 1e-1)]})
+    z_self = np.array([
+        # Pass : |Z| 최대(1e8)가 아니라 |Z|/목표 최대(1e7, 0.9)가 최악
+        [0.5e-3, 9e-3, 0.05],
+        # Fail : 1e6에서 목표의 2배
+        [2e-3, 5e-3, 6e-3],
+        # N/A : 목표가 없으면 |Z| 최대
+        [0.4e-3, 5e-3, 4e-3],
+    ]).T
+    df = postsim._analyze_impedance(frequencies, z_self, ["U1_VCC_P1", "U2_VCC_P1", "U3_GND_P1"], ["VCC", "VCC", None], masks)
+
+    assert df["Port"].tolist() == ["U1_VCC_P1", "U2_VCC_P1", "U3_GND_P1"]
+    assert df["Pass/Fail"].tolist() == ["Pass", "Fail", "N/A"]
+    assert df["Worst Frequency (MHz)"].tolist() == [10, 1, 10]
+    assert df["|Z| (mOhm)"].tolist() == pytest.approx([9, 2, 5])
+    assert df["Target (mOhm)"].iloc[:2].tolist() == pytest.approx([10, 1])
+    assert df["Margin (%)"].iloc[:2].tolist() == pytest.approx([10, -100])
+    assert np.isnan(df["Target (mOhm)"].iloc[2])
+
+
+def test_psi_postsim_end_to_end(tmp_path):
+    text = (
+        "! Port[1] = VRM_U1_VDD\n! Port[2] = U2_VDD_P1\n"
+        "[Version] 2.0\n# MHz S RI R 50\n[Number of Ports] 2\n[Reference] 1 1\n[Network Data]\n"
+        "1 0 0 0 0 0 0 0 0\n10 0 0 0 0 0 0 0.5 0\n[End]\n"
+    )
+    path = _write(tmp_path / "board.s2p", text)
+    result = postsim.psi_postsim(path, tmp_path / "out", {"VDD": 2.0}, PLOT=False)
+
+    assert result.df_impedance["Port"].tolist() == ["U2_VDD_P1", "VRM_U1_VDD"]
+    assert result.df_impedance["Pass/Fail"].tolist() == ["Fail", "Pass"]
+    assert result.df_impedance["|Z| (mOhm)"].tolist() == pytest.approx([3000, 1000])
+    assert (tmp_path / "out" / "board_PSI_Result.xlsx").exists()
+
+
+def test_safe_file_name():
+    assert postsim._safe_file_name("VDD/1V8") == "VDD_1V8"
+    assert postsim._safe_file_name('A\\B:C*D?"E<F>G|H') == "A_B_C_D__E_F_G_H"
+    assert postsim._safe_file_name("CON") == "_CON"
+    assert postsim._safe_file_name("com1.x") == "_com1.x"
+    assert postsim._safe_file_name("VDD. ") == "VDD"
+
+
+def test_excel_backend():
+    assert postsim._excel_backend("auto") == "openpyxl"
+    assert postsim._excel_backend("xlwings") == "xlwings"
+    with pytest.raises(ValueError, match="EXCEL_BACKEND"):
+        postsim._excel_backend("csv")
@@ -0,0 +1,198 @@
+import re
+import logging
+from pathlib import Path
+from typing import NamedTuple
+import numpy as np
+
+logger = logging.getLogger()
+
+# 한 번에 숫자로 변환할 데이터 텍스트 크기
+_PARSE_CHUNK_CHARS = 8 * 1024 * 1024
+
+# 행렬 변환(S/Y -> Z)을 한 번에 처리할 주파수 개수
+_SOLVE_BLOCK_POINTS = 64
+
+_FREQUENCY_UNITS = {"hz": 1.0, "khz": 1e3, "mhz": 1e6, "ghz": 1e9}
+
+# 네트워크 데이터가 끝나는 Touchstone 2.0 키워드
+_DATA_END_KEYWORDS = ("[noise data]", "[end]")
+
+# PowerSI 등이 주석으로 남기는 포트 이름 ("! Port[1] = VRM_U1_VDD", "! Port1 = ...")
+_PORT_NAME_PATTERN = re.compile(r"^!\s*Port\s*\[?\s*(\d+)\s*\]?\s*[=:]\s*(\S+)", re.IGNORECASE)
+
+
+class TouchstoneOptions(NamedTuple):
+    frequency_scale: float
+    parameter: str
+    data_format: str
+    reference: float
+    normalized: bool = True     # Touchstone 1.0의 Y/Z는 R로 정규화된 값
+    port_references: tuple = () # Touchstone 2.0 [Reference] (포트별 기준 임피던스, 없으면 reference)
+
+
+def _parse_option_line(line):
+    # "# GHz S MA R 50" (생략된 항목은 Touchstone 기본값)
+    tokens = line[1:].lower().split()
+    frequency_scale, parameter, data_format, reference = 1e9, "s", "ma", 50.0
+    i = 0
+    while i < len(tokens):
+        token = tokens[i]
+        if token in _FREQUENCY_UNITS:
+            frequency_scale = _FREQUENCY_UNITS[token]
+        elif token in ("s", "y", "z", "g", "h"):
+            parameter = token
+        elif token in ("ma", "db", "ri"):
+            data_format = token
+        elif token == "r" and i + 1 < len(tokens):
+            reference = float(tokens[i + 1])
+            i += 1
+        i += 1
+    if parameter not in ("s", "y", "z"):
+        raise ValueError(f"지원하지 않는 Touchstone 파라미터입니다 : {parameter.upper()}")
+    return TouchstoneOptions(frequency_scale, parameter, data_format, reference)
+
+
+def _to_complex(pairs, data_format):
+    # pairs : (..., 2) -> complex
+    a, b = pairs[..., 0], pairs[..., 1]
+    if data_format == "ri":
+        return a + 1j * b
+    magnitude = 10 ** (a / 20) if data_format == "db" else a
+    return magnitude * np.exp(1j * np.deg2rad(b))
+
+
+def _parse_values(lines):
+    # 숫자가 아닌 값이 있으면 해당 줄을 알려줌
+    try:
+        return np.array(" ".join(lines).split(), dtype=float)
+    except ValueError:
+        for line in lines:
+            try:
+                np.array(line.split(), dtype=float)
+            except ValueError:
+                raise ValueError(f"Touchstone 데이터에 숫자가 아닌 값이 있습니다 : {line}") from None
+        raise
+
+
+def _iter_data_rows(f, values_per_point):
+    """
+    주석/키워드를 제외한 숫자 데이터를 청크 단위로 변환해 (주파수 개수, values_per_point) 배열로 내보냅니다.
+    [Noise Data] 또는 [End]에서 읽기를 멈춥니다.
+    """
+    remainder = np.empty(0)
+    lines = []
+    chars = 0
+
+    def _flush():
+        nonlocal remainder
+        values = _parse_values(lines)
+        if remainder.size:
+            values = np.concatenate([remainder, values])
+        points = values.size // values_per_point
+        remainder = values[points * values_per_point:]
+        return values[:points * values_per_point].reshape(points, values_per_point)
+
+    for line in f:
+        line = line.split("!", 1)[0].strip()
+        if line.lower().startswith(_DATA_END_KEYWORDS):
+            break
+        if not line or line.startswith("["):
+            continue
+        lines.append(line)
+        chars += len(line)
+        if chars >= _PARSE_CHUNK_CHARS:
+            yield _flush()
+            lines = []
+            chars = 0
+    if lines:
+        yield _flush()
+    if remainder.size:
+        raise ValueError(f"Touchstone 데이터 개수가 맞지 않습니다 (남은 값 {remainder.size}개)")
+
+
+def _read_header(f, n_ports=None):
+    # 옵션 줄 / 포트 수 / 기준 임피던스 / 포트 이름 주석을 읽고 데이터 시작 위치로 되돌림
+    options = None
+    version2 = False
+    port_names = dict()
+    references = None
+    position = f.tell()
+    while True:
+        line = f.readline()
+        if not line:
+            break
+        stripped = line.strip()
+        match = _PORT_NAME_PATTERN.match(stripped)
+        if match:
+            port_names[int(match.group(1))] = match.group(2)
+        elif references is not None and len(references) < (n_ports or 0) and stripped and not stripped.startswith(("!", "[", "#")):
+            # [Reference] 값이 다음 줄로 이어지는 경우
+            references.extend(float(value) for value in stripped.split("!", 1)[0].split())
+        elif stripped.startswith("#"):
+            options = _parse_option_line(stripped)
+        elif stripped.lower().startswith("[version]"):
+            version2 = stripped.split("]", 1)[1].strip().startswith("2")
+        elif stripped.lower().startswith("[number of ports]"):
+            n_ports = int(stripped.split("]", 1)[1])
+        elif stripped.lower().startswith("[reference]"):
+            references = [float(value) for value in stripped.split("]", 1)[1].split("!", 1)[0].split()]
+        elif stripped.lower().startswith("[matrix format]") and stripped.split("]", 1)[1].strip().lower() != "full":
+            raise ValueError("Touchstone 2.0 Full 행렬 형식만 지원합니다.")
+        elif stripped and not stripped.startswith(("!", "[")):
+            break
+        position = f.tell()
+    f.seek(position)
+    if options is None:
+        options = _parse_option_line("#")
+    if references is not None and len(references) != n_ports:
+        raise ValueError(f"[Reference] 값 개수({len(references)})가 포트 수({n_ports})와 다릅니다.")
+    return options._replace(normalized=not version2, port_references=tuple(references or ())), n_ports, port_names
+
+
+def read_self_impedance(touchstone_file_path, n_ports=None):
+    """
+    Touchstone 파일(.sNp, S/Y/Z, MA/DB/RI)을 한 번 순차로 읽어 각 포트의 자기 임피던스 Zii(f)를 반환합니다.
+    반환값 : (frequencies (F,), z_self (F, N) complex, port_names [N])
+    Z 파라미터는 대각 성분만 꺼내고, S/Y 파라미터는 주파수 블록 단위로 행렬 변환 후 대각 성분만 남깁니다.
+    """
+    touchstone_file_path = Path(touchstone_file_path)
+    if n_ports is None:
+        match = re.fullmatch(r"\.[syz](\d+)p", touchstone_file_path.suffix.lower())
+        n_ports = int(match.group(1)) if match else None
+
+    with open(touchstone_file_path, "r", encoding="utf-8", errors="replace") as f:
+        options, n_ports, port_names = _read_header(f, n_ports)
+        if n_ports is None:
+            raise ValueError(f"포트 수를 알 수 없습니다 : {touchstone_file_path}")
+
+        diagonal = np.arange(n_ports) * (n_ports + 1)
+        identity = np.eye(n_ports)
+        # S -> Z 기준 임피던스 (포트별 [Reference]가 있으면 Zii = Ri * [(I + S)(I - S)^-1]ii)
+        reference = np.array(options.port_references) if options.port_references else np.full(n_ports, options.reference)
+        scale = options.reference if options.normalized else 1.0
+        frequencies = []
+        z_self = []
+        for rows in _iter_data_rows(f, 1 + 2 * n_ports * n_ports):
+            frequencies.append(rows[:, 0] * options.frequency_scale)
+            pairs = rows[:, 1:].reshape(len(rows), n_ports * n_ports, 2)
+            if options.parameter == "z":
+                z_self.append(_to_complex(pairs[:, diagonal], options.data_format) * scale)
+                continue
+
+            for start in range(0, len(rows), _SOLVE_BLOCK_POINTS):
+                matrix = _to_complex(pairs[start:start + _SOLVE_BLOCK_POINTS], options.data_format)
+                matrix = matrix.reshape(-1, n_ports, n_ports)
+                if options.parameter == "s":
+                    # Z = R (I + S)(I - S)^-1  ->  Z^T = R (I - S)^-T (I + S)^T
+                    z = np.linalg.solve(np.swapaxes(identity - matrix, 1, 2), np.swapaxes(identity + matrix, 1, 2))
+                    z_self.append(np.diagonal(z, axis1=1, axis2=2) * reference)
+                else:
+                    # Z = Y^-1 (1.0은 정규화된 Y이므로 R을 곱함)
+                    z = np.linalg.inv(matrix)
+                    z_self.append(np.diagonal(z, axis1=1, axis2=2) * scale)
+
+    frequencies = np.concatenate(frequencies) if frequencies else np.empty(0)
+    z_self = np.concatenate(z_self) if z_self else np.empty((0, n_ports), dtype=complex)
+    names = [port_names.get(i + 1, f"Port{i + 1}") for i in range(n_ports)]
+    logger.info(f"Touchstone 읽기 : 포트 {n_ports}개, 주파수 {len(frequencies)}개 ({options.parameter.upper()}, {options.data_format.upper()})")
+    return frequencies, z_self, names